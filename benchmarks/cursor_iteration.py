@@ -0,0 +1,62 @@
+"""
+Measure the per-item cost of iterating a Helix `APICursor` for different page
+sizes. With a deque the cost stays flat, with `list.pop(0)` it grew with the
+size of the page.
+
+Usage:
+
+    python benchmarks/cursor_iteration.py
+"""
+import time
+
+from twitch.helix.base import APICursor
+
+
+class _Item(object):
+    @classmethod
+    def construct_from(cls, values):
+        return values
+
+
+class _InMemoryCursor(APICursor):
+    def __init__(self, page_size, page_count):
+        self._page_size = page_size
+        self._pages_left = page_count
+        super(_InMemoryCursor, self).__init__(
+            client_id="client id", path="streams", resource=_Item, params={}
+        )
+
+    def _request_get(self, path, params=None):
+        self._pages_left -= 1
+        return {
+            "data": [{"id": x} for x in range(self._page_size)],
+            "pagination": {"cursor": "next" if self._pages_left else None},
+        }
+
+
+def _per_item_time(page_size, page_count):
+    # Only time the consumption of items that are already in the queue
+    cursor = _InMemoryCursor(page_size, page_count)
+    elapsed = 0
+    for page in range(page_count):
+        if page:
+            cursor.next_page()
+        start = time.perf_counter()
+        while cursor._queue:
+            next(cursor)
+        elapsed += time.perf_counter() - start
+    return elapsed / (page_size * page_count)
+
+
+def main():
+    for page_size, page_count in ((100, 1000), (1000, 100), (100000, 1)):
+        best = min(_per_item_time(page_size, page_count) for _ in range(3))
+        print(
+            "    {:>6} items per page  {:>8.3f} us per item".format(
+                page_size, best * 10**6
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare timestamp parsing with `strptime` and `twitch.resources.parse_datetime`
+on a page of 100 Helix follows.
+
+Usage:
+
+    python benchmarks/datetime_parsing.py
+"""
+import timeit
+from datetime import datetime
+
+from twitch.resources import Follow, parse_datetime
+
+
+def _follows_page():
+    return [
+        {
+            "from_id": str(171003792 + index),
+            "from_login": "iiisutha067iii",
+            "from_name": "IIIsutha067III",
+            "to_id": "23161357",
+            "to_login": "lirik",
+            "to_name": "LIRIK",
+            "followed_at": "2017-08-{:02d}T22:{:02d}:24Z".format(
+                index % 28 + 1, index % 60
+            ),
+        }
+        for index in range(100)
+    ]
+
+
+def _strptime(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _report(name, seconds, baseline):
+    print(
+        "    {:<24} {:>8.1f} us  {:>5.2f}x".format(
+            name, seconds * 10**6, baseline / seconds
+        )
+    )
+
+
+def _best(fn, number=200):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def main():
+    page = _follows_page()
+    timestamps = [follow["followed_at"] for follow in page]
+
+    print("Parsing 100 timestamps")
+    strptime = _best(lambda: [_strptime(value) for value in timestamps])
+    _report("strptime", strptime, strptime)
+    _report(
+        "parse_datetime",
+        _best(lambda: [parse_datetime(value) for value in timestamps]),
+        strptime,
+    )
+
+    print("Constructing 100 follows")
+    construct = _best(lambda: [Follow.construct_from(follow) for follow in page])
+    _report("construct_from", construct, construct)
+    _report(
+        "parse_datetimes=False",
+        _best(
+            lambda: [
+                Follow.construct_from(follow, parse_datetimes=False) for follow in page
+            ]
+        ),
+        construct,
+    )
+
+
+if __name__ == "__main__":
+    main()
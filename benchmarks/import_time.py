@@ -0,0 +1,47 @@
+"""
+Report how long `import twitch` and importing the client classes take, using
+`python -X importtime` in a fresh interpreter for every statement.
+
+Usage:
+
+    python benchmarks/import_time.py
+"""
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import twitch",
+    "from twitch import TwitchHelix",
+    "from twitch import TwitchClient",
+)
+
+
+def _cumulative_import_time(statement):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+    # Lines look like `import time:  self [us] | cumulative | imported package`.
+    # Only count the twitch modules at the top level of the tree, which include the
+    # time of everything they import.
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        if name.strip().startswith("twitch") and not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total
+
+
+def main():
+    for statement in STATEMENTS:
+        best = min(_cumulative_import_time(statement) for _ in range(5))
+        print("    {:<36} {:>8.1f} ms".format(statement, best / 1000))
+
+
+if __name__ == "__main__":
+    main()
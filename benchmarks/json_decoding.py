@@ -0,0 +1,112 @@
+"""
+Compare the JSON decoders supported by `twitch.decoders`.
+
+Usage:
+
+    python benchmarks/json_decoding.py [recorded_response.json ...]
+
+Recorded responses, e.g. saved with `curl`, are benchmarked if given, otherwise
+payloads shaped like the largest Twitch responses are generated.
+"""
+import json
+import sys
+import timeit
+
+from twitch.decoders import DECODERS
+
+
+def _emoticons(count):
+    return {
+        "emoticons": [
+            {
+                "id": index,
+                "regex": "emote{}".format(index),
+                "images": [
+                    {
+                        "emoticon_set": index // 10,
+                        "height": 28,
+                        "width": 28,
+                        "url": "https://static-cdn.jtvnw.net/emoticons/v1/{}/1.0".format(
+                            index
+                        ),
+                    }
+                ],
+            }
+            for index in range(count)
+        ]
+    }
+
+
+def _streams(count):
+    return {
+        "_total": 20000,
+        "streams": [
+            {
+                "_id": 23932774784 + index,
+                "game": "BATMAN - The Telltale Series",
+                "viewers": 7254 - index,
+                "video_height": 720,
+                "average_fps": 60,
+                "delay": 0,
+                "created_at": "2016-12-14T22:49:56Z",
+                "is_playlist": False,
+                "preview": {
+                    "small": "https://static-cdn.jtvnw.net/previews-ttv/small.jpg",
+                    "medium": "https://static-cdn.jtvnw.net/previews-ttv/medium.jpg",
+                    "large": "https://static-cdn.jtvnw.net/previews-ttv/large.jpg",
+                },
+                "channel": {
+                    "_id": 12826 + index,
+                    "display_name": "Twitch",
+                    "name": "twitch{}".format(index),
+                    "status": "Twitch Plays BATMAN - Episode 1",
+                    "language": "en",
+                    "followers": 530641,
+                    "views": 193390873,
+                    "mature": False,
+                    "partner": True,
+                    "created_at": "2007-05-22T10:39:54Z",
+                    "updated_at": "2016-12-14T23:52:04Z",
+                    "url": "https://www.twitch.tv/twitch",
+                },
+            }
+            for index in range(count)
+        ],
+    }
+
+
+def generated_payloads():
+    return {
+        "chat/emoticons (50000 emoticons)": json.dumps(_emoticons(50000)).encode(),
+        "streams (100 streams)": json.dumps(_streams(100)).encode(),
+    }
+
+
+def recorded_payloads(paths):
+    payloads = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            payloads[path] = f.read()
+    return payloads
+
+
+def main(paths):
+    payloads = recorded_payloads(paths) if paths else generated_payloads()
+    for name, content in payloads.items():
+        print("{} ({:.1f} KiB)".format(name, len(content) / 1024))
+        results = {}
+        for decoder_name, decode in DECODERS.items():
+            number = max(1, int(2 * 10**6 / len(content)))
+            best = min(timeit.repeat(lambda: decode(content), number=number, repeat=5))
+            results[decoder_name] = best / number
+        baseline = results["json"]
+        for decoder_name, seconds in sorted(results.items(), key=lambda x: x[1]):
+            print(
+                "    {:<8} {:>10.3f} ms  {:>5.2f}x".format(
+                    decoder_name, seconds * 1000, baseline / seconds
+                )
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,70 @@
+"""
+Compare the memory used by `TwitchObject` and compact Helix resources.
+
+Usage:
+
+    python benchmarks/resource_memory.py [count]
+"""
+import sys
+import tracemalloc
+
+from twitch import resources
+from twitch.helix import compact
+
+
+def _stream(index):
+    return {
+        "id": str(26007494656 + index),
+        "user_id": str(23161357 + index),
+        "user_login": "lirik",
+        "user_name": "LIRIK",
+        "game_id": "417752",
+        "game_name": "Talk Shows & Podcasts",
+        "type": "live",
+        "title": "Hey Guys, It's Monday - Twitter: @Lirik",
+        "viewer_count": 32575,
+        "started_at": "2017-08-14T16:08:32Z",
+        "language": "en",
+        "thumbnail_url": "https://static-cdn.jtvnw.net/previews-ttv/live_user_lirik.jpg",
+        "tag_ids": ["6ea6bca4-4712-4ab9-a906-e3336a9d8039"],
+        "is_mature": False,
+    }
+
+
+def _follow(index):
+    return {
+        "from_id": str(171003792 + index),
+        "from_login": "iiisutha067iii",
+        "from_name": "IIIsutha067III",
+        "to_id": "23161357",
+        "to_login": "lirik",
+        "to_name": "LIRIK",
+        "followed_at": "2017-08-22T22:55:24Z",
+    }
+
+
+def measure(resource, payloads):
+    tracemalloc.start()
+    objects = [resource.construct_from(payload) for payload in payloads]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main(count):
+    for name, make_payload in (("Stream", _stream), ("Follow", _follow)):
+        payloads = [make_payload(index) for index in range(count)]
+        default = measure(getattr(resources, name), payloads)
+        compacted = measure(getattr(compact, name), payloads)
+        print("{} x {}".format(name, count))
+        print("    TwitchObject  {:>8.1f} MiB".format(default / 2**20))
+        print(
+            "    compact       {:>8.1f} MiB  {:.0%} smaller".format(
+                compacted / 2**20, 1 - compacted / default
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
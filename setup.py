@@ -39,6 +39,7 @@ test_requirements = [
     "codecov>=2.1.10",
     "flake8-isort>=4.0.0",
     "flake8>=3.8.4",
+    "httpx>=0.18.0",
     "isort>=5.6.4",
     "pytest-cov>=2.10.1",
     "pytest>=6.1.2",
@@ -47,8 +48,16 @@ test_requirements = [
 
 doc_reqs = ["Sphinx==3.3.1", "sphinx_rtd_theme==0.5.0"]
 
+async_reqs = ["httpx>=0.18.0"]
+
+json_reqs = ["orjson>=3.4.0"]
+columnar_reqs = ["numpy>=1.17", "pyarrow>=3.0.0", "pandas>=1.0.0"]
+
 extras_require = {
+    "async": async_reqs,
+    "columnar": columnar_reqs,
     "doc": doc_reqs,
+    "json": json_reqs,
     "test": test_requirements,
 }
 
@@ -1,11 +1,16 @@
+import io
 import json
 import os
+import time
 
 import pytest
 import responses
 from requests import exceptions
 
 from twitch.api.base import BASE_URL, TwitchAPI
+from twitch.cache import MemoryCache
+from twitch.exceptions import TwitchException
+from twitch.retry import RetryPolicy
 
 dummy_data = {"spongebob": "squarepants"}
 
@@ -102,6 +107,75 @@ def test_request_get_raises_exception_if_not_200_response(status, monkeypatch):
         api._request_get("")
 
 
+@responses.activate
+def test_request_get_retries_server_errors():
+    responses.add(responses.GET, BASE_URL, status=503)
+    responses.add(
+        responses.GET,
+        BASE_URL,
+        body=json.dumps(dummy_data),
+        status=200,
+        content_type="application/json",
+    )
+
+    api = TwitchAPI(client_id="client", retry_policy=RetryPolicy(initial_backoff=0))
+    response = api._request_get("")
+
+    assert len(responses.calls) == 2
+    assert response == dummy_data
+
+
+@responses.activate
+def test_request_post_is_not_retried_by_default():
+    responses.add(responses.POST, BASE_URL, status=503)
+
+    api = TwitchAPI(client_id="client", retry_policy=RetryPolicy(initial_backoff=0))
+
+    with pytest.raises(exceptions.HTTPError):
+        api._request_post("", dummy_data)
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_request_get_returns_cached_response():
+    responses.add(
+        responses.GET,
+        BASE_URL,
+        body=json.dumps(dummy_data),
+        status=200,
+        content_type="application/json",
+    )
+
+    api = TwitchAPI(client_id="client", cache=MemoryCache())
+    api._request_get("")
+    response = api._request_get("")
+
+    assert len(responses.calls) == 1
+    assert response == dummy_data
+
+
+@responses.activate
+def test_request_get_revalidates_stale_cached_response():
+    responses.add(
+        responses.GET,
+        BASE_URL,
+        body=json.dumps(dummy_data),
+        status=200,
+        content_type="application/json",
+        headers={"ETag": '"v1"'},
+    )
+    responses.add(responses.GET, BASE_URL, status=304)
+
+    api = TwitchAPI(client_id="client", cache=MemoryCache(ttl=0.01))
+    api._request_get("")
+    time.sleep(0.02)
+    response = api._request_get("")
+
+    assert len(responses.calls) == 2
+    assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert response == dummy_data
+
+
 @responses.activate
 def test_request_put_returns_dictionary_if_successful():
     responses.add(
@@ -276,3 +350,71 @@ def test_base_reads_backoff_config_from_file(monkeypatch):
     assert isinstance(base._max_retries, int)
     assert base._initial_backoff == 0.01
     assert base._max_retries == 1
+
+
+def test_base_builds_retry_policy_from_backoff_config(monkeypatch):
+    def mockreturn(path):
+        return "tests/api/dummy_credentials.cfg"
+
+    monkeypatch.setattr(os.path, "expanduser", mockreturn)
+
+    base = TwitchAPI(client_id="client")
+
+    assert base._retry_policy.max_attempts == 2
+    assert base._retry_policy.initial_backoff == 0.01
+
+
+@responses.activate
+def test_request_stream_yields_body_in_chunks():
+    body = b"0123456789" * 10
+    responses.add(responses.GET, "{}file".format(BASE_URL), body=body, status=200)
+
+    api = TwitchAPI(client_id="client")
+    chunks = list(api._request_stream("file", chunk_size=30))
+
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert b"".join(chunks) == body
+
+
+@responses.activate
+def test_request_into_writes_body_to_file():
+    body = b"0123456789" * 10
+    responses.add(responses.GET, "{}file".format(BASE_URL), body=body, status=200)
+    output = io.BytesIO()
+
+    api = TwitchAPI(client_id="client")
+
+    assert api._request_into("file", output, chunk_size=7) == len(body)
+    assert output.getvalue() == body
+
+
+@responses.activate
+def test_request_into_reads_body_into_buffer():
+    body = b"0123456789" * 10
+    responses.add(responses.GET, "{}file".format(BASE_URL), body=body, status=200)
+    buffer = bytearray(150)
+
+    api = TwitchAPI(client_id="client")
+
+    assert api._request_into("file", buffer) == len(body)
+    assert buffer[: len(body)] == body
+
+
+@responses.activate
+def test_request_into_raises_if_body_is_larger_than_buffer():
+    responses.add(responses.GET, "{}file".format(BASE_URL), body=b"0" * 11, status=200)
+
+    api = TwitchAPI(client_id="client")
+
+    with pytest.raises(TwitchException):
+        api._request_into("file", bytearray(10))
+
+
+@responses.activate
+def test_request_stream_raises_exception_if_not_200_response():
+    responses.add(responses.GET, "{}file".format(BASE_URL), status=404)
+
+    api = TwitchAPI(client_id="client")
+
+    with pytest.raises(exceptions.HTTPError):
+        api._request_into("file", io.BytesIO())
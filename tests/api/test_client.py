@@ -1,8 +1,13 @@
+import json
 import os
 
 import pytest
+import responses
 
 from twitch import TwitchClient
+from twitch.constants import BASE_URL
+from twitch.resources import Channel
+from twitch.session import create_session
 
 
 @pytest.mark.parametrize(
@@ -38,3 +43,63 @@ def test_client_reads_credentials_from_file(monkeypatch):
     c = TwitchClient()
     assert c._client_id == "spongebob"
     assert c._oauth_token == "squarepants"
+
+
+def test_client_shares_session_with_resources():
+    session = create_session()
+    c = TwitchClient(client_id="client", session=session)
+
+    assert c.channels._session is session
+    assert c.users._session is session
+    assert c.videos._session is session
+
+
+@responses.activate
+def test_lazy_client_converts_nested_objects_on_access():
+    responses.add(
+        responses.GET,
+        "{}streams/1234".format(BASE_URL),
+        body=json.dumps({"stream": {"_id": 1, "channel": {"_id": 1234}}}),
+        status=200,
+        content_type="application/json",
+    )
+
+    client = TwitchClient("client id", lazy=True)
+    stream = client.streams.get_stream_by_user(1234)
+
+    assert isinstance(dict.__getitem__(stream, "channel"), dict)
+    assert isinstance(stream.channel, Channel)
+
+
+@responses.activate
+def test_client_keeps_datetimes_as_strings_without_parse_datetimes():
+    responses.add(
+        responses.GET,
+        "{}streams/1234".format(BASE_URL),
+        body=json.dumps({"stream": {"_id": 1, "created_at": "2016-11-29T15:52:27Z"}}),
+        status=200,
+        content_type="application/json",
+    )
+
+    client = TwitchClient("client id", parse_datetimes=False)
+    stream = client.streams.get_stream_by_user(1234)
+
+    assert stream.created_at == "2016-11-29T15:52:27Z"
+
+
+@responses.activate
+def test_raw_client_returns_decoded_payloads():
+    payload = {"_total": 1, "streams": [{"_id": 1, "channel": {"_id": 1234}}]}
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_URL),
+        body=json.dumps(payload),
+        status=200,
+        content_type="application/json",
+    )
+
+    client = TwitchClient("client id", raw=True)
+    streams = client.streams.get_live_streams()
+
+    assert type(streams[0]) is dict
+    assert streams == payload["streams"]
@@ -0,0 +1,153 @@
+import json
+import threading
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from twitch.api.base import TwitchAPI
+from twitch.api.pagination import OffsetPaginator
+from twitch.client import TwitchClient
+from twitch.constants import BASE_URL
+from twitch.exceptions import TwitchAttributeException
+from twitch.resources import Channel, Follow, Stream, Team, TopGame
+
+
+def make_page_callback(items_key, total, make_item=lambda index: {"_id": index}):
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        offset = int(query["offset"][0])
+        limit = int(query["limit"][0])
+        items = [
+            make_item(index) for index in range(offset, min(offset + limit, total))
+        ]
+        return (200, {}, json.dumps({"_total": total, items_key: items}))
+
+    return callback
+
+
+def add_paginated_endpoint(path, items_key, total, **kwargs):
+    responses.add_callback(
+        responses.GET,
+        "{}{}".format(BASE_URL, path),
+        callback=make_page_callback(items_key, total, **kwargs),
+        content_type="application/json",
+    )
+
+
+@responses.activate
+def test_offset_paginator_fetches_every_page_in_order():
+    add_paginated_endpoint("teams", "teams", 1050)
+    api = TwitchAPI("client id")
+
+    paginator = OffsetPaginator(api, "teams", Team, "teams", workers=4)
+    teams = list(paginator)
+
+    assert len(responses.calls) == 11
+    assert [team.id for team in teams] == list(range(1050))
+    assert all(isinstance(team, Team) for team in teams)
+    assert paginator.total == 1050
+    offsets = sorted(
+        int(parse_qs(urlparse(call.request.url).query)["offset"][0])
+        for call in responses.calls
+    )
+    assert offsets == list(range(0, 1050, 100))
+
+
+@responses.activate
+def test_offset_paginator_yields_every_item_when_unordered():
+    add_paginated_endpoint("teams", "teams", 530)
+    api = TwitchAPI("client id")
+
+    teams = list(OffsetPaginator(api, "teams", Team, "teams", ordered=False))
+
+    assert sorted(team.id for team in teams) == list(range(530))
+
+
+@responses.activate
+def test_offset_paginator_passes_params_and_limit():
+    add_paginated_endpoint("search/channels", "channels", 30)
+    api = TwitchAPI("client id")
+
+    channels = list(
+        OffsetPaginator(
+            api,
+            "search/channels",
+            Channel,
+            "channels",
+            params={"query": "spongebob"},
+            limit=10,
+        )
+    )
+
+    assert len(channels) == 30
+    assert len(responses.calls) == 3
+    query = parse_qs(urlparse(responses.calls[0].request.url).query)
+    assert query["query"] == ["spongebob"]
+    assert query["limit"] == ["10"]
+
+
+@responses.activate
+def test_offset_paginator_handles_empty_results():
+    responses.add(
+        responses.GET,
+        "{}search/channels".format(BASE_URL),
+        body=json.dumps({"_total": 0, "channels": None}),
+        status=200,
+        content_type="application/json",
+    )
+    api = TwitchAPI("client id")
+
+    channels = list(OffsetPaginator(api, "search/channels", Channel, "channels"))
+
+    assert channels == []
+    assert len(responses.calls) == 1
+
+
+def test_offset_paginator_bounds_the_pages_in_flight():
+    in_flight = []
+    lock = threading.Lock()
+    active = [0]
+
+    class FakeAPI(TwitchAPI):
+        def _request_get(self, path, params=None):
+            with lock:
+                active[0] += 1
+                in_flight.append(active[0])
+            offset = params["offset"]
+            items = [{"_id": x} for x in range(offset, offset + params["limit"])]
+            with lock:
+                active[0] -= 1
+            return {"_total": 2000, "teams": items}
+
+    paginator = OffsetPaginator(FakeAPI("client id"), "teams", Team, "teams", workers=3)
+    first_page = [team.id for _, team in zip(range(150), paginator)]
+
+    assert first_page == list(range(150))
+    assert max(in_flight) <= 3
+
+
+@pytest.mark.parametrize("param,value", [("limit", 101), ("workers", 0)])
+def test_offset_paginator_raises_if_wrong_params_are_passed_in(param, value):
+    with pytest.raises(TwitchAttributeException):
+        OffsetPaginator(
+            TwitchAPI("client id"), "teams", Team, "teams", **{param: value}
+        )
+
+
+@responses.activate
+def test_iter_methods_of_list_endpoints():
+    add_paginated_endpoint("channels/1234/follows", "follows", 150)
+    add_paginated_endpoint("games/top", "top", 120)
+    add_paginated_endpoint("streams", "streams", 101)
+    client = TwitchClient("client id")
+
+    follows = list(client.channels.iter_followers(1234))
+    top_games = list(client.games.iter_top(workers=2))
+    streams = list(client.streams.iter_live_streams(game="PUBG"))
+
+    assert len(follows) == 150 and isinstance(follows[0], Follow)
+    assert len(top_games) == 120 and isinstance(top_games[0], TopGame)
+    assert len(streams) == 101 and isinstance(streams[0], Stream)
+    query = parse_qs(urlparse(responses.calls[-1].request.url).query)
+    assert query["game"] == ["PUBG"]
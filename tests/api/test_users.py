@@ -1,4 +1,5 @@
 import json
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 import responses
@@ -195,6 +196,68 @@ def test_get_all_follows():
     assert follow.channel.name == example_channel["name"]
 
 
+@responses.activate
+def test_iter_all_follows_yields_follows_before_fetching_next_page():
+    user_id = 1234
+    response_with_offset = {"_total": 27, "_offset": 1234, "follows": [example_follow]}
+    response_without_offset = {"_total": 27, "follows": [example_follow]}
+    for body in (response_with_offset, response_without_offset):
+        responses.add(
+            responses.GET,
+            "{}users/{}/follows/channels".format(BASE_URL, user_id),
+            body=json.dumps(body),
+            status=200,
+            content_type="application/json",
+        )
+
+    client = TwitchClient("client id")
+
+    follows = client.users.iter_all_follows(user_id)
+
+    assert len(responses.calls) == 0
+    assert isinstance(next(follows), Follow)
+    assert len(responses.calls) == 1
+    assert len(list(follows)) == 1
+    assert len(responses.calls) == 2
+
+
+def follows_page_callback(request):
+    offset = int(parse_qs(urlparse(request.url).query)["offset"][0])
+    follows = [
+        dict(example_follow, notifications=index)
+        for index in range(offset, min(offset + 100, 250))
+    ]
+    return (200, {}, json.dumps({"_total": 250, "follows": follows}))
+
+
+@responses.activate
+def test_iter_all_follows_fetches_pages_concurrently_in_order():
+    user_id = 1234
+    responses.add_callback(
+        responses.GET,
+        "{}users/{}/follows/channels".format(BASE_URL, user_id),
+        callback=follows_page_callback,
+        content_type="application/json",
+    )
+
+    client = TwitchClient("client id")
+
+    follows = list(client.users.iter_all_follows(user_id, workers=4))
+
+    assert len(responses.calls) == 3
+    assert [follow.notifications for follow in follows] == list(range(250))
+    assert all(isinstance(follow, Follow) for follow in follows)
+
+
+@responses.activate
+@pytest.mark.parametrize("param,value", [("direction", "abcd"), ("sort_by", "abcd")])
+def test_iter_all_follows_raises_if_wrong_params_are_passed_in(param, value):
+    client = TwitchClient("client id")
+    kwargs = {param: value}
+    with pytest.raises(TwitchAttributeException):
+        client.users.iter_all_follows("1234", **kwargs)
+
+
 @responses.activate
 @pytest.mark.parametrize("param,value", [("direction", "abcd"), ("sort_by", "abcd")])
 def test_get_all_follows_raises_if_wrong_params_are_passed_in(param, value):
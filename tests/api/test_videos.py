@@ -1,3 +1,4 @@
+import io
 import json
 
 import pytest
@@ -134,3 +135,28 @@ def test_download_vod():
 
     assert len(responses.calls) == 2
     assert vod == b""
+
+
+@responses.activate
+def test_download_vod_streams_into_output():
+    vod_id = "106400740"
+    responses.add(
+        responses.GET,
+        "{}vods/{}/access_token".format("https://api.twitch.tv/api/", vod_id),
+        body=json.dumps(example_download_vod_token_response),
+        status=200,
+        content_type="application/json",
+    )
+    responses.add(
+        responses.GET,
+        "{}vod/{}".format(VOD_FETCH_URL, vod_id),
+        body=b"#EXTM3U\n",
+        status=200,
+        content_type="application/x-mpegURL",
+    )
+    output = io.BytesIO()
+
+    client = TwitchClient("client id")
+
+    assert client.videos.download_vod("v{}".format(vod_id), output) == 8
+    assert output.getvalue() == b"#EXTM3U\n"
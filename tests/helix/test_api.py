@@ -1,14 +1,28 @@
 import json
-from datetime import datetime
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 import responses
+from requests.exceptions import HTTPError
 
 from twitch import TwitchHelix
+from twitch.cache import MemoryCache
 from twitch.constants import BASE_HELIX_URL, BASE_OAUTH_URL
 from twitch.exceptions import TwitchAttributeException, TwitchOAuthException
 from twitch.helix.base import APICursor
-from twitch.resources import Clip, Follow, Game, Stream, StreamMetadata, Video
+from twitch.helix.ratelimit import LocalRateLimiter
+from twitch.resources import (
+    Clip,
+    Follow,
+    Game,
+    Stream,
+    StreamMetadata,
+    User,
+    Video,
+)
+from twitch.retry import RetryPolicy
+from twitch.session import create_session
 
 example_get_streams_response = {
     "data": [
@@ -282,6 +296,113 @@ def test_get_streams_returns_api_cursor():
     assert isinstance(streams, APICursor)
 
 
+@responses.activate
+def test_get_streams_uses_client_session():
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        body=json.dumps(example_get_streams_response),
+        status=200,
+        content_type="application/json",
+    )
+
+    session = create_session()
+    client = TwitchHelix("client id", session=session)
+    streams = client.get_streams()
+
+    assert streams._session is session
+
+
+@responses.activate
+def test_get_streams_updates_client_rate_limiter():
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        body=json.dumps(example_get_streams_response),
+        status=200,
+        content_type="application/json",
+        headers={"Ratelimit-Remaining": "0", "Ratelimit-Reset": "4102444800"},
+    )
+
+    rate_limiter = LocalRateLimiter()
+    client = TwitchHelix("client id", rate_limiter=rate_limiter)
+    client.get_streams()
+
+    assert rate_limiter._state["remaining"] == 0
+    assert rate_limiter._state["reset"] == 4102444800
+
+
+@responses.activate
+def test_get_streams_retries_after_429():
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        status=429,
+        headers={"Ratelimit-Remaining": "0", "Ratelimit-Reset": "0"},
+    )
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        body=json.dumps(example_get_streams_response),
+        status=200,
+        content_type="application/json",
+    )
+
+    client = TwitchHelix(
+        "client id",
+        rate_limiter=LocalRateLimiter(),
+        retry_policy=RetryPolicy(initial_backoff=0),
+    )
+    streams = client.get_streams()
+
+    assert len(responses.calls) == 2
+    assert len(streams) == 1
+
+
+@responses.activate
+def test_get_streams_retries_after_429_with_malformed_rate_limit_headers():
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        status=429,
+        headers={"Ratelimit-Remaining": "none", "Ratelimit-Reset": "1.7e9"},
+    )
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        body=json.dumps(example_get_streams_response),
+        status=200,
+        content_type="application/json",
+    )
+
+    rate_limiter = LocalRateLimiter()
+    client = TwitchHelix(
+        "client id",
+        rate_limiter=rate_limiter,
+        retry_policy=RetryPolicy(initial_backoff=0),
+    )
+    streams = client.get_streams()
+
+    assert len(responses.calls) == 2
+    assert len(streams) == 1
+    assert rate_limiter._state["reset"] is None
+
+
+@responses.activate
+def test_get_streams_gives_up_after_max_attempts():
+    responses.add(responses.GET, "{}streams".format(BASE_HELIX_URL), status=429)
+
+    client = TwitchHelix(
+        "client id",
+        rate_limiter=LocalRateLimiter(),
+        retry_policy=RetryPolicy(max_attempts=3, initial_backoff=0),
+    )
+
+    with pytest.raises(HTTPError):
+        client.get_streams()
+    assert len(responses.calls) == 3
+
+
 @responses.activate
 def test_get_streams_next_returns_stream_object():
     responses.add(
@@ -305,7 +426,7 @@ def test_get_streams_next_returns_stream_object():
     assert stream.id == example_get_streams_response["data"][0]["id"]
     assert stream.game_id == example_get_streams_response["data"][0]["game_id"]
     assert stream.title == example_get_streams_response["data"][0]["title"]
-    assert stream.started_at == datetime(2017, 8, 14, 16, 8, 32)
+    assert stream.started_at == datetime(2017, 8, 14, 16, 8, 32, tzinfo=timezone.utc)
 
 
 @responses.activate
@@ -404,6 +525,26 @@ def test_get_games_returns_list_of_game_objects():
     assert game.name == example_get_games_response["data"][0]["name"]
 
 
+@responses.activate
+def test_get_games_uses_cache():
+    responses.add(
+        responses.GET,
+        "{}games".format(BASE_HELIX_URL),
+        body=json.dumps(example_get_games_response),
+        status=200,
+        content_type="application/json",
+    )
+
+    cache = MemoryCache(ttls={"games": 3600})
+    client = TwitchHelix("client id", cache=cache)
+    client.get_games(game_ids=["493057"])
+    games = client.get_games(game_ids=["493057"])
+
+    assert len(responses.calls) == 1
+    assert games[0].id == "493057"
+    assert cache.stats["hits"] == 1
+
+
 @responses.activate
 def test_get_games_passes_all_params_to_request():
     responses.add(
@@ -453,6 +594,56 @@ def test_get_games_raises_attribute_exception_for_invalid_params(param, value):
     assert len(responses.calls) == 0
 
 
+def users_callback(request):
+    ids = parse_qs(urlparse(request.url).query).get("id", [])
+    data = [{"id": user_id, "login": "user{}".format(user_id)} for user_id in ids]
+    # Pretend that users with ids divisible by 7 don't exist
+    data = [user for user in data if int(user["id"]) % 7]
+    return (200, {}, json.dumps({"data": data}))
+
+
+@responses.activate
+def test_get_users_bulk_splits_ids_into_chunks_and_keeps_order():
+    responses.add_callback(
+        responses.GET,
+        "{}users".format(BASE_HELIX_URL),
+        callback=users_callback,
+        content_type="application/json",
+    )
+    ids = [str(x) for x in range(250, 0, -1)]
+
+    client = TwitchHelix("client id")
+    users = client.get_users(ids=ids, bulk=True)
+
+    assert len(responses.calls) == 3
+    assert [user.id for user in users] == [x for x in ids if int(x) % 7]
+    assert users.missing == [x for x in ids if not int(x) % 7]
+    assert all(isinstance(user, User) for user in users)
+
+
+def test_get_users_raises_attribute_exception_for_too_many_ids_without_bulk():
+    client = TwitchHelix("client id")
+
+    with pytest.raises(TwitchAttributeException):
+        client.get_users(ids=[str(x) for x in range(101)])
+
+
+@pytest.mark.parametrize(
+    "method,kwargs",
+    [
+        ("get_clips", {"broadcaster_id": "23161357"}),
+        ("get_clips", {"game_id": "493057"}),
+        ("get_videos", {"user_id": "23161357"}),
+        ("get_videos", {"game_id": "493057"}),
+    ],
+)
+def test_bulk_raises_attribute_exception_for_paginated_queries(method, kwargs):
+    client = TwitchHelix("client id")
+
+    with pytest.raises(TwitchAttributeException):
+        getattr(client, method)(bulk=True, **kwargs)
+
+
 @responses.activate
 def test_get_clips_returns_list_of_clip_objects_when_clip_ids_are_set():
     responses.add(
@@ -474,7 +665,7 @@ def test_get_clips_returns_list_of_clip_objects_when_clip_ids_are_set():
     assert (
         clip.broadcaster_id == example_get_clips_response["data"][0]["broadcaster_id"]
     )
-    assert clip.created_at == datetime(2017, 11, 30, 22, 34, 18)
+    assert clip.created_at == datetime(2017, 11, 30, 22, 34, 18, tzinfo=timezone.utc)
 
 
 @responses.activate
@@ -532,7 +723,7 @@ def test_get_clips_next_returns_clip_object(param, value):
         clip.broadcaster_id
         == example_get_clips_cursor_response["data"][0]["broadcaster_id"]
     )
-    assert clip.created_at == datetime(2017, 11, 30, 22, 34, 17)
+    assert clip.created_at == datetime(2017, 11, 30, 22, 34, 17, tzinfo=timezone.utc)
 
 
 @responses.activate
@@ -718,7 +909,7 @@ def test_get_videos_returns_list_of_video_objects_when_video_ids_are_set():
     assert isinstance(video, Video)
     assert video.id == example_get_videos_response["data"][0]["id"]
     assert video.title == example_get_videos_response["data"][0]["title"]
-    assert video.created_at == datetime(2018, 3, 2, 20, 53, 41)
+    assert video.created_at == datetime(2018, 3, 2, 20, 53, 41, tzinfo=timezone.utc)
 
 
 @responses.activate
@@ -771,7 +962,7 @@ def test_get_videos_next_returns_video_object(param, value):
     assert isinstance(video, Video)
     assert video.id == example_get_videos_cursor_response["data"][0]["id"]
     assert video.title == example_get_videos_response["data"][0]["title"]
-    assert video.created_at == datetime(2018, 3, 2, 20, 53, 41)
+    assert video.created_at == datetime(2018, 3, 2, 20, 53, 41, tzinfo=timezone.utc)
 
 
 @responses.activate
@@ -1027,7 +1218,7 @@ def test_get_user_follows_next_returns_follow_object():
     assert isinstance(follow, Follow)
     assert follow.from_id == example_get_user_follows_response["data"][0]["from_id"]
     assert follow.to_id == example_get_user_follows_response["data"][0]["to_id"]
-    assert follow.followed_at == datetime(2017, 8, 22, 22, 55, 24)
+    assert follow.followed_at == datetime(2017, 8, 22, 22, 55, 24, tzinfo=timezone.utc)
 
 
 @responses.activate
@@ -1095,3 +1286,67 @@ def test_get_user_follows_raises_attribute_exception_for_invalid_params():
         client.get_user_follows(**kwargs)
 
     assert len(responses.calls) == 0
+
+
+@responses.activate
+def test_lazy_client_converts_datetimes_on_access():
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        body=json.dumps(example_get_streams_response),
+        status=200,
+        content_type="application/json",
+    )
+
+    client = TwitchHelix("client id", lazy=True)
+    stream = client.get_streams()[0]
+
+    started_at = example_get_streams_response["data"][0]["started_at"]
+    assert dict.__getitem__(stream, "started_at") == started_at
+    assert isinstance(stream.started_at, datetime)
+
+
+@responses.activate
+def test_parse_datetimes_only_applies_to_its_client():
+    for _ in range(2):
+        responses.add(
+            responses.GET,
+            "{}streams".format(BASE_HELIX_URL),
+            body=json.dumps(example_get_streams_response),
+            status=200,
+            content_type="application/json",
+        )
+
+    strings = TwitchHelix("client id", parse_datetimes=False).get_streams()[0]
+    parsed = TwitchHelix("client id").get_streams()[0]
+
+    started_at = example_get_streams_response["data"][0]["started_at"]
+    assert strings.started_at == started_at
+    assert isinstance(parsed.started_at, datetime)
+
+
+@responses.activate
+def test_raw_client_returns_decoded_payloads():
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        body=json.dumps(example_get_streams_response),
+        status=200,
+        content_type="application/json",
+    )
+    responses.add(
+        responses.GET,
+        "{}games".format(BASE_HELIX_URL),
+        body=json.dumps(example_get_games_response),
+        status=200,
+        content_type="application/json",
+    )
+
+    client = TwitchHelix("client id", raw=True, compact=True)
+    streams = client.get_streams()
+    games = client.get_games(game_ids=["493057"])
+
+    assert type(streams[0]) is dict
+    assert streams[0] == example_get_streams_response["data"][0]
+    assert type(games[0]) is dict
+    assert games == example_get_games_response["data"]
@@ -0,0 +1,171 @@
+import asyncio
+import json
+
+import pytest
+
+from twitch.columnar import INT, STRING
+from twitch.exceptions import TwitchAttributeException
+from twitch.resources import Game, Stream
+
+httpx = pytest.importorskip("httpx")
+
+from twitch.helix.async_api import AsyncTwitchHelix  # noqa: E402
+from twitch.helix.async_base import AsyncAPICursor  # noqa: E402
+
+example_streams_page = {
+    "data": [
+        {"id": "1", "user_id": "10", "viewer_count": 100},
+        {"id": "2", "user_id": "20", "viewer_count": 50},
+    ],
+    "pagination": {"cursor": "page-2"},
+}
+
+example_last_streams_page = {
+    "data": [{"id": "3", "user_id": "30", "viewer_count": 10}],
+    "pagination": {},
+}
+
+example_games_response = {"data": [{"id": "493057", "name": "PUBG"}]}
+
+
+def run_coroutine(coroutine):
+    # asyncio.run is only available from Python 3.7
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def json_response(status, data=None, headers=None):
+    # Responses built from a stream behave like the ones read from the network
+    body = json.dumps(data).encode() if data is not None else b""
+    return httpx.Response(status, headers=headers, stream=httpx.ByteStream(body))
+
+
+def make_client(handler):
+    session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncTwitchHelix("client id", session=session)
+
+
+def test_get_streams_returns_async_cursor_iterating_all_pages():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.params.get("after") == "page-2":
+            return json_response(200, example_last_streams_page)
+        return json_response(200, example_streams_page)
+
+    async def run():
+        async with make_client(handler) as client:
+            cursor = client.get_streams(page_size=2)
+            assert isinstance(cursor, AsyncAPICursor)
+            return [stream async for stream in cursor]
+
+    streams = run_coroutine(run())
+
+    assert len(requests) == 2
+    assert requests[0].headers["Client-ID"] == "client id"
+    assert [stream.id for stream in streams] == ["1", "2", "3"]
+    assert all(isinstance(stream, Stream) for stream in streams)
+
+
+def test_get_games_is_a_coroutine_returning_games():
+    def handler(request):
+        assert request.url.params.get_list("id") == ["493057"]
+        return json_response(200, example_games_response)
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.get_games(game_ids=["493057"])
+
+    games = run_coroutine(run())
+
+    assert len(games) == 1
+    assert isinstance(games[0], Game)
+    assert games[0].name == "PUBG"
+
+
+def test_request_is_retried_after_429():
+    responses = [
+        json_response(429, headers={"Ratelimit-Remaining": "1"}),
+        json_response(200, example_games_response),
+    ]
+
+    def handler(request):
+        return responses.pop(0)
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.get_games(game_ids=["493057"])
+
+    games = run_coroutine(run())
+
+    assert len(games) == 1
+    assert responses == []
+
+
+def test_parameters_are_validated_like_sync_client():
+    client = make_client(lambda request: json_response(200))
+
+    with pytest.raises(TwitchAttributeException):
+        client.get_streams(page_size=101)
+    with pytest.raises(TwitchAttributeException):
+        client.get_users(ids=[str(x) for x in range(101)])
+
+    run_coroutine(client.aclose())
+
+
+def test_async_cursor_cannot_be_iterated_synchronously():
+    client = make_client(lambda request: json_response(200))
+    cursor = client.get_streams()
+
+    with pytest.raises(TypeError):
+        next(cursor)
+
+    run_coroutine(client.aclose())
+
+
+def test_async_cursor_exports_every_page():
+    np = pytest.importorskip("numpy")
+
+    def handler(request):
+        if request.url.params.get("after") == "page-2":
+            return json_response(200, example_last_streams_page)
+        return json_response(200, example_streams_page)
+
+    async def run():
+        async with make_client(handler) as client:
+            schema = {"id": STRING, "viewer_count": INT}
+            records = await client.get_streams().to_numpy(schema)
+            batches = [
+                batch
+                async for batch in client.get_streams().iter_batches(
+                    schema, batch_size=2, output="numpy"
+                )
+            ]
+            return records, batches
+
+    records, batches = run_coroutine(run())
+
+    assert list(records.id) == ["1", "2", "3"]
+    assert records.viewer_count.dtype == np.int64
+    assert [len(batch) for batch in batches] == [2, 1]
+
+
+def test_get_games_bulk_fetches_chunks_concurrently():
+    def handler(request):
+        ids = request.url.params.get_list("id")
+        return json_response(200, {"data": [{"id": x} for x in ids if x != "7"]})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.get_games(
+                game_ids=[str(x) for x in range(150)], bulk=True
+            )
+
+    games = run_coroutine(run())
+
+    assert len(games) == 149
+    assert games.missing == ["7"]
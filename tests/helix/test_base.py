@@ -0,0 +1,138 @@
+import gc
+import time
+from collections import deque
+
+import pytest
+
+from twitch.helix.base import APICursor
+
+
+class Item(object):
+    @classmethod
+    def construct_from(cls, values):
+        return values
+
+
+class InMemoryCursor(APICursor):
+    """APICursor serving `page_count` pages of `page_size` items without HTTP."""
+
+    def __init__(self, page_size, page_count, prefetch=0, fail_on_page=None):
+        self._pages_left = page_count
+        self._page_size = page_size
+        self._fail_on_page = fail_on_page
+        self.requested_cursors = []
+        super(InMemoryCursor, self).__init__(
+            client_id="client id",
+            path="streams",
+            resource=Item,
+            params={},
+            prefetch=prefetch,
+        )
+
+    def _request_get(self, path, params=None):
+        self.requested_cursors.append(params.get("after"))
+        page = len(self.requested_cursors)
+        if page == self._fail_on_page:
+            raise ValueError("Page {} failed".format(page))
+        self._pages_left -= 1
+        return {
+            "data": [{"id": x} for x in range(self._page_size)],
+            "pagination": {
+                "cursor": "page{}".format(page + 1) if self._pages_left else None
+            },
+        }
+
+
+def test_cursor_iterates_over_all_pages():
+    cursor = InMemoryCursor(page_size=3, page_count=4)
+
+    assert len(cursor) == 3
+    assert cursor[0] == {"id": 0}
+    assert cursor[1:] == [{"id": 1}, {"id": 2}]
+    assert len(list(cursor)) == 12
+
+
+def wait_for(condition):
+    deadline = time.time() + 5
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_cursor_prefetches_following_pages_in_background():
+    cursor = InMemoryCursor(page_size=2, page_count=5, prefetch=2)
+
+    # First page plus two prefetched ones, and the worker is blocked on a full queue
+    assert wait_for(lambda: len(cursor.requested_cursors) == 3)
+    assert cursor.cursor == "page2"
+
+    assert [item["id"] for item in cursor] == [0, 1] * 5
+    assert cursor.requested_cursors == [None, "page2", "page3", "page4", "page5"]
+    assert cursor.cursor is None
+
+
+def test_cursor_prefetch_reraises_errors_in_the_consumer():
+    cursor = InMemoryCursor(page_size=2, page_count=5, prefetch=1, fail_on_page=3)
+
+    items = [next(cursor) for _ in range(4)]
+
+    assert len(items) == 4
+    with pytest.raises(ValueError):
+        next(cursor)
+
+
+def test_cursor_fetches_in_foreground_after_prefetch_error():
+    cursor = InMemoryCursor(page_size=2, page_count=5, prefetch=1, fail_on_page=3)
+    for _ in range(4):
+        next(cursor)
+    with pytest.raises(ValueError):
+        next(cursor)
+
+    # The failed page is requested again and the rest of the pages follow
+    assert [item["id"] for item in cursor] == [0, 1] * 3
+    assert cursor.requested_cursors[2:4] == ["page3", "page3"]
+
+
+def test_closing_cursor_stops_prefetching():
+    with InMemoryCursor(page_size=2, page_count=100, prefetch=1) as cursor:
+        assert wait_for(lambda: len(cursor.requested_cursors) == 2)
+
+    assert cursor._prefetcher is None
+    time.sleep(0.2)
+    assert len(cursor.requested_cursors) <= 3
+
+
+def test_dropped_cursor_stops_prefetching():
+    cursor = InMemoryCursor(page_size=2, page_count=100, prefetch=1)
+    next(cursor)
+    requested = cursor.requested_cursors
+    assert wait_for(lambda: len(requested) == 2)
+    thread = cursor._prefetcher._thread
+
+    del cursor
+    gc.collect()
+
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_next_page_returns_a_list():
+    cursor = InMemoryCursor(page_size=3, page_count=2)
+
+    page = cursor.next_page()
+
+    assert page == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert page[:2] == [{"id": 0}, {"id": 1}]
+    assert cursor.next_page() == page
+
+
+def test_cursor_consumes_items_from_the_front_of_a_deque():
+    # With list.pop(0) every item cost O(page size), a deque pops them in O(1)
+    cursor = InMemoryCursor(page_size=1000, page_count=3)
+
+    for _ in range(3):
+        ids = [next(cursor)["id"] for _ in range(1000)]
+        assert isinstance(cursor._queue, deque)
+        assert ids == list(range(1000))
+    with pytest.raises(StopIteration):
+        next(cursor)
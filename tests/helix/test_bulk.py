@@ -0,0 +1,33 @@
+from twitch.helix.bulk import BulkResult, merge_results, split_params
+from twitch.resources import User
+
+
+def test_split_params_chunks_every_key_and_keeps_other_params():
+    params = {"id": [str(x) for x in range(250)], "login": ["a", "b"], "first": 100}
+
+    chunks = split_params(params, [("id", "id"), ("login", "login")])
+
+    assert [len(chunk.get("id", [])) for chunk in chunks] == [100, 100, 50, 0]
+    assert chunks[3] == {"login": ["a", "b"], "first": 100}
+    assert all(chunk["first"] == 100 for chunk in chunks)
+    assert "login" not in chunks[0]
+
+
+def test_split_params_removes_duplicate_values():
+    chunks = split_params({"id": ["1", "2", "1"]}, [("id", "id")])
+
+    assert chunks == [{"id": ["1", "2"]}]
+
+
+def test_merge_results_keeps_input_order_and_reports_missing():
+    params = {"id": ["3", "1", "2"], "login": ["Spongebob", "patrick"]}
+    pages = [
+        [User.construct_from({"id": "1", "login": "spongebob"})],
+        [User.construct_from({"id": "3", "login": "squidward"})],
+    ]
+
+    result = merge_results(params, [("id", "id"), ("login", "login")], pages)
+
+    assert isinstance(result, BulkResult)
+    assert [user.id for user in result] == ["3", "1", "1"]
+    assert result.missing == ["2", "patrick"]
@@ -0,0 +1,102 @@
+import json
+import pickle
+import sys
+from datetime import datetime, timezone
+
+import pytest
+import responses
+
+from twitch import TwitchHelix
+from twitch.constants import BASE_HELIX_URL
+from twitch.helix import compact
+from twitch.helix.compact import CompactObject
+from twitch.resources import Stream, TwitchObject
+
+example_stream = {
+    "id": "26007494656",
+    "user_id": "23161357",
+    "user_name": "LIRIK",
+    "game_id": "417752",
+    "type": "live",
+    "title": "Hey Guys, It's Monday - Twitter: @Lirik",
+    "viewer_count": 32575,
+    "started_at": "2017-08-14T16:08:32Z",
+    "language": "en",
+    "thumbnail_url": "https://static-cdn.jtvnw.net/previews-ttv/lirik.jpg",
+    "tag_ids": ["6ea6bca4-4712-4ab9-a906-e3336a9d8039"],
+}
+
+
+def test_construct_from_keeps_attribute_and_item_access():
+    stream = compact.Stream.construct_from(example_stream)
+
+    assert stream.id == example_stream["id"]
+    assert stream["viewer_count"] == 32575
+    assert stream.get("game_name") is None
+    assert "game_name" not in stream
+    assert stream.started_at == datetime(2017, 8, 14, 16, 8, 32, tzinfo=timezone.utc)
+    assert dict(stream) == dict(Stream.construct_from(example_stream))
+    assert stream == Stream.construct_from(example_stream)
+
+
+def test_construct_from_keeps_unknown_fields():
+    stream = compact.Stream.construct_from(dict(example_stream, new_field=1))
+
+    assert stream.new_field == 1
+    assert stream["new_field"] == 1
+    assert len(stream) == len(example_stream) + 1
+
+
+def test_missing_fields_raise_attribute_and_key_errors():
+    stream = compact.Stream.construct_from({"id": "1"})
+
+    with pytest.raises(AttributeError):
+        stream.user_id
+    with pytest.raises(KeyError):
+        stream["user_id"]
+
+
+def test_compact_objects_are_read_only():
+    stream = compact.Stream.construct_from(example_stream)
+
+    with pytest.raises(AttributeError):
+        stream.viewer_count = 1
+
+
+def test_compact_objects_can_be_pickled():
+    stream = compact.Stream.construct_from(dict(example_stream, new_field=1))
+
+    assert pickle.loads(pickle.dumps(stream)) == stream
+
+
+def test_compact_objects_are_smaller_than_twitch_objects():
+    stream = compact.Stream.construct_from(example_stream)
+    twitch_stream = Stream.construct_from(example_stream)
+
+    assert not hasattr(stream, "__dict__")
+    assert sys.getsizeof(stream) < sys.getsizeof(twitch_stream) / 2
+
+
+@pytest.mark.parametrize("resource", list(compact.COMPACT_RESOURCES))
+def test_every_helix_resource_has_a_compact_counterpart(resource):
+    compact_resource = compact.COMPACT_RESOURCES[resource]
+
+    assert issubclass(compact_resource, CompactObject)
+    assert compact_resource.__name__ == resource.__name__
+
+
+@responses.activate
+def test_compact_client_returns_compact_resources():
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        body=json.dumps({"data": [example_stream], "pagination": {}}),
+        status=200,
+        content_type="application/json",
+    )
+
+    streams = TwitchHelix("client id", compact=True).get_streams()
+
+    assert isinstance(streams[0], compact.Stream)
+    assert not isinstance(streams[0], TwitchObject)
+    assert streams[0].title == example_stream["title"]
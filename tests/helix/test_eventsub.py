@@ -0,0 +1,296 @@
+import hashlib
+import hmac
+import json
+import threading
+
+import pytest
+import responses
+
+from twitch import TwitchHelix
+from twitch.constants import BASE_HELIX_URL
+from twitch.exceptions import TwitchAttributeException, TwitchAuthException
+from twitch.helix.eventsub import (
+    HEADER_MESSAGE_SIGNATURE,
+    MESSAGE_TYPE_NOTIFICATION,
+    MESSAGE_TYPE_REVOCATION,
+    SUBSCRIPTION_CHANNEL_FOLLOW,
+    SUBSCRIPTION_STREAM_ONLINE,
+    EventSubReceiver,
+    EventSubTestClient,
+    EventSubWebhook,
+    build_message,
+    compute_signature,
+)
+from twitch.resources import Follow, Stream
+
+SECRET = "s3cr3t-s3cr3t"
+
+stream_online_event = {
+    "id": "9001",
+    "broadcaster_user_id": "1337",
+    "broadcaster_user_login": "cool_user",
+    "broadcaster_user_name": "Cool_User",
+    "type": "live",
+    "started_at": "2020-10-11T10:11:12.123Z",
+}
+
+channel_follow_event = {
+    "user_id": "1234",
+    "user_login": "cool_user",
+    "user_name": "Cool_User",
+    "broadcaster_user_id": "1337",
+    "broadcaster_user_login": "cooler_user",
+    "broadcaster_user_name": "Cooler_User",
+    "followed_at": "2020-07-15T18:16:11.17106713Z",
+}
+
+
+def _notification(subscription_type, event, **kwargs):
+    payload = {"subscription": {"type": subscription_type}, "event": event}
+    return build_message(
+        SECRET, MESSAGE_TYPE_NOTIFICATION, subscription_type, payload, **kwargs
+    )
+
+
+@pytest.fixture
+def receiver():
+    with EventSubReceiver(SECRET, port=0, path="/eventsub") as receiver:
+        yield receiver
+
+
+def test_compute_signature_signs_id_timestamp_and_body():
+    signature = compute_signature("secret", "id", "2019-11-16T10:11:12.123Z", b"{}")
+
+    expected = hmac.new(
+        b"secret", b"id2019-11-16T10:11:12.123Z{}", hashlib.sha256
+    ).hexdigest()
+    assert signature == "sha256=" + expected
+
+
+def test_secret_is_required():
+    with pytest.raises(TwitchAttributeException):
+        EventSubWebhook("")
+
+
+def test_notification_is_dispatched_as_stream():
+    webhook = EventSubWebhook(SECRET)
+    received = []
+    webhook.on(SUBSCRIPTION_STREAM_ONLINE, received.append)
+
+    status, _, _ = webhook.handle(
+        *_notification(SUBSCRIPTION_STREAM_ONLINE, stream_online_event)
+    )
+
+    assert status == 204
+    message = received[0]
+    assert message.subscription_type == SUBSCRIPTION_STREAM_ONLINE
+    assert isinstance(message.event, Stream)
+    assert message.event.id == "9001"
+    assert message.event.user_login == "cool_user"
+    assert message.event.started_at.year == 2020
+
+
+def test_follow_notification_is_dispatched_as_follow():
+    webhook = EventSubWebhook(SECRET)
+    received = []
+    webhook.on("*", received.append)
+
+    webhook.handle(*_notification(SUBSCRIPTION_CHANNEL_FOLLOW, channel_follow_event))
+
+    follow = received[0].event
+    assert isinstance(follow, Follow)
+    assert (follow.from_id, follow.to_id) == ("1234", "1337")
+    assert follow.followed_at.microsecond == 171067
+
+
+def test_raw_webhook_dispatches_event_dictionaries():
+    webhook = EventSubWebhook(SECRET, raw=True)
+    received = []
+    webhook.on(SUBSCRIPTION_STREAM_ONLINE, received.append)
+
+    webhook.handle(*_notification(SUBSCRIPTION_STREAM_ONLINE, stream_online_event))
+
+    assert received[0].event == stream_online_event
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {HEADER_MESSAGE_SIGNATURE: "sha256=0"},
+        {HEADER_MESSAGE_SIGNATURE: None},
+    ],
+)
+def test_invalid_signatures_are_rejected(headers):
+    webhook = EventSubWebhook(SECRET)
+    received = []
+    webhook.on("*", received.append)
+    message_headers, body = _notification(
+        SUBSCRIPTION_STREAM_ONLINE, stream_online_event
+    )
+    message_headers.update(headers)
+
+    status, _, _ = webhook.handle(
+        {key: value for key, value in message_headers.items() if value}, body
+    )
+
+    assert status == 403
+    assert received == []
+
+
+def test_tampered_bodies_are_rejected():
+    webhook = EventSubWebhook(SECRET)
+    headers, body = _notification(SUBSCRIPTION_STREAM_ONLINE, stream_online_event)
+
+    assert webhook.handle(headers, body.replace(b"9001", b"9002"))[0] == 403
+
+
+def test_old_messages_are_rejected():
+    webhook = EventSubWebhook(SECRET)
+    headers, body = _notification(
+        SUBSCRIPTION_STREAM_ONLINE,
+        stream_online_event,
+        timestamp="2019-11-16T10:11:12.123Z",
+    )
+
+    assert webhook.handle(headers, body)[0] == 403
+
+
+def test_duplicate_messages_are_dispatched_once():
+    webhook = EventSubWebhook(SECRET, dedupe_size=1)
+    received = []
+    webhook.on(SUBSCRIPTION_STREAM_ONLINE, received.append)
+    first = _notification(
+        SUBSCRIPTION_STREAM_ONLINE, stream_online_event, message_id="1"
+    )
+    second = _notification(
+        SUBSCRIPTION_STREAM_ONLINE, stream_online_event, message_id="2"
+    )
+
+    webhook.handle(*first)
+    webhook.handle(*first)
+    webhook.handle(*second)
+    # Only the last message ID is remembered
+    webhook.handle(*first)
+
+    assert [message.id for message in received] == ["1", "2", "1"]
+
+
+def test_failed_handlers_return_error_so_twitch_retries():
+    webhook = EventSubWebhook(SECRET)
+    calls = []
+
+    @webhook.on(SUBSCRIPTION_STREAM_ONLINE)
+    def handler(message):
+        calls.append(message)
+        if len(calls) == 1:
+            raise ValueError()
+
+    message = _notification(SUBSCRIPTION_STREAM_ONLINE, stream_online_event)
+
+    assert webhook.handle(*message)[0] == 500
+    assert webhook.handle(*message)[0] == 204
+    assert len(calls) == 2
+
+
+def test_concurrent_deliveries_of_a_message_are_dispatched_once():
+    webhook = EventSubWebhook(SECRET)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    @webhook.on(SUBSCRIPTION_STREAM_ONLINE)
+    def handler(message):
+        calls.append(message)
+        started.set()
+        release.wait(5)
+
+    message = _notification(SUBSCRIPTION_STREAM_ONLINE, stream_online_event)
+    statuses = []
+    thread = threading.Thread(target=lambda: statuses.append(webhook.handle(*message)))
+    thread.start()
+    assert started.wait(5)
+
+    # The first delivery is still being handled when Twitch retries it
+    statuses.append(webhook.handle(*message))
+    release.set()
+    thread.join()
+
+    assert [status for status, _, _ in statuses] == [204, 204]
+    assert len(calls) == 1
+
+
+def test_receiver_answers_verification_challenge(receiver):
+    client = EventSubTestClient(receiver.url, SECRET)
+
+    response = client.send_verification(SUBSCRIPTION_STREAM_ONLINE, "pogchamp-kappa")
+
+    assert response.status_code == 200
+    assert response.text == "pogchamp-kappa"
+
+
+def test_receiver_dispatches_notifications_and_revocations(receiver):
+    notifications = []
+    revocations = []
+    receiver.on(SUBSCRIPTION_STREAM_ONLINE, notifications.append)
+    receiver.on_revocation(revocations.append)
+    client = EventSubTestClient(receiver.url, SECRET)
+
+    response = client.send_notification(SUBSCRIPTION_STREAM_ONLINE, stream_online_event)
+    client.send_revocation(SUBSCRIPTION_STREAM_ONLINE)
+
+    assert response.status_code == 204
+    assert notifications[0].event.user_id == "1337"
+    assert revocations[0].type == MESSAGE_TYPE_REVOCATION
+    assert revocations[0].subscription["status"] == "authorization_revoked"
+
+
+def test_receiver_rejects_wrong_secret_and_path(receiver):
+    client = EventSubTestClient(receiver.url, "wrong secret")
+
+    assert client.send_verification(SUBSCRIPTION_STREAM_ONLINE).status_code == 403
+
+    client = EventSubTestClient(receiver.url + "/other", SECRET)
+    assert client.send_verification(SUBSCRIPTION_STREAM_ONLINE).status_code == 404
+
+
+@responses.activate
+def test_create_eventsub_subscription():
+    responses.add(
+        responses.POST,
+        "{}eventsub/subscriptions".format(BASE_HELIX_URL),
+        body=json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "26b1c993-bfcf-44d9-b876-379dacafe75a",
+                        "status": "webhook_callback_verification_pending",
+                        "type": SUBSCRIPTION_STREAM_ONLINE,
+                    }
+                ],
+                "total": 1,
+            }
+        ),
+        status=202,
+        content_type="application/json",
+    )
+
+    client = TwitchHelix("client id", oauth_token="app token")
+    subscription = client.create_eventsub_subscription(
+        SUBSCRIPTION_STREAM_ONLINE,
+        {"broadcaster_user_id": "1337"},
+        "https://example.com/eventsub",
+        SECRET,
+    )
+
+    assert subscription.status == "webhook_callback_verification_pending"
+    request = json.loads(responses.calls[0].request.body)
+    assert request["transport"]["secret"] == SECRET
+    assert request["condition"] == {"broadcaster_user_id": "1337"}
+    assert responses.calls[0].request.headers["Authorization"] == "Bearer app token"
+
+
+def test_create_eventsub_subscription_requires_oauth_token():
+    with pytest.raises(TwitchAuthException):
+        TwitchHelix("client id").create_eventsub_subscription(
+            SUBSCRIPTION_STREAM_ONLINE, {}, "https://example.com/eventsub", SECRET
+        )
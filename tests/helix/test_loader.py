@@ -0,0 +1,216 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from twitch import TwitchHelix
+from twitch.constants import BASE_HELIX_URL
+from twitch.exceptions import TwitchAttributeException
+from twitch.helix.loader import BatchLoader, GameLoader, UserLoader
+from twitch.resources import Game, User
+
+
+def make_loader(calls, **kwargs):
+    def batch_fn(keys):
+        calls.append(keys)
+        return [{"id": key} for key in keys if key % 7]
+
+    return BatchLoader(batch_fn, key_fn=lambda item: item["id"], **kwargs)
+
+
+def test_load_batches_keys_from_many_threads():
+    calls = []
+    loader = make_loader(calls, window=0.05)
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = list(executor.map(loader.load, range(1, 51)))
+    results = [future.result(timeout=5) for future in futures]
+
+    assert len(calls) == 1
+    assert sorted(calls[0]) == list(range(1, 51))
+    assert results == [{"id": key} if key % 7 else None for key in range(1, 51)]
+
+
+def test_load_dispatches_full_batches_without_waiting_for_the_window():
+    calls = []
+    loader = make_loader(calls, window=60, max_batch_size=10)
+
+    futures = loader.load_many(range(1, 26))
+
+    for future in futures[:20]:
+        future.result(timeout=5)
+    assert [len(keys) for keys in calls] == [10, 10]
+    loader.close()
+    assert [len(keys) for keys in calls] == [10, 10, 5]
+
+
+def test_load_memoizes_results_per_key():
+    calls = []
+    loader = make_loader(calls)
+
+    assert loader.load(1).result(timeout=5) == {"id": 1}
+    assert loader.load(1).result(timeout=5) == {"id": 1}
+    assert loader.load_many([1, 1, 1])[0] is loader.load(1)
+    assert calls == [[1]]
+
+    loader.clear(1)
+    loader.load(1).result(timeout=5)
+    assert calls == [[1], [1]]
+
+
+def test_load_evicts_least_recently_used_keys():
+    calls = []
+    loader = make_loader(calls, memo_size=2)
+
+    for key in (1, 2, 1, 3):
+        loader.load(key).result(timeout=5)
+    loader.load(1).result(timeout=5)
+    loader.load(2).result(timeout=5)
+
+    assert calls == [[1], [2], [3], [2]]
+
+
+def test_load_expires_memoized_results(monkeypatch):
+    calls = []
+    now = [1000.0]
+    monkeypatch.setattr("twitch.helix.loader.time.monotonic", lambda: now[0])
+    loader = make_loader(calls, memo_ttl=60)
+
+    loader.load(1).result(timeout=5)
+    now[0] += 59
+    loader.load(1).result(timeout=5)
+    assert calls == [[1]]
+
+    now[0] += 1
+    loader.load(1).result(timeout=5)
+    assert calls == [[1], [1]]
+
+
+def test_load_without_memoize_shares_only_pending_keys():
+    calls = []
+    loader = make_loader(calls, window=0.05, memoize=False)
+
+    first, second = loader.load_many([1, 1])
+    assert first is second
+    first.result(timeout=5)
+    loader.load(1).result(timeout=5)
+
+    assert calls == [[1], [1]]
+
+
+def test_load_sets_exception_on_every_future_of_a_failed_batch():
+    attempts = []
+
+    def batch_fn(keys):
+        attempts.append(keys)
+        if len(attempts) == 1:
+            raise ValueError("boom")
+        return [{"id": key} for key in keys]
+
+    loader = BatchLoader(batch_fn, key_fn=lambda item: item["id"], window=0.05)
+    futures = loader.load_many([1, 2])
+
+    for future in futures:
+        with pytest.raises(ValueError):
+            future.result(timeout=5)
+    # Failures aren't memoized
+    assert loader.load(1).result(timeout=5) == {"id": 1}
+
+
+def test_load_sets_exception_when_items_have_no_key():
+    loader = BatchLoader(
+        lambda keys: [{"x": key} for key in keys], key_fn=lambda item: item["id"]
+    )
+
+    with pytest.raises(KeyError):
+        loader.load("1").result(timeout=5)
+
+
+def test_load_sets_exception_when_batch_fn_raises_base_exception():
+    def batch_fn(keys):
+        raise KeyboardInterrupt()
+
+    loader = BatchLoader(batch_fn, key_fn=lambda item: item["id"])
+
+    with pytest.raises(KeyboardInterrupt):
+        loader.load("1").result(timeout=5)
+
+
+def users_callback(request):
+    query = parse_qs(urlparse(request.url).query)
+    data = [
+        {"id": user_id, "login": "user{}".format(user_id)}
+        for user_id in query.get("id", [])
+    ]
+    data += [{"id": login[4:], "login": login} for login in query.get("login", [])]
+    return (200, {}, json.dumps({"data": data}))
+
+
+@responses.activate
+def test_user_loader_turns_single_lookups_into_one_request():
+    responses.add_callback(
+        responses.GET,
+        "{}users".format(BASE_HELIX_URL),
+        callback=users_callback,
+        content_type="application/json",
+    )
+    loader = UserLoader(TwitchHelix("client id"), window=0.05)
+    barrier = threading.Barrier(20)
+
+    def get_user(user_id):
+        barrier.wait()
+        return loader.load(user_id).result(timeout=5)
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        users = list(executor.map(get_user, range(20)))
+
+    assert len(responses.calls) == 1
+    assert [user.id for user in users] == [str(x) for x in range(20)]
+    assert all(isinstance(user, User) for user in users)
+
+
+@responses.activate
+def test_user_loader_by_login_ignores_case():
+    responses.add_callback(
+        responses.GET,
+        "{}users".format(BASE_HELIX_URL),
+        callback=users_callback,
+        content_type="application/json",
+    )
+    loader = UserLoader(TwitchHelix("client id"), by="login")
+
+    user = loader.load("User1").result(timeout=5)
+
+    assert user.login == "user1"
+    assert loader.load("USER1").result(timeout=5) is user
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_game_loader_looks_up_games_by_name():
+    responses.add(
+        responses.GET,
+        "{}games".format(BASE_HELIX_URL),
+        body=json.dumps({"data": [{"id": "493057", "name": "PUBG"}]}),
+        content_type="application/json",
+    )
+    loader = GameLoader(TwitchHelix("client id"), by="name")
+
+    game, missing = [f.result(timeout=5) for f in loader.load_many(["pubg", "Other"])]
+
+    assert isinstance(game, Game)
+    assert game.id == "493057"
+    assert missing is None
+    assert len(responses.calls) == 1
+
+
+def test_loaders_raise_attribute_exception_for_unknown_key_types():
+    client = TwitchHelix("client id")
+
+    with pytest.raises(TwitchAttributeException):
+        UserLoader(client, by="name")
+    with pytest.raises(TwitchAttributeException):
+        GameLoader(client, by="login")
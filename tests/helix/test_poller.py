@@ -0,0 +1,164 @@
+import json
+import threading
+
+import pytest
+import responses
+
+from twitch import TwitchHelix
+from twitch.constants import BASE_HELIX_URL
+from twitch.exceptions import TwitchAttributeException
+from twitch.helix.poller import (
+    EVENT_GAME,
+    EVENT_LIVE,
+    EVENT_OFFLINE,
+    EVENT_TITLE,
+    EVENT_VIEWERS,
+    StreamPoller,
+    StreamState,
+)
+
+
+def _stream(stream_id, title="Title", game_id="1", viewer_count=10):
+    return {
+        "id": stream_id,
+        "user_id": "u{}".format(stream_id),
+        "user_login": "user{}".format(stream_id),
+        "game_id": game_id,
+        "title": title,
+        "viewer_count": viewer_count,
+    }
+
+
+class FakeClient(object):
+    def __init__(self, *snapshots):
+        self.snapshots = list(snapshots)
+        self.params = []
+
+    def get_streams(self, **params):
+        self.params.append(params)
+        return iter(self.snapshots.pop(0))
+
+
+def test_first_poll_reports_every_stream_live():
+    client = FakeClient([_stream("1"), _stream("2")])
+    poller = StreamPoller(client, game_ids=["1"])
+
+    events = poller.poll()
+
+    assert [(event.type, event.stream_id) for event in events] == [
+        (EVENT_LIVE, "1"),
+        (EVENT_LIVE, "2"),
+    ]
+    assert events[0].new["title"] == "Title"
+    assert client.params == [{"game_ids": ["1"], "page_size": 100}]
+    assert poller.snapshot["1"] == StreamState("u1", "user1", "1", "Title", 10)
+
+
+def test_first_poll_without_initial_events_only_takes_snapshot():
+    poller = StreamPoller(FakeClient([_stream("1")]), initial_events=False)
+
+    assert poller.poll() == []
+    assert "1" in poller
+    assert len(poller) == 1
+
+
+def test_poll_reports_changes():
+    client = FakeClient(
+        [_stream("1"), _stream("2"), _stream("3")],
+        [
+            _stream("1", title="New title", viewer_count=25),
+            _stream("2", game_id="2", viewer_count=9),
+            _stream("4"),
+        ],
+    )
+    poller = StreamPoller(client, min_viewer_delta=5)
+    poller.poll()
+
+    events = poller.poll()
+
+    assert sorted((event.type, event.stream_id) for event in events) == [
+        (EVENT_GAME, "2"),
+        (EVENT_LIVE, "4"),
+        (EVENT_OFFLINE, "3"),
+        (EVENT_TITLE, "1"),
+        (EVENT_VIEWERS, "1"),
+    ]
+    viewers = [event for event in events if event.type == EVENT_VIEWERS][0]
+    assert (viewers.old, viewers.new, viewers.delta) == (10, 25, 15)
+    offline = [event for event in events if event.type == EVENT_OFFLINE][0]
+    assert offline.old.user_login == "user3"
+    assert sorted(poller.snapshot) == ["1", "2", "4"]
+
+
+def test_poll_ignores_streams_repeated_on_the_next_page():
+    poller = StreamPoller(FakeClient([_stream("1"), _stream("1", viewer_count=99)]))
+
+    assert len(poller.poll()) == 1
+    assert poller.snapshot["1"].viewer_count == 10
+
+
+def test_offline_after_keeps_missing_streams_for_a_number_of_polls():
+    client = FakeClient([_stream("1")], [], [_stream("1")], [], [])
+    poller = StreamPoller(client, offline_after=2)
+    poller.poll()
+
+    assert poller.poll() == []
+    assert poller.poll() == []
+    assert poller.poll() == []
+    assert [event.type for event in poller.poll()] == [EVENT_OFFLINE]
+    assert len(poller) == 0
+
+
+def test_offline_after_must_be_positive():
+    with pytest.raises(TwitchAttributeException):
+        StreamPoller(FakeClient(), offline_after=0)
+
+
+def test_failed_poll_keeps_previous_snapshot():
+    class FailingClient(FakeClient):
+        def get_streams(self, **params):
+            yield _stream("2")
+            raise ValueError()
+
+    poller = StreamPoller(FailingClient())
+    poller._snapshot = {"1": StreamState.from_stream(_stream("1"))}
+
+    with pytest.raises(ValueError):
+        poller.poll()
+    assert list(poller.snapshot) == ["1"]
+
+
+def test_run_calls_handler_until_stopped():
+    stop_event = threading.Event()
+    received = []
+
+    def handler(event):
+        received.append(event)
+        if len(received) == 2:
+            stop_event.set()
+
+    client = FakeClient([_stream("1")], [_stream("1", viewer_count=50)])
+    StreamPoller(client).run(handler, interval=0, stop_event=stop_event)
+
+    assert [event.type for event in received] == [EVENT_LIVE, EVENT_VIEWERS]
+
+
+@responses.activate
+def test_poller_walks_every_page_of_the_cursor():
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        body=json.dumps({"data": [_stream("1")], "pagination": {"cursor": "abc"}}),
+        content_type="application/json",
+    )
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        body=json.dumps({"data": [_stream("2")], "pagination": {}}),
+        content_type="application/json",
+    )
+
+    poller = StreamPoller(TwitchHelix("client id"))
+
+    assert [event.stream_id for event in poller.poll()] == ["1", "2"]
+    assert "first=100" in responses.calls[0].request.url
@@ -0,0 +1,142 @@
+import json
+import time
+
+import pytest
+import responses
+from requests import exceptions
+
+from twitch import TwitchHelix
+from twitch.constants import BASE_HELIX_URL
+from twitch.exceptions import TwitchAttributeException, TwitchAuthException
+from twitch.helix.pool import CredentialPool, Credentials
+
+example_stream = {"id": "26007494656", "user_id": "23161357", "title": "Title"}
+
+
+def _rate_limit_headers(remaining, limit=800):
+    return {
+        "Ratelimit-Limit": str(limit),
+        "Ratelimit-Remaining": str(remaining),
+        "Ratelimit-Reset": str(int(time.time()) + 30),
+    }
+
+
+def _add_streams_response(status=200, headers=None):
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        body=json.dumps({"data": [example_stream], "pagination": {}}),
+        status=status,
+        headers=headers,
+        content_type="application/json",
+    )
+
+
+def _client_ids():
+    return [call.request.headers["Client-ID"] for call in responses.calls]
+
+
+def test_pool_requires_credentials():
+    with pytest.raises(TwitchAttributeException):
+        CredentialPool([])
+    with pytest.raises(TwitchAttributeException):
+        CredentialPool([(None, "token")])
+
+
+def test_pool_spreads_requests_over_unused_credentials():
+    pool = CredentialPool([("a", "token a"), ("b", "token b")])
+
+    chosen = [pool.acquire()[0].client_id for _ in range(4)]
+
+    assert sorted(chosen) == ["a", "a", "b", "b"]
+
+
+def test_pool_chooses_credentials_with_most_remaining_requests():
+    a, b = Credentials("a"), Credentials("b")
+    a.rate_limiter.update(_rate_limit_headers(10))
+    b.rate_limiter.update(_rate_limit_headers(500))
+    pool = CredentialPool([a, b])
+
+    assert pool.acquire()[0] is b
+    assert pool.acquire(exclude=[b])[0] is a
+
+
+def test_pool_skips_revoked_credentials():
+    a, b = Credentials("a"), Credentials("b")
+    pool = CredentialPool([a, b])
+    pool.revoke(a)
+
+    assert [pool.acquire()[0] for _ in range(3)] == [b, b, b]
+    assert pool.active == [b]
+
+    pool.revoke(b)
+    with pytest.raises(TwitchAuthException):
+        pool.acquire()
+
+    pool.restore(a)
+    assert pool.acquire()[0] is a
+
+
+def test_has_available_ignores_exhausted_credentials():
+    a, b = Credentials("a"), Credentials("b")
+    b.rate_limiter.update(_rate_limit_headers(0))
+    pool = CredentialPool([a, b])
+
+    assert pool.has_available()
+    assert not pool.has_available(exclude=[a])
+
+
+@responses.activate
+def test_client_routes_requests_to_credentials_with_most_budget():
+    _add_streams_response(headers=_rate_limit_headers(5))
+    _add_streams_response(headers=_rate_limit_headers(700))
+    _add_streams_response(headers=_rate_limit_headers(699))
+    pool = CredentialPool([("a", "token a"), ("b", "token b")])
+
+    client = TwitchHelix(credential_pool=pool)
+    for _ in range(3):
+        client.get_streams()
+
+    first, second, third = _client_ids()
+    assert first != second
+    # The credentials with 700 requests left are used again
+    assert third == second
+    authorization = responses.calls[0].request.headers["Authorization"]
+    assert authorization == "Bearer token {}".format(first)
+
+
+@responses.activate
+def test_client_fails_over_when_credentials_are_revoked():
+    _add_streams_response(status=401)
+    _add_streams_response()
+    pool = CredentialPool([("a", "token a"), ("b", "token b")])
+
+    streams = TwitchHelix(credential_pool=pool).get_streams()
+
+    assert streams[0].id == example_stream["id"]
+    first, second = _client_ids()
+    assert first != second
+    assert [item.client_id for item in pool.active] == [second]
+
+
+@responses.activate
+def test_client_raises_when_every_credential_is_revoked():
+    _add_streams_response(status=401)
+    _add_streams_response(status=401)
+    pool = CredentialPool([("a", "token a"), ("b", "token b")])
+
+    with pytest.raises(exceptions.HTTPError):
+        TwitchHelix(credential_pool=pool).get_streams()
+    assert pool.active == []
+
+
+@responses.activate
+def test_client_fails_over_when_rate_limit_is_exhausted():
+    _add_streams_response(status=429, headers=_rate_limit_headers(0))
+    _add_streams_response(headers=_rate_limit_headers(799))
+    pool = CredentialPool([("a", "token a"), ("b", "token b")])
+
+    TwitchHelix(credential_pool=pool).get_streams()
+
+    first, second = _client_ids()
+    assert first != second
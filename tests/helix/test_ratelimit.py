@@ -0,0 +1,126 @@
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from twitch.helix.ratelimit import FileRateLimiter, LocalRateLimiter
+
+
+def headers(limit=None, remaining=None, reset=None):
+    values = {
+        "Ratelimit-Limit": limit,
+        "Ratelimit-Remaining": remaining,
+        "Ratelimit-Reset": reset,
+    }
+    return {k: str(v) for k, v in values.items() if v is not None}
+
+
+def test_acquire_does_not_wait_without_rate_limit_information():
+    limiter = LocalRateLimiter()
+
+    assert limiter.acquire() == 0
+
+
+def test_acquire_hands_out_remaining_permits_then_waits_for_reset():
+    limiter = LocalRateLimiter()
+    reset = int(time.time()) + 10
+    limiter.update(headers(limit=800, remaining=2, reset=reset))
+
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    wait_time = limiter.acquire()
+
+    assert 9 < wait_time <= 10.1
+    # The following permits come from the next window, so they wait too
+    assert 9 < limiter.acquire() <= 10.1
+
+
+def test_acquire_does_not_wait_if_reset_is_in_the_past():
+    limiter = LocalRateLimiter()
+    limiter.update(headers(remaining=0, reset=int(time.time()) - 1))
+
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+
+
+def test_available_follows_remaining_permits():
+    limiter = LocalRateLimiter()
+    assert limiter.available() is None
+
+    limiter.update(headers(limit=800, remaining=1, reset=int(time.time()) + 10))
+    assert limiter.available() == 1
+    limiter.acquire()
+    assert limiter.available() == 0
+
+    limiter.update(headers(limit=800, remaining=0, reset=int(time.time()) - 1))
+    assert limiter.available() == 800
+
+
+def test_update_ignores_malformed_headers():
+    limiter = LocalRateLimiter()
+    limiter.update(headers(limit="800", remaining="1", reset="1.7e9"))
+
+    assert limiter._state["limit"] == 800
+    assert limiter._state["remaining"] == 1
+    assert limiter._state["reset"] is None
+
+
+def test_reset_forgets_rate_limit_state():
+    limiter = LocalRateLimiter()
+    limiter.update(headers(remaining=0, reset=int(time.time()) + 10))
+    limiter.reset()
+
+    assert limiter.acquire() == 0
+
+
+def test_local_rate_limiter_is_thread_safe():
+    limiter = LocalRateLimiter()
+    limiter.update(headers(limit=800, remaining=500, reset=int(time.time()) + 60))
+    waits = []
+
+    def worker():
+        for _ in range(100):
+            waits.append(limiter.acquire())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len([x for x in waits if x == 0]) == 500
+
+
+def acquire_permits(path, count, results):
+    limiter = FileRateLimiter(path)
+    results.put(sum(1 for _ in range(count) if limiter.acquire() == 0))
+
+
+def test_file_rate_limiter_is_shared_between_processes(tmp_path):
+    path = str(tmp_path / "ratelimit.json")
+    FileRateLimiter(path).update(
+        headers(limit=800, remaining=30, reset=int(time.time()) + 60)
+    )
+    results = multiprocessing.Queue()
+
+    processes = [
+        multiprocessing.Process(target=acquire_permits, args=(path, 20, results))
+        for _ in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert sum(results.get() for _ in processes) == 30
+
+
+def test_file_rate_limiter_persists_state(tmp_path):
+    path = str(tmp_path / "ratelimit.json")
+    FileRateLimiter(path).update(headers(remaining=1, reset=int(time.time()) + 60))
+
+    limiter = FileRateLimiter(path)
+
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(60, abs=1.2)
@@ -0,0 +1,118 @@
+import time
+
+import pytest
+
+from twitch.cache import DiskCache, MemoryCache, make_cache_key
+
+
+@pytest.fixture(params=["memory", "disk"])
+def cache_class(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCache
+    return lambda **kwargs: DiskCache(str(tmp_path / "cache.sqlite"), **kwargs)
+
+
+def test_make_cache_key_depends_on_params_and_credentials():
+    key = make_cache_key("url", {"id": ["1"]}, {"Client-ID": "a"})
+
+    assert key == make_cache_key("url", {"id": ["1"]}, {"Client-ID": "a"})
+    assert key != make_cache_key("url", {"id": ["2"]}, {"Client-ID": "a"})
+    assert key != make_cache_key("url", {"id": ["1"]}, {"Client-ID": "b"})
+    assert key != make_cache_key(
+        "url", {"id": ["1"]}, {"Client-ID": "a", "Authorization": "OAuth token"}
+    )
+
+
+def test_get_ttl_uses_longest_matching_prefix():
+    cache = MemoryCache(ttl=10, ttls={"users": 100, "users/follows": 0})
+
+    assert cache.get_ttl("streams") == 10
+    assert cache.get_ttl("users/1234") == 100
+    assert cache.get_ttl("users/follows/channels") == 0
+
+
+def test_lookup_returns_fresh_entry_and_counts_hits(cache_class):
+    cache = cache_class()
+    cache.store("key", "users", {"id": 1}, {})
+
+    entry = cache.lookup("key")
+
+    assert entry.payload == {"id": 1}
+    assert cache.is_fresh(entry)
+    assert cache.lookup("missing") is None
+    assert cache.stats == {"hits": 1, "misses": 1, "revalidations": 0}
+
+
+def test_modifying_returned_payloads_doesnt_change_the_cache(cache_class):
+    cache = cache_class()
+    payload = {"data": [{"login": "user"}]}
+    cache.store("key", "users", payload, {})
+
+    payload["data"][0]["login"] = "changed"
+    cache.lookup("key").payload["data"][0]["login"] = "changed"
+
+    assert cache.lookup("key").payload == {"data": [{"login": "user"}]}
+
+
+def test_expired_entries_are_only_returned_if_they_can_be_revalidated(cache_class):
+    cache = cache_class(ttl=0.01)
+    cache.store("plain", "users", {"id": 1}, {})
+    cache.store("etag", "users", {"id": 2}, {"ETag": '"abc"'})
+    time.sleep(0.02)
+
+    assert cache.lookup("plain") is None
+    entry = cache.lookup("etag")
+    assert not cache.is_fresh(entry)
+    assert cache.get_conditional_headers(entry) == {"If-None-Match": '"abc"'}
+
+    assert cache.revalidate("etag", "users", entry) == {"id": 2}
+    assert cache.is_fresh(cache.lookup("etag"))
+    assert cache.revalidations == 1
+
+
+def test_zero_ttl_paths_are_not_cached(cache_class):
+    cache = cache_class(ttls={"streams": 0})
+    cache.store("key", "streams", {"id": 1}, {})
+
+    assert cache.lookup("key") is None
+
+
+def test_least_recently_used_entries_are_evicted(cache_class):
+    cache = cache_class(maxsize=2)
+    cache.store("a", "users", 1, {})
+    cache.store("b", "users", 2, {})
+    cache.lookup("a")
+    cache.store("c", "users", 3, {})
+
+    assert len(cache) == 2
+    assert cache.lookup("b") is None
+    assert cache.lookup("a").payload == 1
+    assert cache.lookup("c").payload == 3
+
+
+def test_disk_cache_persists_entries(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    DiskCache(path).store("key", "users", {"id": 1}, {})
+
+    assert DiskCache(path).lookup("key").payload == {"id": 1}
+
+
+def test_disk_cache_lookups_dont_write_to_the_database(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"))
+    cache.store("key", "users", {"id": 1}, {})
+    changes = cache._connection.total_changes
+
+    assert cache.lookup("key").payload == {"id": 1}
+    assert cache._connection.total_changes == changes
+
+
+def test_disk_cache_evicts_least_recently_used_entries_beyond_maxsize(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"), maxsize=100)
+    for key in range(100):
+        cache.store(str(key), "users", key, {})
+    cache.lookup("0")
+    cache.store("new", "users", "new", {})
+
+    assert len(cache) == 100
+    assert cache.lookup("1") is None
+    assert cache.lookup("0").payload == 0
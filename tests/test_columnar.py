@@ -0,0 +1,179 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+import responses
+
+from twitch import TwitchHelix
+from twitch.client import TwitchClient
+from twitch.columnar import (
+    CATEGORY,
+    DATETIME,
+    FLOAT,
+    HELIX_STREAM_SCHEMA,
+    INT,
+    STRING,
+    ColumnBuffers,
+    iter_batches,
+    to_columns,
+)
+from twitch.constants import BASE_HELIX_URL, BASE_URL
+from twitch.exceptions import TwitchAttributeException
+from twitch.resources import Stream
+
+streams = [
+    {
+        "id": str(index),
+        "user_id": str(1000 + index),
+        "user_login": "user{}".format(index),
+        "game_id": "417752" if index % 2 else "33214",
+        "type": "live",
+        "title": "Stream {}".format(index),
+        "viewer_count": 100 - index,
+        "started_at": "2017-08-14T16:08:{:02d}Z".format(index),
+        "language": "en",
+    }
+    for index in range(5)
+]
+
+schema = {
+    "id": STRING,
+    "viewer_count": INT,
+    "started_at": DATETIME,
+    "language": CATEGORY,
+}
+
+
+def test_column_buffers_collect_one_list_per_column():
+    buffers = to_columns(
+        [Stream.construct_from(streams[0]), streams[1], {"id": "x"}], schema
+    )
+
+    assert len(buffers) == 3
+    assert buffers.columns["id"] == ["0", "1", "x"]
+    assert buffers.columns["viewer_count"] == [100, 99, None]
+    assert buffers.columns["started_at"][0] == datetime(
+        2017, 8, 14, 16, 8, 0, tzinfo=timezone.utc
+    )
+
+
+def test_column_buffers_select_nested_fields_with_dotted_names():
+    items = [{"channel": {"name": "spongebob"}}, {"channel": None}, {}]
+
+    buffers = to_columns(items, {"channel.name": STRING})
+
+    assert buffers.columns["channel.name"] == ["spongebob", None, None]
+
+
+def test_column_buffers_raise_for_unknown_dtypes():
+    with pytest.raises(TwitchAttributeException):
+        ColumnBuffers({"id": "uuid"})
+
+
+def test_to_numpy_returns_record_array_with_declared_dtypes():
+    np = pytest.importorskip("numpy")
+
+    records = to_columns(streams + [{"id": "x"}], schema).to_numpy()
+
+    assert records.dtype.names == ("id", "viewer_count", "started_at", "language")
+    assert records.id[0] == "0"
+    # Missing integers become NaN
+    assert records.viewer_count.dtype == np.float64
+    assert np.isnan(records.viewer_count[-1])
+    assert records.started_at.dtype == np.dtype("datetime64[us]")
+    assert records.started_at[1] == np.datetime64("2017-08-14T16:08:01")
+    assert np.isnat(records.started_at[-1])
+
+    records = to_columns(streams, schema).to_numpy()
+    assert records.viewer_count.dtype == np.int64
+
+
+def test_to_arrow_returns_table_with_declared_types():
+    pa = pytest.importorskip("pyarrow")
+
+    table = to_columns(streams, dict(schema, rating=FLOAT)).to_arrow()
+
+    assert table.num_rows == 5
+    assert table.schema.field("viewer_count").type == pa.int64()
+    assert table.schema.field("started_at").type == pa.timestamp("us", tz="UTC")
+    assert pa.types.is_dictionary(table.schema.field("language").type)
+    assert table.column("rating").null_count == 5
+    assert table.column("viewer_count").to_pylist() == [100, 99, 98, 97, 96]
+
+
+def test_to_pandas_returns_dataframe_with_categoricals():
+    pd = pytest.importorskip("pandas")
+
+    frame = to_columns(streams, HELIX_STREAM_SCHEMA).to_pandas()
+
+    assert list(frame.columns) == list(HELIX_STREAM_SCHEMA)
+    assert isinstance(frame["game_id"].dtype, pd.CategoricalDtype)
+    assert sorted(frame["game_id"].cat.categories) == ["33214", "417752"]
+    assert str(frame["viewer_count"].dtype) == "Int64"
+    assert str(frame["started_at"].dt.tz) == "UTC"
+
+
+def test_to_pandas_stores_missing_floats_as_nan():
+    pytest.importorskip("pandas")
+
+    frame = to_columns([{"rating": 1.5}, {}], {"rating": FLOAT}).to_pandas()
+
+    assert str(frame["rating"].dtype) == "float64"
+    assert frame["rating"].isna().tolist() == [False, True]
+
+
+def test_iter_batches_yields_batches_of_rows():
+    pytest.importorskip("pyarrow")
+
+    batches = list(iter_batches(iter(streams), schema, batch_size=2))
+
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+
+
+def test_iter_batches_raises_for_unknown_outputs():
+    with pytest.raises(TwitchAttributeException):
+        next(iter_batches(streams, schema, output="csv"))
+
+
+@responses.activate
+def test_helix_cursor_exports_every_page_to_arrow():
+    pytest.importorskip("pyarrow")
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        body=json.dumps({"data": streams[:3], "pagination": {"cursor": "abc"}}),
+        content_type="application/json",
+    )
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_HELIX_URL),
+        body=json.dumps({"data": streams[3:], "pagination": {}}),
+        content_type="application/json",
+    )
+
+    client = TwitchHelix("client id", raw=True)
+    table = client.get_streams().to_arrow(HELIX_STREAM_SCHEMA)
+
+    assert table.num_rows == 5
+    assert table.column("id").to_pylist() == ["0", "1", "2", "3", "4"]
+
+
+@responses.activate
+def test_kraken_paginator_exports_nested_fields():
+    pytest.importorskip("numpy")
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_URL),
+        body=json.dumps(
+            {"_total": 1, "streams": [{"_id": 1, "channel": {"name": "spongebob"}}]}
+        ),
+        content_type="application/json",
+    )
+
+    client = TwitchClient("client id")
+    records = client.streams.iter_live_streams().to_numpy(
+        {"id": INT, "channel.name": STRING}
+    )
+
+    assert records["channel.name"][0] == "spongebob"
+    assert records.id[0] == 1
@@ -0,0 +1,89 @@
+import os
+from configparser import ConfigParser
+
+import pytest
+
+from twitch import TwitchHelix
+from twitch.api.base import TwitchAPI
+from twitch.client import TwitchClient
+from twitch.conf import (
+    TwitchConfig,
+    backoff_config,
+    credentials_from_config_file,
+    get_config,
+    reload_config,
+)
+
+DUMMY_CONFIG_FILE = "tests/api/dummy_credentials.cfg"
+
+
+@pytest.fixture
+def config_file(monkeypatch):
+    monkeypatch.delenv("TWITCH_CLIENT_ID", raising=False)
+    monkeypatch.setenv("TWITCH_CONFIG_FILE", DUMMY_CONFIG_FILE)
+    reload_config()
+    yield DUMMY_CONFIG_FILE
+    monkeypatch.undo()
+    reload_config()
+
+
+def test_get_config_reads_config_file(config_file):
+    config = get_config()
+
+    assert config.client_id == "spongebob"
+    assert config.oauth_token == "squarepants"
+    assert config.initial_backoff == 0.01
+    assert config.max_retries == 1
+
+
+def test_get_config_reads_config_file_once(config_file, monkeypatch):
+    config = get_config()
+
+    def fail(*args):
+        raise AssertionError("config file was read again")
+
+    monkeypatch.setattr(ConfigParser, "read", fail)
+
+    assert get_config() is config
+    TwitchAPI(client_id="client")
+    TwitchClient()
+    TwitchHelix()
+
+
+def test_reload_config_reads_config_file_again(config_file, monkeypatch):
+    config = get_config()
+    monkeypatch.setenv("TWITCH_OAUTH_TOKEN", "patrick")
+
+    assert get_config().oauth_token == "squarepants"
+    assert reload_config() is not config
+    assert get_config().oauth_token == "patrick"
+
+
+def test_environment_variables_override_config_file(config_file, monkeypatch):
+    monkeypatch.setenv("TWITCH_CLIENT_ID", "gary")
+    monkeypatch.setenv("TWITCH_MAX_RETRIES", "5")
+    reload_config()
+
+    assert credentials_from_config_file() == ("gary", "squarepants")
+    assert backoff_config() == (0.01, 5)
+
+
+def test_missing_config_file_uses_defaults():
+    config = TwitchConfig.from_file(os.path.join("tests", "missing.cfg"))
+
+    assert credentials_from_config_file(config) == (None, None)
+    assert backoff_config(config) == (0.5, 3)
+
+
+def test_config_passed_directly_is_used_without_reading_files(monkeypatch):
+    def fail(*args):
+        raise AssertionError("config file was read")
+
+    monkeypatch.setattr(ConfigParser, "read", fail)
+    config = TwitchConfig(client_id="gary", initial_backoff=0.1, max_retries=0)
+
+    client = TwitchClient(config=config)
+    assert client._client_id == "gary"
+    assert client.users._retry_policy.max_attempts == 1
+    assert client.users._retry_policy.initial_backoff == 0.1
+    assert TwitchHelix(config=config)._client_id == "gary"
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+import responses
+
+from twitch import decoders
+from twitch.client import TwitchClient
+from twitch.constants import BASE_URL
+from twitch.decoders import decode_json, get_decoder, set_decoder
+from twitch.exceptions import TwitchException
+
+payload = {"_total": 2, "streams": [{"_id": 1, "game": "Überwatch"}, {"_id": 2}]}
+
+
+@pytest.fixture(autouse=True)
+def restore_decoder():
+    decode = decoders._decode
+    yield
+    decoders._decode = decode
+
+
+@pytest.mark.parametrize("name", list(decoders.DECODERS))
+def test_installed_decoders_decode_bytes(name):
+    decode = get_decoder(name)
+
+    assert decode(json.dumps(payload).encode("utf-8")) == payload
+
+
+def test_json_decoder_is_always_available_and_preferred_last():
+    assert list(decoders.DECODERS)[-1] == "json"
+    assert get_decoder("json") is json.loads
+
+
+def test_get_decoder_raises_for_unknown_decoder():
+    with pytest.raises(TwitchException):
+        get_decoder("simplejson")
+
+
+def test_set_decoder_accepts_names_and_functions():
+    set_decoder("json")
+    assert decoders._decode is json.loads
+
+    set_decoder(lambda content: {"decoded": content})
+    assert decode_json(b"{}") == {"decoded": b"{}"}
+
+
+@responses.activate
+def test_responses_are_decoded_with_the_configured_decoder():
+    calls = []
+
+    def decode(content):
+        calls.append(content)
+        return json.loads(content)
+
+    responses.add(
+        responses.GET,
+        "{}streams".format(BASE_URL),
+        body=json.dumps(payload),
+        status=200,
+        content_type="application/json",
+    )
+    set_decoder(decode)
+
+    client = TwitchClient("client id")
+    streams = client.streams.get_live_streams()
+
+    assert len(streams) == 2
+    assert isinstance(calls[0], bytes)
@@ -0,0 +1,258 @@
+import io
+import json
+import os
+import socketserver
+import threading
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+
+import pytest
+import responses
+from requests.exceptions import HTTPError
+
+from twitch.client import TwitchClient
+from twitch.constants import VOD_FETCH_URL
+from twitch.exceptions import TwitchAttributeException, TwitchException
+from twitch.hls import (
+    PROGRESS_SUFFIX,
+    HLSDownloader,
+    parse_master_playlist,
+    parse_media_playlist,
+    select_variant,
+)
+from twitch.retry import RetryPolicy
+
+SEGMENTS = 6
+
+master_playlist = """#EXTM3U
+#EXT-X-TWITCH-INFO:ORIGIN="s3",B="false"
+#EXT-X-MEDIA:TYPE=VIDEO,GROUP-ID="chunked",NAME="1080p60 (source)",AUTOSELECT=YES
+#EXT-X-STREAM-INF:BANDWIDTH=6000000,CODECS="avc1.64002A,mp4a.40.2",\
+RESOLUTION="1920x1080",VIDEO="chunked"
+{base}chunked/index-dvr.m3u8
+#EXT-X-MEDIA:TYPE=VIDEO,GROUP-ID="720p30",NAME="720p",AUTOSELECT=YES
+#EXT-X-STREAM-INF:BANDWIDTH=2000000,RESOLUTION="1280x720",VIDEO="720p30"
+{base}720p30/index-dvr.m3u8
+"""
+
+
+def _media_playlist(count):
+    lines = ["#EXTM3U", "#EXT-X-TARGETDURATION:10"]
+    for index in range(count):
+        lines += ["#EXTINF:10.000,", "{}.ts".format(index)]
+    lines.append("#EXT-X-ENDLIST")
+    return "\n".join(lines) + "\n"
+
+
+def _segment(quality, index):
+    return "{}-{}|".format(quality, index).encode("utf-8") * 1000
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    # http.server.ThreadingHTTPServer is only available from Python 3.7
+    daemon_threads = True
+
+
+class Handler(SimpleHTTPRequestHandler):
+    requests = []
+    root = None
+
+    def translate_path(self, path):
+        # The directory argument of SimpleHTTPRequestHandler is only available from
+        # Python 3.7, so paths are moved from the working directory to `root`
+        path = super(Handler, self).translate_path(path)
+        return os.path.join(Handler.root, os.path.relpath(path, os.getcwd()))
+
+    def do_GET(self):
+        Handler.requests.append(self.path)
+        super(Handler, self).do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path):
+    for quality in ("chunked", "720p30"):
+        directory = tmp_path / quality
+        directory.mkdir()
+        (directory / "index-dvr.m3u8").write_text(_media_playlist(SEGMENTS))
+        for index in range(SEGMENTS):
+            (directory / "{}.ts".format(index)).write_bytes(_segment(quality, index))
+
+    Handler.root = str(tmp_path)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    Handler.requests = []
+    yield "http://127.0.0.1:{}/".format(httpd.server_address[1])
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_parse_master_playlist():
+    variants = parse_master_playlist(master_playlist.format(base="https://vod/"))
+
+    assert [variant.name for variant in variants] == ["1080p60 (source)", "720p"]
+    assert variants[0].group_id == "chunked"
+    assert variants[0].bandwidth == 6000000
+    assert variants[0].resolution == "1920x1080"
+    assert variants[1].url == "https://vod/720p30/index-dvr.m3u8"
+
+
+def test_parse_media_playlist_resolves_relative_urls():
+    segments = parse_media_playlist(
+        _media_playlist(2).encode("utf-8"), base_url="https://vod/chunked/index.m3u8"
+    )
+
+    assert [segment.url for segment in segments] == [
+        "https://vod/chunked/0.ts",
+        "https://vod/chunked/1.ts",
+    ]
+    assert segments[1].index == 1
+    assert segments[1].duration == 10.0
+
+
+def test_parse_raises_for_other_content():
+    with pytest.raises(TwitchException):
+        parse_media_playlist(b"<html></html>")
+
+
+@pytest.mark.parametrize(
+    "quality,group_id",
+    [
+        (None, "chunked"),
+        ("worst", "720p30"),
+        ("source", "chunked"),
+        ("1080p60", "chunked"),
+        ("720p", "720p30"),
+        ("1280x720", "720p30"),
+    ],
+)
+def test_select_variant(quality, group_id):
+    variants = parse_master_playlist(master_playlist.format(base=""))
+
+    assert select_variant(variants, quality).group_id == group_id
+
+
+def test_select_variant_raises_for_unknown_quality():
+    variants = parse_master_playlist(master_playlist.format(base=""))
+
+    with pytest.raises(TwitchAttributeException):
+        select_variant(variants, "4k")
+
+
+def test_download_writes_segments_in_order(server, tmp_path):
+    output = tmp_path / "vod.ts"
+    seen = []
+
+    stats = HLSDownloader(workers=3, max_pending=4).download(
+        master_playlist.format(base=server),
+        str(output),
+        progress=lambda stats: seen.append(stats.segments),
+    )
+
+    assert output.read_bytes() == b"".join(
+        _segment("chunked", index) for index in range(SEGMENTS)
+    )
+    assert seen == list(range(1, SEGMENTS + 1))
+    assert stats.segments == stats.total_segments == SEGMENTS
+    assert stats.bytes == stats.downloaded_bytes == output.stat().st_size
+    assert stats.throughput > 0
+    assert not os.path.exists(str(output) + PROGRESS_SUFFIX)
+
+
+def test_download_into_a_file_object(server):
+    sink = io.BytesIO()
+
+    HLSDownloader().download(master_playlist.format(base=server), sink, quality="720p")
+
+    assert sink.getvalue() == b"".join(
+        _segment("720p30", index) for index in range(SEGMENTS)
+    )
+
+
+def test_download_resumes_after_the_last_written_segment(server, tmp_path):
+    output = str(tmp_path / "vod.ts")
+    playlist = master_playlist.format(base=server)
+
+    def interrupt(stats):
+        if stats.segments == 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        HLSDownloader(workers=1, max_pending=1).download(
+            playlist, output, progress=interrupt
+        )
+    with open(output + PROGRESS_SUFFIX) as f:
+        assert json.load(f)["segments"] == 2
+
+    Handler.requests = []
+    stats = HLSDownloader().download(playlist, output)
+
+    assert sorted(path for path in Handler.requests if path.endswith(".ts")) == [
+        "/chunked/{}.ts".format(index) for index in range(2, SEGMENTS)
+    ]
+    assert stats.resumed_segments == 2
+    assert stats.downloaded_bytes < stats.bytes
+    with open(output, "rb") as f:
+        assert f.read() == b"".join(
+            _segment("chunked", index) for index in range(SEGMENTS)
+        )
+
+
+def test_download_starts_over_without_resume(server, tmp_path):
+    output = tmp_path / "vod.ts"
+    output.write_bytes(b"partial")
+
+    HLSDownloader().download(
+        master_playlist.format(base=server), str(output), resume=False
+    )
+
+    assert output.read_bytes().startswith(_segment("chunked", 0))
+
+
+def test_download_raises_for_missing_segments(server, tmp_path):
+    os.remove(str(tmp_path / "chunked" / "3.ts"))
+
+    with pytest.raises(HTTPError):
+        HLSDownloader().download(master_playlist.format(base=server), io.BytesIO())
+
+
+@responses.activate
+def test_retried_segment_responses_are_closed():
+    responses.add(responses.GET, "https://vod/0.ts", status=503)
+    responses.add(responses.GET, "https://vod/0.ts", body=b"segment")
+    downloader = HLSDownloader(retry_policy=RetryPolicy(initial_backoff=0))
+
+    assert bytes(downloader._get_segment("https://vod/0.ts")) == b"segment"
+    # The failed attempt gave its connection back before the segment was retried
+    assert responses.calls[0].response.raw.closed
+
+
+@responses.activate
+def test_save_vod_downloads_the_vod(server, tmp_path):
+    vod_id = "106400740"
+    responses.add_passthru(server)
+    responses.add(
+        responses.GET,
+        "https://api.twitch.tv/api/vods/{}/access_token".format(vod_id),
+        body=json.dumps({"sig": "sig", "token": "token"}),
+        status=200,
+        content_type="application/json",
+    )
+    responses.add(
+        responses.GET,
+        "{}vod/{}".format(VOD_FETCH_URL, vod_id),
+        body=master_playlist.format(base=server),
+        status=200,
+        content_type="application/x-mpegURL",
+    )
+    output = tmp_path / "vod.ts"
+
+    client = TwitchClient("client id")
+    stats = client.videos.save_vod("v{}".format(vod_id), str(output), quality="worst")
+
+    assert stats.segments == SEGMENTS
+    assert output.read_bytes().startswith(_segment("720p30", 0))
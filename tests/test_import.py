@@ -0,0 +1,88 @@
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+# Module __getattr__ (PEP 562), which the lazy imports rely on, needs Python 3.7
+requires_lazy_imports = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="Lazy imports need Python 3.7"
+)
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+
+
+@requires_lazy_imports
+def test_import_twitch_doesnt_import_requests_or_kraken():
+    result = _run(
+        "import sys, twitch; "
+        "print(sorted(name for name in sys.modules "
+        "if name == 'requests' or name.startswith('twitch.')))"
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+@requires_lazy_imports
+def test_import_twitch_only_imports_the_package():
+    result = _run(
+        "import sys; before = set(sys.modules); import twitch; "
+        "print(sorted(set(sys.modules) - before))"
+    )
+
+    assert result.stdout.strip() == "['twitch']"
+
+
+@requires_lazy_imports
+def test_helix_doesnt_import_kraken():
+    result = _run(
+        "import sys; from twitch import TwitchHelix; "
+        "print('twitch.client' in sys.modules, 'twitch.api.channels' in sys.modules)"
+    )
+
+    assert result.stdout.strip() == "False False"
+
+
+def test_lazy_attributes_are_importable():
+    import twitch
+    from twitch.api import Users
+    from twitch.client import TwitchClient
+    from twitch.helix.api import TwitchHelix
+
+    assert twitch.TwitchClient is TwitchClient
+    assert twitch.TwitchHelix is TwitchHelix
+    assert twitch.api.Users is Users
+    assert "TwitchHelix" in dir(twitch)
+    assert twitch.resources.Stream
+
+
+def test_every_submodule_is_a_lazy_attribute():
+    import twitch
+
+    names = {module.name for module in pkgutil.iter_modules(twitch.__path__)}
+
+    assert names == set(twitch._LAZY_SUBMODULES)
+
+
+@requires_lazy_imports
+def test_submodules_are_importable_as_attributes_of_a_fresh_package():
+    result = _run(
+        "import twitch; print(twitch.decorators.__name__, twitch.hls.__name__)"
+    )
+
+    assert result.stdout.strip() == "twitch.decorators twitch.hls"
+
+
+def test_unknown_attributes_raise_attribute_error():
+    import twitch
+
+    with pytest.raises(AttributeError):
+        twitch.Unknown
@@ -1,4 +1,6 @@
-from datetime import datetime
+import copy
+import pickle
+from datetime import datetime, timezone
 
 import pytest
 
@@ -20,6 +22,7 @@ from twitch.resources import (
     UserBlock,
     Video,
     convert_to_twitch_object,
+    parse_datetime,
 )
 
 
@@ -66,13 +69,21 @@ def test_convert_to_twitch_object_output_returns_correct_object(
 @pytest.mark.parametrize(
     "name,data,expected",
     [
-        ("created_at", "2016-11-29T15:52:27Z", datetime(2016, 11, 29, 15, 52, 27)),
+        (
+            "created_at",
+            "2016-11-29T15:52:27Z",
+            datetime(2016, 11, 29, 15, 52, 27, tzinfo=timezone.utc),
+        ),
         (
             "updated_at",
             "2017-03-06T18:40:51.855Z",
-            datetime(2017, 3, 6, 18, 40, 51, 855000),
+            datetime(2017, 3, 6, 18, 40, 51, 855000, tzinfo=timezone.utc),
+        ),
+        (
+            "published_at",
+            "2017-02-14T22:27:54Z",
+            datetime(2017, 2, 14, 22, 27, 54, tzinfo=timezone.utc),
         ),
-        ("published_at", "2017-02-14T22:27:54Z", datetime(2017, 2, 14, 22, 27, 54)),
         ("published_at", None, None),
     ],
 )
@@ -83,6 +94,51 @@ def test_datetimes_are_converted_correctly_to_datetime_objects(name, data, expec
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2017-03-06T18:40:51.123456789Z", datetime(2017, 3, 6, 18, 40, 51, 123456)),
+        ("2017-03-06T18:40:51+02:00", datetime(2017, 3, 6, 16, 40, 51)),
+        ("2017-03-06T18:40:51.5-0100", datetime(2017, 3, 6, 19, 40, 51, 500000)),
+    ],
+)
+def test_parse_datetime_returns_utc_datetimes(value, expected):
+    result = parse_datetime(value)
+
+    assert result.tzinfo is timezone.utc
+    assert result == expected.replace(tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "value", ["2017-03-06", "2017-03-06 18:40:51", "2017-13-06T18:40:51Z", "abcd"]
+)
+def test_parse_datetime_raises_for_invalid_timestamps(value):
+    with pytest.raises(ValueError):
+        parse_datetime(value)
+
+
+def test_datetimes_are_kept_as_strings_if_parsing_is_disabled():
+    result = convert_to_twitch_object(
+        "created_at", "2016-11-29T15:52:27Z", parse_datetimes=False
+    )
+
+    assert result == "2016-11-29T15:52:27Z"
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_construct_from_keeps_nested_datetimes_as_strings(lazy):
+    values = {
+        "created_at": "2016-11-29T15:52:27Z",
+        "channel": {"updated_at": "2017-03-06T18:40:51Z"},
+    }
+
+    stream = Stream.construct_from(values, lazy=lazy, parse_datetimes=False)
+
+    assert stream.created_at == "2016-11-29T15:52:27Z"
+    assert stream.channel.updated_at == "2017-03-06T18:40:51Z"
+    assert Stream.construct_from(values, lazy=lazy).created_at.year == 2016
+
+
 class TestTwitchObject(object):
     def test_attributes_are_stored_and_fetched_from_dict(self):
         obj = TwitchObject()
@@ -145,6 +201,78 @@ class TestTwitchObject(object):
         assert obj.id == 1234
 
 
+class TestLazyTwitchObject(object):
+    values = {
+        "_id": 1234,
+        "viewers": 7254,
+        "created_at": "2016-11-29T15:52:27Z",
+        "channel": {"_id": 5678, "updated_at": "2017-03-06T18:40:51Z"},
+        "videos": [{"_id": 1}, {"_id": 2}],
+    }
+
+    def test_nested_values_are_converted_on_first_access(self):
+        obj = Stream.construct_from(self.values, lazy=True)
+
+        assert dict.__getitem__(obj, "created_at") == "2016-11-29T15:52:27Z"
+        assert obj.id == 1234
+        assert obj.created_at == datetime(2016, 11, 29, 15, 52, 27, tzinfo=timezone.utc)
+        assert dict.__getitem__(obj, "created_at") == obj.created_at
+
+        channel = obj.channel
+        assert isinstance(channel, Channel)
+        assert channel is obj["channel"]
+        assert dict.__getitem__(channel, "updated_at") == "2017-03-06T18:40:51Z"
+        assert channel.updated_at == datetime(
+            2017, 3, 6, 18, 40, 51, tzinfo=timezone.utc
+        )
+
+        assert all(isinstance(video, Video) for video in obj.get("videos"))
+
+    def test_lazy_objects_are_equal_to_eager_ones(self):
+        lazy = Stream.construct_from(self.values, lazy=True)
+        eager = Stream.construct_from(self.values)
+
+        assert lazy == eager
+        assert dict(lazy.items()) == dict(eager.items())
+        assert list(Stream.construct_from(self.values, lazy=True).values()) == list(
+            eager.values()
+        )
+
+    def test_set_values_are_not_converted(self):
+        obj = Stream.construct_from(self.values, lazy=True)
+        obj.created_at = "yesterday"
+
+        assert obj.created_at == "yesterday"
+        assert obj.pop("channel") == Channel.construct_from(self.values["channel"])
+
+    def test_input_is_not_modified(self):
+        values = {"channel": {"_id": 5678}}
+        obj = Stream.construct_from(values, lazy=True)
+        obj.channel
+
+        assert values == {"channel": {"_id": 5678}}
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"lazy": True}, {"parse_datetimes": False}])
+@pytest.mark.parametrize(
+    "clone", [copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))]
+)
+def test_objects_can_be_copied_and_pickled(kwargs, clone):
+    values = {
+        "_id": 1234,
+        "created_at": "2016-11-29T15:52:27Z",
+        "channel": {"_id": 5678, "updated_at": "2017-03-06T18:40:51Z"},
+    }
+    obj = Stream.construct_from(values, **kwargs)
+
+    result = clone(obj)
+
+    assert type(result) is Stream
+    assert result == obj
+    assert isinstance(result.channel, Channel)
+    assert "_unconverted" not in result.__dict__
+
+
 @pytest.mark.parametrize(
     "resource",
     [
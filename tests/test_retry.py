@@ -0,0 +1,109 @@
+import time
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from twitch.retry import RetryPolicy
+
+
+class Response(object):
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_next_delay_returns_none_for_successful_response():
+    state = RetryPolicy().start()
+
+    assert state.next_delay(response=Response(200)) is None
+
+
+def test_next_delay_uses_exponential_backoff_with_full_jitter():
+    state = RetryPolicy(max_attempts=10, initial_backoff=1, max_backoff=5).start()
+
+    delays = [state.next_delay(response=Response(503)) for _ in range(6)]
+
+    for attempt, delay in enumerate(delays):
+        assert 0 <= delay <= min(2**attempt, 5)
+
+
+def test_next_delay_stops_after_max_attempts():
+    state = RetryPolicy(max_attempts=3, initial_backoff=0).start()
+
+    assert state.next_delay(response=Response(500)) is not None
+    assert state.next_delay(response=Response(500)) is not None
+    assert state.next_delay(response=Response(500)) is None
+    assert state.attempts == 3
+
+
+def test_next_delay_does_not_retry_methods_that_are_not_allowed():
+    state = RetryPolicy().start("POST")
+
+    assert state.next_delay(response=Response(503)) is None
+
+
+def test_next_delay_respects_retry_after():
+    state = RetryPolicy(initial_backoff=0.1).start()
+
+    delay = state.next_delay(response=Response(503, {"Retry-After": "7"}))
+
+    assert 7 <= delay <= 7.1
+
+
+def test_next_delay_waits_for_rate_limit_reset_after_429():
+    state = RetryPolicy(initial_backoff=0.1).start()
+    headers = {"Ratelimit-Reset": str(int(time.time()) + 5)}
+
+    delay = state.next_delay(response=Response(429, headers))
+
+    assert 4 <= delay <= 5.1
+
+
+def test_next_delay_falls_back_to_backoff_for_invalid_rate_limit_reset():
+    state = RetryPolicy(initial_backoff=1, max_backoff=5).start()
+
+    delay = state.next_delay(response=Response(429, {"Ratelimit-Reset": "soon"}))
+
+    assert 0 <= delay <= 1
+
+
+def test_next_delay_stops_at_deadline():
+    state = RetryPolicy(deadline=5).start()
+
+    assert state.next_delay(response=Response(429, {"Retry-After": "10"})) is None
+
+
+def test_call_retries_connection_errors():
+    results = [ConnectionError(), Response(200)]
+
+    def send():
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    response = RetryPolicy(initial_backoff=0).call("GET", send)
+
+    assert response.status_code == 200
+
+
+def test_call_closes_responses_that_are_retried():
+    responses = [Response(503), Response(500), Response(200)]
+    sent = list(responses)
+
+    response = RetryPolicy(initial_backoff=0).call("GET", lambda: sent.pop(0))
+
+    assert response is responses[2]
+    assert [response.closed for response in responses] == [True, True, False]
+
+
+def test_call_reraises_errors_that_should_not_be_retried():
+    def send():
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        RetryPolicy().call("GET", send)
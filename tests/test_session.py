@@ -0,0 +1,20 @@
+from requests import Session
+
+from twitch.session import create_session
+
+
+def test_create_session_returns_session_with_pooled_adapters():
+    session = create_session(pool_connections=3, pool_maxsize=7, pool_block=True)
+
+    assert isinstance(session, Session)
+    adapter = session.get_adapter("https://api.twitch.tv/helix/")
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+    assert adapter._pool_block is True
+    assert session.headers["Connection"] == "keep-alive"
+
+
+def test_create_session_disables_keep_alive():
+    session = create_session(keep_alive=False)
+
+    assert session.headers["Connection"] == "close"
@@ -0,0 +1,144 @@
+import asyncio
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+from twitch.api.base import BASE_URL, TwitchAPI
+from twitch.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def run_coroutine(coroutine):
+    # asyncio.run is only available from Python 3.7
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_concurrent_calls_with_same_key_share_one_call():
+    group = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def fn():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return {"id": 1}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(group.do, "key", fn)
+        started.wait()
+        followers = [executor.submit(group.do, "key", fn) for _ in range(4)]
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(calls) == 1
+    assert all(result == {"id": 1} for result in results)
+    assert group.shared == 4
+
+
+def test_waiting_callers_get_copies_of_the_result_with_copy_result():
+    group = SingleFlight()
+    started = threading.Event()
+
+    def fn():
+        started.set()
+        time.sleep(0.1)
+        return {"id": 1}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(group.do, "key", fn, copy.deepcopy)
+        started.wait()
+        follower = executor.submit(group.do, "key", fn, copy.deepcopy)
+        results = [leader.result(), follower.result()]
+
+    assert results == [{"id": 1}, {"id": 1}]
+    assert results[0] is not results[1]
+
+
+def test_calls_after_the_shared_call_finished_are_made_again():
+    group = SingleFlight()
+    calls = []
+
+    group.do("key", lambda: calls.append(1))
+    group.do("key", lambda: calls.append(1))
+
+    assert len(calls) == 2
+
+
+def test_exception_is_raised_to_every_caller():
+    group = SingleFlight()
+    started = threading.Event()
+
+    def fn():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(group.do, "key", fn)
+        started.wait()
+        follower = executor.submit(group.do, "key", fn)
+
+        with pytest.raises(ValueError):
+            leader.result()
+        with pytest.raises(ValueError):
+            follower.result()
+
+
+def test_async_single_flight_shares_coroutine_calls():
+    group = AsyncSingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*[group.do("key", fn) for _ in range(5)])
+
+    assert run_coroutine(run()) == ["result"] * 5
+    assert len(calls) == 1
+    assert group.shared == 4
+
+
+def test_async_single_flight_copies_results_with_copy_result():
+    group = AsyncSingleFlight()
+
+    async def fn():
+        await asyncio.sleep(0.05)
+        return {"id": 1}
+
+    async def run():
+        return await asyncio.gather(
+            *[group.do("key", fn, copy_result=copy.deepcopy) for _ in range(3)]
+        )
+
+    results = run_coroutine(run())
+
+    assert results == [{"id": 1}] * 3
+    assert len(set(map(id, results))) == 3
+
+
+@responses.activate
+def test_concurrent_identical_gets_share_one_request():
+    def callback(request):
+        time.sleep(0.2)
+        return (200, {}, '{"id": 1}')
+
+    responses.add_callback(responses.GET, BASE_URL, callback=callback)
+    api = TwitchAPI(client_id="client", single_flight=SingleFlight())
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(lambda _: api._request_get(""), range(5)))
+
+    assert len(responses.calls) == 1
+    assert results == [{"id": 1}] * 5
+    # Callers can't change each other's responses
+    assert len(set(map(id, results))) == 5
@@ -1,4 +1,52 @@
-from .client import TwitchClient  # noqa
-from .helix.api import TwitchHelix  # noqa
+import importlib
+import sys
 
 __version__ = "0.7.1"
+
+# Attributes imported on first access, so that `import twitch` doesn't import requests
+# and every Kraken module before they're needed
+_LAZY_ATTRIBUTES = {
+    "TwitchClient": "twitch.client",
+    "TwitchHelix": "twitch.helix.api",
+}
+
+_LAZY_SUBMODULES = (
+    "api",
+    "cache",
+    "client",
+    "columnar",
+    "conf",
+    "constants",
+    "decoders",
+    "decorators",
+    "exceptions",
+    "helix",
+    "hls",
+    "resources",
+    "retry",
+    "session",
+    "singleflight",
+)
+
+__all__ = ["TwitchClient", "TwitchHelix"]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module("{}.{}".format(__name__, name))
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Module __getattr__ (PEP 562) is only supported from Python 3.7
+    from .client import TwitchClient  # noqa
+    from .helix.api import TwitchHelix  # noqa
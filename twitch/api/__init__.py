@@ -1,13 +1,41 @@
-from .channel_feed import ChannelFeed  # noqa
-from .channels import Channels  # noqa
-from .chat import Chat  # noqa
-from .clips import Clips  # noqa
-from .collections import Collections  # noqa
-from .communities import Communities  # noqa
-from .games import Games  # noqa
-from .ingests import Ingests  # noqa
-from .search import Search  # noqa
-from .streams import Streams  # noqa
-from .teams import Teams  # noqa
-from .users import Users  # noqa
-from .videos import Videos  # noqa
+import importlib
+import sys
+
+# Kraken resources are imported on first access, so that using one of them doesn't import
+# all of them
+_LAZY_ATTRIBUTES = {
+    "ChannelFeed": "channel_feed",
+    "Channels": "channels",
+    "Chat": "chat",
+    "Clips": "clips",
+    "Collections": "collections",
+    "Communities": "communities",
+    "Games": "games",
+    "Ingests": "ingests",
+    "Search": "search",
+    "Streams": "streams",
+    "Teams": "teams",
+    "Users": "users",
+    "Videos": "videos",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    module = importlib.import_module("{}.{}".format(__name__, _LAZY_ATTRIBUTES[name]))
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Module __getattr__ (PEP 562) is only supported from Python 3.7
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
@@ -1,23 +1,61 @@
-import time
+import copy
 
-import requests
+from requests import codes
 from requests.compat import urljoin
 
+from twitch.cache import make_cache_key
 from twitch.conf import backoff_config
-from twitch.constants import BASE_URL
-
-DEFAULT_TIMEOUT = 10
+from twitch.constants import BASE_URL, DEFAULT_TIMEOUT
+from twitch.decoders import decode_response
+from twitch.retry import RetryPolicy
+from twitch.session import (
+    DEFAULT_CHUNK_SIZE,
+    create_session,
+    iter_response,
+    read_response_into,
+)
 
 
 class TwitchAPI(object):
     """Twitch API client."""
 
-    def __init__(self, client_id, oauth_token=None):
+    def __init__(
+        self,
+        client_id,
+        oauth_token=None,
+        session=None,
+        retry_policy=None,
+        cache=None,
+        single_flight=None,
+        lazy=False,
+        raw=False,
+        parse_datetimes=True,
+        config=None,
+    ):
         """Initialize the API."""
         super(TwitchAPI, self).__init__()
         self._client_id = client_id
         self._oauth_token = oauth_token
-        self._initial_backoff, self._max_retries = backoff_config()
+        self._session = session or create_session()
+        self._cache = cache
+        self._single_flight = single_flight
+        self._lazy = lazy
+        self._raw = raw
+        self._parse_datetimes = parse_datetimes
+        self._initial_backoff, self._max_retries = backoff_config(config)
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_attempts=self._max_retries + 1, initial_backoff=self._initial_backoff
+        )
+
+    def _construct(self, resource, values):
+        """Construct `resource` from the decoded JSON `values` of a response."""
+        if self._raw:
+            return values
+        if self._lazy or not self._parse_datetimes:
+            return resource.construct_from(
+                values, lazy=self._lazy, parse_datetimes=self._parse_datetimes
+            )
+        return resource.construct_from(values)
 
     def _get_request_headers(self):
         """Prepare the headers for the requests."""
@@ -31,30 +69,86 @@ class TwitchAPI(object):
 
         return headers
 
+    def _send_request(self, method, url, **kwargs):
+        """Send a HTTP request, retrying it as decided by the retry policy."""
+        return self._retry_policy.call(
+            method,
+            lambda: self._session.request(
+                method, url, timeout=DEFAULT_TIMEOUT, **kwargs
+            ),
+        )
+
     def _request_get(self, path, params=None, json=True, url=BASE_URL):
         """Perform a HTTP GET request."""
         url = urljoin(url, path)
         headers = self._get_request_headers()
 
-        response = requests.get(url, params=params, headers=headers)
-        if response.status_code >= 500:
+        if not json:
+            response = self._send_request("GET", url, params=params, headers=headers)
+            response.raise_for_status()
+            return response
 
-            backoff = self._initial_backoff
-            for _ in range(self._max_retries):
-                time.sleep(backoff)
-                backoff_response = requests.get(
-                    url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT
-                )
-                if backoff_response.status_code < 500:
-                    response = backoff_response
-                    break
-                backoff *= 2
+        if self._single_flight is not None:
+            # Concurrent identical requests share a single HTTP request, and every
+            # caller gets its own copy of the response
+            return self._single_flight.do(
+                make_cache_key(url, params, headers),
+                lambda: self._request_get_json(path, url, params, headers),
+                copy_result=copy.deepcopy,
+            )
+        return self._request_get_json(path, url, params, headers)
+
+    def _request_get_stream(self, path, params=None, url=BASE_URL):
+        """Perform a HTTP GET request without reading the body of the response."""
+        url = urljoin(url, path)
+        headers = self._get_request_headers()
+        response = self._send_request(
+            "GET", url, params=params, headers=headers, stream=True
+        )
+        if not response.ok:
+            response.close()
+        response.raise_for_status()
+        return response
+
+    def _request_stream(
+        self, path, params=None, url=BASE_URL, chunk_size=DEFAULT_CHUNK_SIZE
+    ):
+        """Perform a HTTP GET request and yield the body in chunks of bytes."""
+        response = self._request_get_stream(path, params=params, url=url)
+        return iter_response(response, chunk_size)
+
+    def _request_into(
+        self, path, output, params=None, url=BASE_URL, chunk_size=DEFAULT_CHUNK_SIZE
+    ):
+        """
+        Perform a HTTP GET request and copy the body into `output`, a writable file
+        or buffer. Returns the number of bytes copied.
+        """
+        response = self._request_get_stream(path, params=params, url=url)
+        return read_response_into(response, output, chunk_size)
+
+    def _request_get_json(self, path, url, params, headers):
+        """Perform a HTTP GET request, going through the response cache if enabled."""
+        if self._cache is None:
+            response = self._send_request("GET", url, params=params, headers=headers)
+            response.raise_for_status()
+            return decode_response(response)
+
+        key = make_cache_key(url, params, headers)
+        entry = self._cache.lookup(key)
+        if entry and self._cache.is_fresh(entry):
+            return entry.payload
+        if entry:
+            headers.update(self._cache.get_conditional_headers(entry))
+
+        response = self._send_request("GET", url, params=params, headers=headers)
+        if entry and response.status_code == codes.NOT_MODIFIED:
+            return self._cache.revalidate(key, path, entry)
 
         response.raise_for_status()
-        if json:
-            return response.json()
-        else:
-            return response
+        data = decode_response(response)
+        self._cache.store(key, path, data, response.headers)
+        return data
 
     def _request_post(self, path, data=None, params=None, url=BASE_URL):
         """Perform a HTTP POST request.."""
@@ -62,24 +156,24 @@ class TwitchAPI(object):
 
         headers = self._get_request_headers()
 
-        response = requests.post(
-            url, json=data, params=params, headers=headers, timeout=DEFAULT_TIMEOUT
+        response = self._send_request(
+            "POST", url, json=data, params=params, headers=headers
         )
         response.raise_for_status()
         if response.status_code == 200:
-            return response.json()
+            return decode_response(response)
 
     def _request_put(self, path, data=None, params=None, url=BASE_URL):
         """Perform a HTTP PUT request."""
         url = urljoin(url, path)
 
         headers = self._get_request_headers()
-        response = requests.put(
-            url, json=data, params=params, headers=headers, timeout=DEFAULT_TIMEOUT
+        response = self._send_request(
+            "PUT", url, json=data, params=params, headers=headers
         )
         response.raise_for_status()
         if response.status_code == 200:
-            return response.json()
+            return decode_response(response)
 
     def _request_delete(self, path, params=None, url=BASE_URL):
         """Perform a HTTP DELETE request."""
@@ -87,9 +181,7 @@ class TwitchAPI(object):
 
         headers = self._get_request_headers()
 
-        response = requests.delete(
-            url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT
-        )
+        response = self._send_request("DELETE", url, params=params, headers=headers)
         response.raise_for_status()
         if response.status_code == 200:
-            return response.json()
+            return decode_response(response)
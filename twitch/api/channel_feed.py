@@ -17,7 +17,7 @@ class ChannelFeed(TwitchAPI):
 
         params = {"limit": limit, "cursor": cursor, "comments": comments}
         response = self._request_get("feed/{}/posts".format(channel_id), params=params)
-        return [Post.construct_from(x) for x in response["posts"]]
+        return [self._construct(Post, x) for x in response["posts"]]
 
     def get_post(self, channel_id, post_id, comments=5):
         if comments > 5:
@@ -29,7 +29,7 @@ class ChannelFeed(TwitchAPI):
         response = self._request_get(
             "feed/{}/posts/{}".format(channel_id, post_id), params=params
         )
-        return Post.construct_from(response)
+        return self._construct(Post, response)
 
     @oauth_required
     def create_post(self, channel_id, content, share=None):
@@ -38,12 +38,12 @@ class ChannelFeed(TwitchAPI):
         response = self._request_post(
             "feed/{}/posts".format(channel_id), data, params=params
         )
-        return Post.construct_from(response["post"])
+        return self._construct(Post, response["post"])
 
     @oauth_required
     def delete_post(self, channel_id, post_id):
         response = self._request_delete("feed/{}/posts/{}".format(channel_id, post_id))
-        return Post.construct_from(response)
+        return self._construct(Post, response)
 
     @oauth_required
     def create_reaction_to_post(self, channel_id, post_id, emote_id):
@@ -71,20 +71,20 @@ class ChannelFeed(TwitchAPI):
         }
         url = "feed/{}/posts/{}/comments".format(channel_id, post_id)
         response = self._request_get(url, params=params)
-        return [Comment.construct_from(x) for x in response["comments"]]
+        return [self._construct(Comment, x) for x in response["comments"]]
 
     @oauth_required
     def create_post_comment(self, channel_id, post_id, content):
         data = {"content": content}
         url = "feed/{}/posts/{}/comments".format(channel_id, post_id)
         response = self._request_post(url, data)
-        return Comment.construct_from(response)
+        return self._construct(Comment, response)
 
     @oauth_required
     def delete_post_comment(self, channel_id, post_id, comment_id):
         url = "feed/{}/posts/{}/comments/{}".format(channel_id, post_id, comment_id)
         response = self._request_delete(url)
-        return Comment.construct_from(response)
+        return self._construct(Comment, response)
 
     @oauth_required
     def create_reaction_to_comment(self, channel_id, post_id, comment_id, emote_id):
@@ -1,4 +1,5 @@
 from twitch.api.base import TwitchAPI
+from twitch.api.pagination import DEFAULT_PAGINATION_WORKERS, OffsetPaginator
 from twitch.constants import (
     BROADCAST_TYPE_HIGHLIGHT,
     BROADCAST_TYPES,
@@ -17,11 +18,11 @@ class Channels(TwitchAPI):
     @oauth_required
     def get(self):
         response = self._request_get("channel")
-        return Channel.construct_from(response)
+        return self._construct(Channel, response)
 
     def get_by_id(self, channel_id):
         response = self._request_get("channels/{}".format(channel_id))
-        return Channel.construct_from(response)
+        return self._construct(Channel, response)
 
     @oauth_required
     def update(
@@ -39,12 +40,12 @@ class Channels(TwitchAPI):
 
         post_data = {"channel": data}
         response = self._request_put("channels/{}".format(channel_id), post_data)
-        return Channel.construct_from(response)
+        return self._construct(Channel, response)
 
     @oauth_required
     def get_editors(self, channel_id):
         response = self._request_get("channels/{}/editors".format(channel_id))
-        return [User.construct_from(x) for x in response["users"]]
+        return [self._construct(User, x) for x in response["users"]]
 
     def get_followers(
         self, channel_id, limit=25, offset=0, cursor=None, direction=DIRECTION_DESC
@@ -64,11 +65,34 @@ class Channels(TwitchAPI):
         response = self._request_get(
             "channels/{}/follows".format(channel_id), params=params
         )
-        return [Follow.construct_from(x) for x in response["follows"]]
+        return [self._construct(Follow, x) for x in response["follows"]]
+
+    def iter_followers(
+        self,
+        channel_id,
+        direction=DIRECTION_DESC,
+        workers=DEFAULT_PAGINATION_WORKERS,
+        ordered=True,
+    ):
+        """Return an iterator over every follower of the channel."""
+        if direction not in DIRECTIONS:
+            raise TwitchAttributeException(
+                "Direction is not valid. Valid values are {}".format(DIRECTIONS)
+            )
+
+        return OffsetPaginator(
+            self,
+            "channels/{}/follows".format(channel_id),
+            Follow,
+            "follows",
+            params={"direction": direction},
+            workers=workers,
+            ordered=ordered,
+        )
 
     def get_teams(self, channel_id):
         response = self._request_get("channels/{}/teams".format(channel_id))
-        return [Team.construct_from(x) for x in response["teams"]]
+        return [self._construct(Team, x) for x in response["teams"]]
 
     @oauth_required
     def get_subscribers(self, channel_id, limit=25, offset=0, direction=DIRECTION_ASC):
@@ -85,13 +109,37 @@ class Channels(TwitchAPI):
         response = self._request_get(
             "channels/{}/subscriptions".format(channel_id), params=params
         )
-        return [Subscription.construct_from(x) for x in response["subscriptions"]]
+        return [self._construct(Subscription, x) for x in response["subscriptions"]]
+
+    @oauth_required
+    def iter_subscribers(
+        self,
+        channel_id,
+        direction=DIRECTION_ASC,
+        workers=DEFAULT_PAGINATION_WORKERS,
+        ordered=True,
+    ):
+        """Return an iterator over every subscriber of the channel."""
+        if direction not in DIRECTIONS:
+            raise TwitchAttributeException(
+                "Direction is not valid. Valid values are {}".format(DIRECTIONS)
+            )
+
+        return OffsetPaginator(
+            self,
+            "channels/{}/subscriptions".format(channel_id),
+            Subscription,
+            "subscriptions",
+            params={"direction": direction},
+            workers=workers,
+            ordered=ordered,
+        )
 
     def check_subscription_by_user(self, channel_id, user_id):
         response = self._request_get(
             "channels/{}/subscriptions/{}".format(channel_id, user_id)
         )
-        return Subscription.construct_from(response)
+        return self._construct(Subscription, response)
 
     def get_videos(
         self,
@@ -130,7 +178,7 @@ class Channels(TwitchAPI):
         response = self._request_get(
             "channels/{}/videos".format(channel_id), params=params
         )
-        return [Video.construct_from(x) for x in response["videos"]]
+        return [self._construct(Video, x) for x in response["videos"]]
 
     @oauth_required
     def start_commercial(self, channel_id, duration=30):
@@ -143,11 +191,11 @@ class Channels(TwitchAPI):
     @oauth_required
     def reset_stream_key(self, channel_id):
         response = self._request_delete("channels/{}/stream_key".format(channel_id))
-        return Channel.construct_from(response)
+        return self._construct(Channel, response)
 
     def get_community(self, channel_id):
         response = self._request_get("channels/{}/community".format(channel_id))
-        return Community.construct_from(response)
+        return self._construct(Community, response)
 
     def set_community(self, channel_id, community_id):
         self._request_put("channels/{}/community/{}".format(channel_id, community_id))
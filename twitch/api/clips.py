@@ -8,7 +8,7 @@ from twitch.resources import Clip
 class Clips(TwitchAPI):
     def get_by_slug(self, slug):
         response = self._request_get("clips/{}".format(slug))
-        return Clip.construct_from(response)
+        return self._construct(Clip, response)
 
     def get_top(
         self,
@@ -41,7 +41,7 @@ class Clips(TwitchAPI):
         }
 
         response = self._request_get("clips/top", params=params)
-        return [Clip.construct_from(x) for x in response["clips"]]
+        return [self._construct(Clip, x) for x in response["clips"]]
 
     @oauth_required
     def followed(self, limit=10, cursor=None, trending=False):
@@ -53,4 +53,4 @@ class Clips(TwitchAPI):
         params = {"limit": limit, "cursor": cursor, "trending": trending}
 
         response = self._request_get("clips/followed", params=params)
-        return [Clip.construct_from(x) for x in response["clips"]]
+        return [self._construct(Clip, x) for x in response["clips"]]
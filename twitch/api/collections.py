@@ -7,14 +7,14 @@ from twitch.resources import Collection, Item
 class Collections(TwitchAPI):
     def get_metadata(self, collection_id):
         response = self._request_get("collections/{}".format(collection_id))
-        return Collection.construct_from(response)
+        return self._construct(Collection, response)
 
     def get(self, collection_id, include_all_items=False):
         params = {"include_all_items": include_all_items}
         response = self._request_get(
             "collections/{}/items".format(collection_id), params=params
         )
-        return [Item.construct_from(x) for x in response["items"]]
+        return [self._construct(Item, x) for x in response["items"]]
 
     def get_by_channel(self, channel_id, limit=10, cursor=None, containing_item=None):
         if limit > 100:
@@ -28,7 +28,7 @@ class Collections(TwitchAPI):
         if containing_item:
             params["containing_item"] = containing_item
         response = self._request_get("channels/{}/collections".format(channel_id))
-        return [Collection.construct_from(x) for x in response["collections"]]
+        return [self._construct(Collection, x) for x in response["collections"]]
 
     @oauth_required
     def create(self, channel_id, title):
@@ -38,7 +38,7 @@ class Collections(TwitchAPI):
         response = self._request_post(
             "channels/{}/collections".format(channel_id), data=data
         )
-        return Collection.construct_from(response)
+        return self._construct(Collection, response)
 
     @oauth_required
     def update(self, collection_id, title):
@@ -64,7 +64,7 @@ class Collections(TwitchAPI):
         response = self._request_put(
             "collections/{}/items".format(collection_id), data=data
         )
-        return Item.construct_from(response)
+        return self._construct(Item, response)
 
     @oauth_required
     def delete_item(self, collection_id, collection_item_id):
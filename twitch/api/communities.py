@@ -8,11 +8,11 @@ class Communities(TwitchAPI):
     def get_by_name(self, community_name):
         params = {"name": community_name}
         response = self._request_get("communities", params=params)
-        return Community.construct_from(response)
+        return self._construct(Community, response)
 
     def get_by_id(self, community_id):
         response = self._request_get("communities/{}".format(community_id))
-        return Community.construct_from(response)
+        return self._construct(Community, response)
 
     def update(
         self, community_id, summary=None, description=None, rules=None, email=None
@@ -32,7 +32,7 @@ class Communities(TwitchAPI):
             )
         params = {"limit": limit, "cursor": cursor}
         response = self._request_get("communities/top", params=params)
-        return [Community.construct_from(x) for x in response["communities"]]
+        return [self._construct(Community, x) for x in response["communities"]]
 
     @oauth_required
     def get_banned_users(self, community_id, limit=10, cursor=None):
@@ -45,7 +45,7 @@ class Communities(TwitchAPI):
         response = self._request_get(
             "communities/{}/bans".format(community_id), params=params
         )
-        return [User.construct_from(x) for x in response["banned_users"]]
+        return [self._construct(User, x) for x in response["banned_users"]]
 
     @oauth_required
     def ban_user(self, community_id, user_id):
@@ -83,7 +83,7 @@ class Communities(TwitchAPI):
 
     def get_moderators(self, community_id):
         response = self._request_get("communities/{}/moderators".format(community_id))
-        return [User.construct_from(x) for x in response["moderators"]]
+        return [self._construct(User, x) for x in response["moderators"]]
 
     @oauth_required
     def add_moderator(self, community_id, user_id):
@@ -119,7 +119,7 @@ class Communities(TwitchAPI):
         response = self._request_get(
             "communities/{}/timeouts".format(community_id), params=params
         )
-        return [User.construct_from(x) for x in response["timed_out_users"]]
+        return [self._construct(User, x) for x in response["timed_out_users"]]
 
     @oauth_required
     def add_timed_out_user(self, community_id, user_id, duration, reason=None):
@@ -1,4 +1,5 @@
 from twitch.api.base import TwitchAPI
+from twitch.api.pagination import DEFAULT_PAGINATION_WORKERS, OffsetPaginator
 from twitch.exceptions import TwitchAttributeException
 from twitch.resources import TopGame
 
@@ -12,4 +13,10 @@ class Games(TwitchAPI):
 
         params = {"limit": limit, "offset": offset}
         response = self._request_get("games/top", params=params)
-        return [TopGame.construct_from(x) for x in response["top"]]
+        return [self._construct(TopGame, x) for x in response["top"]]
+
+    def iter_top(self, workers=DEFAULT_PAGINATION_WORKERS, ordered=True):
+        """Return an iterator over every game, sorted by the number of viewers."""
+        return OffsetPaginator(
+            self, "games/top", TopGame, "top", workers=workers, ordered=ordered
+        )
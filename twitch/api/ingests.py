@@ -5,4 +5,4 @@ from twitch.resources import Ingest
 class Ingests(TwitchAPI):
     def get_server_list(self):
         response = self._request_get("ingests")
-        return [Ingest.construct_from(x) for x in response["ingests"]]
+        return [self._construct(Ingest, x) for x in response["ingests"]]
@@ -0,0 +1,85 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+from twitch.columnar import ColumnarMixin
+from twitch.exceptions import TwitchAttributeException
+
+MAX_PAGE_SIZE = 100
+DEFAULT_PAGINATION_WORKERS = 4
+
+
+class OffsetPaginator(ColumnarMixin):
+    """
+    Iterates over every item of an API v5 list endpoint paginated with `limit` and
+    `offset`.
+
+    The first page is fetched on its own to read `_total`, the remaining offset
+    windows are then fetched by `workers` threads, with at most `workers` pages in
+    flight at a time. Items are yielded in order if `ordered` is True, otherwise
+    pages are yielded as soon as they arrive.
+    """
+
+    def __init__(
+        self,
+        api,
+        path,
+        resource,
+        items_key,
+        params=None,
+        limit=MAX_PAGE_SIZE,
+        workers=DEFAULT_PAGINATION_WORKERS,
+        ordered=True,
+    ):
+        if limit > MAX_PAGE_SIZE:
+            raise TwitchAttributeException(
+                "Maximum number of objects returned in one request is 100"
+            )
+        if workers < 1:
+            raise TwitchAttributeException("At least one worker is required")
+        self._api = api
+        self._path = path
+        self._resource = resource
+        self._items_key = items_key
+        self._params = params or {}
+        self._limit = limit
+        self._workers = workers
+        self._ordered = ordered
+        self.total = None
+
+    def _fetch_page(self, offset):
+        params = dict(self._params, limit=self._limit, offset=offset)
+        return self._api._request_get(self._path, params=params)
+
+    def _construct_page(self, response):
+        return [
+            self._api._construct(self._resource, x)
+            for x in response[self._items_key] or []
+        ]
+
+    def __iter__(self):
+        response = self._fetch_page(0)
+        self.total = response.get("_total", 0)
+        for item in self._construct_page(response):
+            yield item
+
+        offsets = iter(range(self._limit, self.total, self._limit))
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+
+            def submit():
+                for offset in islice(offsets, self._workers - len(pending)):
+                    pending.append(executor.submit(self._fetch_page, offset))
+
+            submit()
+            while pending:
+                if self._ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = next(iter(done))
+                    pending.remove(future)
+                response = future.result()
+                submit()
+                for item in self._construct_page(response):
+                    yield item
@@ -1,4 +1,5 @@
 from twitch.api.base import TwitchAPI
+from twitch.api.pagination import DEFAULT_PAGINATION_WORKERS, OffsetPaginator
 from twitch.exceptions import TwitchAttributeException
 from twitch.resources import Channel, Game, Stream
 
@@ -12,7 +13,19 @@ class Search(TwitchAPI):
 
         params = {"query": query, "limit": limit, "offset": offset}
         response = self._request_get("search/channels", params=params)
-        return [Channel.construct_from(x) for x in response["channels"] or []]
+        return [self._construct(Channel, x) for x in response["channels"] or []]
+
+    def iter_channels(self, query, workers=DEFAULT_PAGINATION_WORKERS, ordered=True):
+        """Return an iterator over every channel matching the query."""
+        return OffsetPaginator(
+            self,
+            "search/channels",
+            Channel,
+            "channels",
+            params={"query": query},
+            workers=workers,
+            ordered=ordered,
+        )
 
     def games(self, query, live=False):
         params = {
@@ -20,7 +33,7 @@ class Search(TwitchAPI):
             "live": live,
         }
         response = self._request_get("search/games", params=params)
-        return [Game.construct_from(x) for x in response["games"] or []]
+        return [self._construct(Game, x) for x in response["games"] or []]
 
     def streams(self, query, limit=25, offset=0, hls=None):
         if limit > 100:
@@ -30,4 +43,4 @@ class Search(TwitchAPI):
 
         params = {"query": query, "limit": limit, "offset": offset, "hls": hls}
         response = self._request_get("search/streams", params=params)
-        return [Stream.construct_from(x) for x in response["streams"] or []]
+        return [self._construct(Stream, x) for x in response["streams"] or []]
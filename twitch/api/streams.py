@@ -1,4 +1,5 @@
 from twitch.api.base import TwitchAPI
+from twitch.api.pagination import DEFAULT_PAGINATION_WORKERS, OffsetPaginator
 from twitch.constants import STREAM_TYPE_LIVE, STREAM_TYPES
 from twitch.decorators import oauth_required
 from twitch.exceptions import TwitchAttributeException
@@ -19,7 +20,7 @@ class Streams(TwitchAPI):
 
         if not response["stream"]:
             return None
-        return Stream.construct_from(response["stream"])
+        return self._construct(Stream, response["stream"])
 
     def get_live_streams(
         self,
@@ -43,7 +44,34 @@ class Streams(TwitchAPI):
         if language is not None:
             params["language"] = language
         response = self._request_get("streams", params=params)
-        return [Stream.construct_from(x) for x in response["streams"]]
+        return [self._construct(Stream, x) for x in response["streams"]]
+
+    def iter_live_streams(
+        self,
+        channel=None,
+        game=None,
+        language=None,
+        stream_type=STREAM_TYPE_LIVE,
+        workers=DEFAULT_PAGINATION_WORKERS,
+        ordered=True,
+    ):
+        """Return an iterator over every stream matching the filters."""
+        params = {"stream_type": stream_type}
+        if channel is not None:
+            params["channel"] = channel
+        if game is not None:
+            params["game"] = game
+        if language is not None:
+            params["language"] = language
+        return OffsetPaginator(
+            self,
+            "streams",
+            Stream,
+            "streams",
+            params=params,
+            workers=workers,
+            ordered=ordered,
+        )
 
     def get_summary(self, game=None):
         params = {}
@@ -60,7 +88,7 @@ class Streams(TwitchAPI):
 
         params = {"limit": limit, "offset": offset}
         response = self._request_get("streams/featured", params=params)
-        return [Featured.construct_from(x) for x in response["featured"]]
+        return [self._construct(Featured, x) for x in response["featured"]]
 
     @oauth_required
     def get_followed(self, stream_type=STREAM_TYPE_LIVE, limit=25, offset=0):
@@ -75,9 +103,9 @@ class Streams(TwitchAPI):
 
         params = {"stream_type": stream_type, "limit": limit, "offset": offset}
         response = self._request_get("streams/followed", params=params)
-        return [Stream.construct_from(x) for x in response["streams"]]
+        return [self._construct(Stream, x) for x in response["streams"]]
 
     def get_streams_in_community(self, community_id):
         response = self._request_get("streams?community_id={}".format(community_id))
 
-        return [Stream.construct_from(x) for x in response["streams"]]
+        return [self._construct(Stream, x) for x in response["streams"]]
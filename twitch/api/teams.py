@@ -1,4 +1,5 @@
 from twitch.api.base import TwitchAPI
+from twitch.api.pagination import DEFAULT_PAGINATION_WORKERS, OffsetPaginator
 from twitch.exceptions import TwitchAttributeException
 from twitch.resources import Team
 
@@ -6,7 +7,7 @@ from twitch.resources import Team
 class Teams(TwitchAPI):
     def get(self, team_name):
         response = self._request_get("teams/{}".format(team_name))
-        return Team.construct_from(response)
+        return self._construct(Team, response)
 
     def get_all(self, limit=10, offset=0):
         if limit > 100:
@@ -16,4 +17,10 @@ class Teams(TwitchAPI):
 
         params = {"limit": limit, "offset": offset}
         response = self._request_get("teams", params=params)
-        return [Team.construct_from(x) for x in response["teams"]]
+        return [self._construct(Team, x) for x in response["teams"]]
+
+    def iter_all(self, workers=DEFAULT_PAGINATION_WORKERS, ordered=True):
+        """Return an iterator over every team."""
+        return OffsetPaginator(
+            self, "teams", Team, "teams", workers=workers, ordered=ordered
+        )
@@ -1,4 +1,5 @@
 from twitch.api.base import TwitchAPI
+from twitch.api.pagination import OffsetPaginator
 from twitch.constants import (
     DIRECTION_DESC,
     DIRECTIONS,
@@ -15,11 +16,11 @@ class Users(TwitchAPI):
     @oauth_required
     def get(self):
         response = self._request_get("user")
-        return User.construct_from(response)
+        return self._construct(User, response)
 
     def get_by_id(self, user_id):
         response = self._request_get("users/{}".format(user_id))
-        return User.construct_from(response)
+        return self._construct(User, response)
 
     @oauth_required
     def get_emotes(self, user_id):
@@ -31,11 +32,29 @@ class Users(TwitchAPI):
         response = self._request_get(
             "users/{}/subscriptions/{}".format(user_id, channel_id)
         )
-        return Subscription.construct_from(response)
+        return self._construct(Subscription, response)
 
     def get_all_follows(
         self, user_id, direction=DIRECTION_DESC, sort_by=USERS_SORT_BY_CREATED_AT
     ):
+        return list(
+            self.iter_all_follows(user_id, direction=direction, sort_by=sort_by)
+        )
+
+    def iter_all_follows(
+        self,
+        user_id,
+        direction=DIRECTION_DESC,
+        sort_by=USERS_SORT_BY_CREATED_AT,
+        workers=1,
+    ):
+        """
+        Return an iterator over every follow of `user_id`, fetching one page at a time.
+
+        With `workers` greater than 1, the offsets of the remaining pages are computed
+        from the `_total` of the first page and up to `workers` pages are fetched
+        concurrently. Follows are yielded in order either way.
+        """
         if direction not in DIRECTIONS:
             raise TwitchAttributeException(
                 "Direction is not valid. Valid values are {}".format(DIRECTIONS)
@@ -44,17 +63,25 @@ class Users(TwitchAPI):
             raise TwitchAttributeException(
                 "Sort by is not valid. Valid values are {}".format(USERS_SORT_BY)
             )
+        path = "users/{}/follows/channels".format(user_id)
+        params = {"direction": direction}
+        if workers > 1:
+            return iter(
+                OffsetPaginator(
+                    self, path, Follow, "follows", params=params, workers=workers
+                )
+            )
+        return self._iter_follows(path, params)
+
+    def _iter_follows(self, path, params):
         offset = 0
-        params = {"limit": MAX_FOLLOWS_LIMIT, "direction": direction}
-        follows = []
         while offset is not None:
-            params.update({"offset": offset})
             response = self._request_get(
-                "users/{}/follows/channels".format(user_id), params=params
+                path, params=dict(params, limit=MAX_FOLLOWS_LIMIT, offset=offset)
             )
             offset = response.get("_offset")
-            follows.extend(response["follows"])
-        return [Follow.construct_from(x) for x in follows]
+            for follow in response["follows"]:
+                yield self._construct(Follow, follow)
 
     def get_follows(
         self,
@@ -80,13 +107,13 @@ class Users(TwitchAPI):
         response = self._request_get(
             "users/{}/follows/channels".format(user_id), params=params
         )
-        return [Follow.construct_from(x) for x in response["follows"]]
+        return [self._construct(Follow, x) for x in response["follows"]]
 
     def check_follows_channel(self, user_id, channel_id):
         response = self._request_get(
             "users/{}/follows/channels/{}".format(user_id, channel_id)
         )
-        return Follow.construct_from(response)
+        return self._construct(Follow, response)
 
     @oauth_required
     def follow_channel(self, user_id, channel_id, notifications=False):
@@ -94,7 +121,7 @@ class Users(TwitchAPI):
         response = self._request_put(
             "users/{}/follows/channels/{}".format(user_id, channel_id), data
         )
-        return Follow.construct_from(response)
+        return self._construct(Follow, response)
 
     @oauth_required
     def unfollow_channel(self, user_id, channel_id):
@@ -109,14 +136,14 @@ class Users(TwitchAPI):
 
         params = {"limit": limit, "offset": offset}
         response = self._request_get("users/{}/blocks".format(user_id), params=params)
-        return [UserBlock.construct_from(x) for x in response["blocks"]]
+        return [self._construct(UserBlock, x) for x in response["blocks"]]
 
     @oauth_required
     def block_user(self, user_id, blocked_user_id):
         response = self._request_put(
             "users/{}/blocks/{}".format(user_id, blocked_user_id)
         )
-        return UserBlock.construct_from(response)
+        return self._construct(UserBlock, response)
 
     @oauth_required
     def unblock_user(self, user_id, blocked_user_id):
@@ -127,4 +154,4 @@ class Users(TwitchAPI):
             usernames = ",".join(usernames)
 
         response = self._request_get("users?login={}".format(usernames))
-        return [User.construct_from(x) for x in response["users"]]
+        return [self._construct(User, x) for x in response["users"]]
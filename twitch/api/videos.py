@@ -8,13 +8,14 @@ from twitch.constants import (
 )
 from twitch.decorators import oauth_required
 from twitch.exceptions import TwitchAttributeException
+from twitch.hls import DEFAULT_DOWNLOAD_WORKERS, HLSDownloader
 from twitch.resources import Video
 
 
 class Videos(TwitchAPI):
     def get_by_id(self, video_id):
         response = self._request_get("videos/{}".format(video_id))
-        return Video.construct_from(response)
+        return self._construct(Video, response)
 
     def get_top(
         self,
@@ -49,7 +50,7 @@ class Videos(TwitchAPI):
         }
 
         response = self._request_get("videos/top", params=params)
-        return [Video.construct_from(x) for x in response["vods"]]
+        return [self._construct(Video, x) for x in response["vods"]]
 
     @oauth_required
     def get_followed_videos(
@@ -70,19 +71,50 @@ class Videos(TwitchAPI):
         params = {"limit": limit, "offset": offset, "broadcast_type": broadcast_type}
 
         response = self._request_get("videos/followed", params=params)
-        return [Video.construct_from(x) for x in response["videos"]]
+        return [self._construct(Video, x) for x in response["videos"]]
 
-    def download_vod(self, video_id):
+    def download_vod(self, video_id, output=None):
         """
         This will return a byte string of the M3U8 playlist data
         (which contains more links to segments of the vod)
+
+        If `output`, a writable file or buffer, is given, the playlist is streamed
+        into it instead and the number of bytes written is returned.
         """
         vod_id = video_id[1:]
         token = self._request_get(
             "vods/{}/access_token".format(vod_id), url="https://api.twitch.tv/api/"
         )
         params = {"nauthsig": token["sig"], "nauth": token["token"]}
+        if output is not None:
+            return self._request_into(
+                "vod/{}".format(vod_id), output, url=VOD_FETCH_URL, params=params
+            )
         m3u8 = self._request_get(
             "vod/{}".format(vod_id), url=VOD_FETCH_URL, params=params, json=False
         )
         return m3u8.content
+
+    def save_vod(
+        self,
+        video_id,
+        output,
+        quality=None,
+        workers=DEFAULT_DOWNLOAD_WORKERS,
+        resume=True,
+        progress=None,
+    ):
+        """
+        Download the segments of a VOD concurrently and write them in order to
+        `output`, a path or a writable binary file. Returns `twitch.hls.DownloadStats`.
+        """
+        downloader = HLSDownloader(
+            session=self._session, workers=workers, retry_policy=self._retry_policy
+        )
+        return downloader.download(
+            self.download_vod(video_id),
+            output,
+            quality=quality,
+            resume=resume,
+            progress=progress,
+        )
@@ -0,0 +1,259 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from twitch.decoders import decode_json
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 60
+
+CacheEntry = namedtuple("CacheEntry", ["payload", "etag", "last_modified", "expires"])
+
+
+def make_cache_key(url, params=None, headers=None):
+    """
+    Build a cache key from the URL, query parameters and credentials of a request,
+    so that responses are never shared between different tokens.
+    """
+    headers = headers or {}
+    parts = [
+        url,
+        sorted((params or {}).items()),
+        headers.get("Client-ID"),
+        headers.get("Authorization"),
+    ]
+    return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+
+
+class ResponseCache(object):
+    """
+    Cache for decoded JSON responses of GET requests.
+
+    Entries expire after `ttl` seconds. `ttls` maps path prefixes to their own
+    TTL, e.g. `{"users": 3600, "streams": 0}`, the longest matching prefix wins
+    and a TTL of 0 disables caching for those paths. Expired entries that came
+    with an `ETag` or `Last-Modified` header are revalidated with a conditional
+    request instead of being fetched again. At most `maxsize` entries are kept,
+    the least recently used ones are evicted first.
+
+    Subclasses implement the storage in `_get`, `_set` and `clear`.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE, ttl=DEFAULT_CACHE_TTL, ttls=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = sorted((ttls or {}).items(), key=lambda x: len(x[0]), reverse=True)
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._stats_lock = threading.Lock()
+
+    def _get(self, key):
+        raise NotImplementedError()
+
+    def _set(self, key, entry):
+        raise NotImplementedError()
+
+    def clear(self):
+        raise NotImplementedError()
+
+    def _count(self, name):
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    @property
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+        }
+
+    def get_ttl(self, path):
+        path = path.lstrip("/")
+        for prefix, ttl in self.ttls:
+            if path.startswith(prefix):
+                return ttl
+        return self.ttl
+
+    def lookup(self, key):
+        """
+        Return the cached entry for `key`, or None if there's nothing usable.
+
+        Fresh entries count as hits, everything else counts as a miss. Stale
+        entries are still returned if they can be revalidated.
+        """
+        entry = self._get(key)
+        if entry is not None and entry.expires > time.time():
+            self._count("hits")
+            return entry
+
+        self._count("misses")
+        if entry is not None and (entry.etag or entry.last_modified):
+            return entry
+        return None
+
+    @staticmethod
+    def is_fresh(entry):
+        return entry.expires > time.time()
+
+    @staticmethod
+    def get_conditional_headers(entry):
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, key, path, payload, headers):
+        """Cache `payload` of a successful response under `key`."""
+        ttl = self.get_ttl(path)
+        if ttl <= 0:
+            return
+        entry = CacheEntry(
+            payload=payload,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            expires=time.time() + ttl,
+        )
+        self._set(key, entry)
+
+    def revalidate(self, key, path, entry):
+        """Extend the life of `entry` after the server responded with 304."""
+        self._count("revalidations")
+        entry = entry._replace(expires=time.time() + self.get_ttl(path))
+        self._set(key, entry)
+        return entry.payload
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-memory LRU response cache shared by the threads of a process.
+
+    Payloads are stored serialized and decoded on every lookup like in
+    `DiskCache`, so callers modifying a returned payload don't change the cache.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE, ttl=DEFAULT_CACHE_TTL, ttls=None):
+        super(MemoryCache, self).__init__(maxsize=maxsize, ttl=ttl, ttls=ttls)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        return entry._replace(payload=decode_json(entry.payload))
+
+    def _set(self, key, entry):
+        entry = entry._replace(payload=json.dumps(entry.payload))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache(ResponseCache):
+    """
+    Persistent LRU response cache stored in a SQLite database at `path`.
+
+    Lookups don't write to the database. The access times of hits are kept in
+    memory and written with the next store or on `close`, so the eviction order
+    only knows about hits that have been written by then.
+    """
+
+    def __init__(
+        self, path, maxsize=DEFAULT_CACHE_SIZE, ttl=DEFAULT_CACHE_TTL, ttls=None
+    ):
+        super(DiskCache, self).__init__(maxsize=maxsize, ttl=ttl, ttls=ttls)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        # Access times of hits that haven't been written yet
+        self._accessed = {}
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, payload TEXT, etag TEXT, last_modified TEXT, "
+                "expires REAL, accessed REAL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed "
+                "ON responses (accessed)"
+            )
+
+    def __len__(self):
+        with self._lock:
+            cursor = self._connection.execute("SELECT COUNT(*) FROM responses")
+            return cursor.fetchone()[0]
+
+    def _get(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload, etag, last_modified, expires FROM responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+        payload, etag, last_modified, expires = row
+        return CacheEntry(decode_json(payload), etag, last_modified, expires)
+
+    def _write_accessed(self):
+        # Must be called with the lock held, inside a transaction
+        if self._accessed:
+            self._connection.executemany(
+                "UPDATE responses SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _set(self, key, entry):
+        with self._lock, self._connection:
+            self._accessed.pop(key, None)
+            self._write_accessed()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    json.dumps(entry.payload),
+                    entry.etag,
+                    entry.last_modified,
+                    entry.expires,
+                    time.time(),
+                ),
+            )
+            size = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+            if size > self.maxsize:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY accessed LIMIT ?)",
+                    (size - self.maxsize,),
+                )
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._accessed.clear()
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            with self._connection:
+                self._write_accessed()
+            self._connection.close()
@@ -14,6 +14,7 @@ from .api import (
     Videos,
 )
 from .conf import credentials_from_config_file
+from .session import create_session
 
 
 class TwitchClient(object):
@@ -21,12 +22,32 @@ class TwitchClient(object):
     Twitch API v5 [kraken]
     """
 
-    def __init__(self, client_id=None, oauth_token=None):
+    def __init__(
+        self,
+        client_id=None,
+        oauth_token=None,
+        session=None,
+        retry_policy=None,
+        cache=None,
+        single_flight=None,
+        lazy=False,
+        raw=False,
+        parse_datetimes=True,
+        config=None,
+    ):
         self._client_id = client_id
         self._oauth_token = oauth_token
+        self._session = session or create_session()
+        self._retry_policy = retry_policy
+        self._cache = cache
+        self._single_flight = single_flight
+        self._lazy = lazy
+        self._raw = raw
+        self._parse_datetimes = parse_datetimes
+        self._config = config
 
         if not client_id:
-            self._client_id, self._oauth_token = credentials_from_config_file()
+            self._client_id, self._oauth_token = credentials_from_config_file(config)
 
         self._clips = None
         self._channel_feed = None
@@ -42,104 +63,94 @@ class TwitchClient(object):
         self._users = None
         self._videos = None
 
+    def _create_api(self, api_class):
+        return api_class(
+            client_id=self._client_id,
+            oauth_token=self._oauth_token,
+            session=self._session,
+            retry_policy=self._retry_policy,
+            cache=self._cache,
+            single_flight=self._single_flight,
+            lazy=self._lazy,
+            raw=self._raw,
+            parse_datetimes=self._parse_datetimes,
+            config=self._config,
+        )
+
     @property
     def channel_feed(self):
         if not self._channel_feed:
-            self._channel_feed = ChannelFeed(
-                client_id=self._client_id, oauth_token=self._oauth_token
-            )
+            self._channel_feed = self._create_api(ChannelFeed)
         return self._channel_feed
 
     @property
     def clips(self):
         if not self._clips:
-            self._clips = Clips(
-                client_id=self._client_id, oauth_token=self._oauth_token
-            )
+            self._clips = self._create_api(Clips)
         return self._clips
 
     @property
     def channels(self):
         if not self._channels:
-            self._channels = Channels(
-                client_id=self._client_id, oauth_token=self._oauth_token
-            )
+            self._channels = self._create_api(Channels)
         return self._channels
 
     @property
     def chat(self):
         if not self._chat:
-            self._chat = Chat(client_id=self._client_id, oauth_token=self._oauth_token)
+            self._chat = self._create_api(Chat)
         return self._chat
 
     @property
     def collections(self):
         if not self._collections:
-            self._collections = Collections(
-                client_id=self._client_id, oauth_token=self._oauth_token
-            )
+            self._collections = self._create_api(Collections)
         return self._collections
 
     @property
     def communities(self):
         if not self._communities:
-            self._communities = Communities(
-                client_id=self._client_id, oauth_token=self._oauth_token
-            )
+            self._communities = self._create_api(Communities)
         return self._communities
 
     @property
     def games(self):
         if not self._games:
-            self._games = Games(
-                client_id=self._client_id, oauth_token=self._oauth_token
-            )
+            self._games = self._create_api(Games)
         return self._games
 
     @property
     def ingests(self):
         if not self._ingests:
-            self._ingests = Ingests(
-                client_id=self._client_id, oauth_token=self._oauth_token
-            )
+            self._ingests = self._create_api(Ingests)
         return self._ingests
 
     @property
     def search(self):
         if not self._search:
-            self._search = Search(
-                client_id=self._client_id, oauth_token=self._oauth_token
-            )
+            self._search = self._create_api(Search)
         return self._search
 
     @property
     def streams(self):
         if not self._streams:
-            self._streams = Streams(
-                client_id=self._client_id, oauth_token=self._oauth_token
-            )
+            self._streams = self._create_api(Streams)
         return self._streams
 
     @property
     def teams(self):
         if not self._teams:
-            self._teams = Teams(
-                client_id=self._client_id, oauth_token=self._oauth_token
-            )
+            self._teams = self._create_api(Teams)
         return self._teams
 
     @property
     def users(self):
         if not self._users:
-            self._users = Users(
-                client_id=self._client_id, oauth_token=self._oauth_token
-            )
+            self._users = self._create_api(Users)
         return self._users
 
     @property
     def videos(self):
         if not self._videos:
-            self._videos = Videos(
-                client_id=self._client_id, oauth_token=self._oauth_token
-            )
+            self._videos = self._create_api(Videos)
         return self._videos
@@ -0,0 +1,301 @@
+import importlib
+from datetime import datetime, timezone
+from itertools import islice
+
+from twitch.exceptions import TwitchAttributeException, TwitchException
+
+INT = "int"
+FLOAT = "float"
+BOOL = "bool"
+STRING = "string"
+DATETIME = "datetime"
+CATEGORY = "category"
+
+DTYPES = (INT, FLOAT, BOOL, STRING, DATETIME, CATEGORY)
+
+DEFAULT_BATCH_SIZE = 10000
+
+_CHUNK_SIZE = 1000
+
+HELIX_STREAM_SCHEMA = {
+    "id": STRING,
+    "user_id": STRING,
+    "user_login": STRING,
+    "game_id": CATEGORY,
+    "type": CATEGORY,
+    "title": STRING,
+    "viewer_count": INT,
+    "started_at": DATETIME,
+    "language": CATEGORY,
+}
+
+HELIX_FOLLOW_SCHEMA = {
+    "from_id": STRING,
+    "from_login": STRING,
+    "to_id": STRING,
+    "to_login": STRING,
+    "followed_at": DATETIME,
+}
+
+
+def _import(name):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise TwitchException(
+            "{} is required for columnar export, install it with "
+            "`pip install {}`".format(name, name)
+        )
+
+
+def _get_value(item, path):
+    # Dotted paths like `channel.name` select fields of nested objects
+    for key in path.split("."):
+        if item is None:
+            return None
+        item = item.get(key)
+    return item
+
+
+def _to_datetime64_values(values):
+    for value in values:
+        if value is None:
+            yield "NaT"
+        elif isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            yield value
+        else:
+            # numpy doesn't accept the `Z` suffix
+            yield value.rstrip("Zz")
+
+
+class ColumnBuffers(object):
+    """
+    Accumulates resources, or the dictionaries returned in raw mode, into one list
+    per column and converts them to NumPy, Arrow or pandas with declared dtypes.
+
+    `schema` maps column names to one of the dtypes in `DTYPES`. Column names can
+    be dotted paths selecting fields of nested objects, e.g. `channel.name`.
+    """
+
+    def __init__(self, schema):
+        for name, dtype in schema.items():
+            if dtype not in DTYPES:
+                raise TwitchAttributeException(
+                    "Dtype {} of column {} is not valid. Valid values are {}".format(
+                        dtype, name, DTYPES
+                    )
+                )
+        self.schema = dict(schema)
+        self.columns = {name: [] for name in schema}
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def extend(self, items):
+        # Fill the columns a chunk at a time, so that a cursor's items don't all have
+        # to be held in memory at once
+        iterator = iter(items)
+        while True:
+            chunk = list(islice(iterator, _CHUNK_SIZE))
+            if not chunk:
+                return
+            for name, column in self.columns.items():
+                if "." in name:
+                    column.extend([_get_value(item, name) for item in chunk])
+                else:
+                    column.extend([item.get(name) for item in chunk])
+
+    def append(self, item):
+        for name, column in self.columns.items():
+            column.append(_get_value(item, name) if "." in name else item.get(name))
+
+    def clear(self):
+        for column in self.columns.values():
+            del column[:]
+
+    def _numpy_array(self, np, dtype, values):
+        if dtype == DATETIME:
+            return np.array(list(_to_datetime64_values(values)), dtype="datetime64[us]")
+        if dtype in (INT, FLOAT, BOOL):
+            if None in values:
+                # NumPy has no missing integers or booleans
+                return np.array(
+                    [np.nan if value is None else value for value in values],
+                    dtype="float64",
+                )
+            return np.array(
+                values, dtype={INT: "int64", FLOAT: "float64", BOOL: "bool"}[dtype]
+            )
+        return np.array(values, dtype=object)
+
+    def to_numpy(self):
+        """Return a NumPy record array with a field for every column."""
+        np = _import("numpy")
+        arrays = [
+            self._numpy_array(np, self.schema[name], values)
+            for name, values in self.columns.items()
+        ]
+        return np.rec.fromarrays(arrays, names=list(self.columns))
+
+    def _arrow_array(self, pa, dtype, values):
+        if dtype == DATETIME:
+            np = _import("numpy")
+            array = pa.array(self._numpy_array(np, dtype, values))
+            return array.cast(pa.timestamp("us", tz="UTC"))
+        if dtype == CATEGORY:
+            return pa.array(values, type=pa.string()).dictionary_encode()
+        arrow_type = {
+            INT: pa.int64(),
+            FLOAT: pa.float64(),
+            BOOL: pa.bool_(),
+            STRING: pa.string(),
+        }[dtype]
+        return pa.array(values, type=arrow_type)
+
+    def to_arrow(self):
+        """Return a `pyarrow.Table` with a column for every column."""
+        pa = _import("pyarrow")
+        return pa.table(
+            {
+                name: self._arrow_array(pa, self.schema[name], values)
+                for name, values in self.columns.items()
+            }
+        )
+
+    def to_pandas(self):
+        """
+        Return a `pandas.DataFrame`, using nullable and categorical dtypes. Floats
+        are float64 with NaN for missing values, since the nullable Float64 dtype
+        needs pandas 1.2.
+        """
+        pd = _import("pandas")
+        np = _import("numpy")
+        data = {}
+        for name, values in self.columns.items():
+            dtype = self.schema[name]
+            if dtype == DATETIME:
+                data[name] = pd.Series(
+                    self._numpy_array(np, dtype, values)
+                ).dt.tz_localize("UTC")
+            elif dtype == CATEGORY:
+                data[name] = pd.Categorical(values)
+            elif dtype in (INT, BOOL):
+                data[name] = pd.array(
+                    values, dtype={INT: "Int64", BOOL: "boolean"}[dtype]
+                )
+            elif dtype == FLOAT:
+                data[name] = pd.array(
+                    [np.nan if value is None else value for value in values],
+                    dtype="float64",
+                )
+            else:
+                data[name] = pd.array(values, dtype="string")
+        return pd.DataFrame(data, columns=list(self.columns))
+
+    def to_format(self, output):
+        try:
+            convert = {
+                "numpy": self.to_numpy,
+                "arrow": self.to_arrow,
+                "pandas": self.to_pandas,
+            }[output]
+        except KeyError:
+            raise TwitchAttributeException(
+                "Output {} is not valid. Valid values are numpy, arrow and pandas".format(
+                    output
+                )
+            )
+        return convert()
+
+
+def to_columns(items, schema):
+    """Return `ColumnBuffers` filled with `items`."""
+    buffers = ColumnBuffers(schema)
+    buffers.extend(items)
+    return buffers
+
+
+def to_numpy(items, schema):
+    return to_columns(items, schema).to_numpy()
+
+
+def to_arrow(items, schema):
+    return to_columns(items, schema).to_arrow()
+
+
+def to_pandas(items, schema):
+    return to_columns(items, schema).to_pandas()
+
+
+def iter_batches(items, schema, batch_size=DEFAULT_BATCH_SIZE, output="arrow"):
+    """
+    Yield `items` converted to `output`, "numpy", "arrow" or "pandas", in batches
+    of up to `batch_size` rows, so that only one batch is held in memory.
+    """
+    buffers = ColumnBuffers(schema)
+    iterator = iter(items)
+    while True:
+        buffers.extend(islice(iterator, batch_size))
+        if not len(buffers):
+            return
+        yield buffers.to_format(output)
+        buffers.clear()
+
+
+class ColumnarMixin(object):
+    """Adds columnar export to iterables of resources such as cursors."""
+
+    def to_numpy(self, schema):
+        """Fetch every remaining item into a NumPy record array."""
+        return to_numpy(self, schema)
+
+    def to_arrow(self, schema):
+        """Fetch every remaining item into a `pyarrow.Table`."""
+        return to_arrow(self, schema)
+
+    def to_pandas(self, schema):
+        """Fetch every remaining item into a `pandas.DataFrame`."""
+        return to_pandas(self, schema)
+
+    def iter_batches(self, schema, batch_size=DEFAULT_BATCH_SIZE, output="arrow"):
+        """Fetch the remaining items in batches of `batch_size` rows."""
+        return iter_batches(self, schema, batch_size=batch_size, output=output)
+
+
+class AsyncColumnarMixin(object):
+    """Counterpart of `ColumnarMixin` for async iterables such as async cursors."""
+
+    async def _fill_columns(self, buffers, limit=None):
+        async for item in self:
+            buffers.append(item)
+            if limit is not None and len(buffers) >= limit:
+                return
+
+    async def _to_columns(self, schema):
+        buffers = ColumnBuffers(schema)
+        await self._fill_columns(buffers)
+        return buffers
+
+    async def to_numpy(self, schema):
+        """Fetch every remaining item into a NumPy record array."""
+        return (await self._to_columns(schema)).to_numpy()
+
+    async def to_arrow(self, schema):
+        """Fetch every remaining item into a `pyarrow.Table`."""
+        return (await self._to_columns(schema)).to_arrow()
+
+    async def to_pandas(self, schema):
+        """Fetch every remaining item into a `pandas.DataFrame`."""
+        return (await self._to_columns(schema)).to_pandas()
+
+    async def iter_batches(self, schema, batch_size=DEFAULT_BATCH_SIZE, output="arrow"):
+        """Fetch the remaining items in batches of `batch_size` rows."""
+        buffers = ColumnBuffers(schema)
+        while True:
+            await self._fill_columns(buffers, limit=batch_size)
+            if not len(buffers):
+                return
+            yield buffers.to_format(output)
+            buffers.clear()
@@ -1,34 +1,121 @@
 import os
+import threading
 from configparser import ConfigParser
 
 from twitch.constants import CONFIG_FILE_PATH
 
+DEFAULT_INITIAL_BACKOFF = 0.5
+DEFAULT_MAX_RETRIES = 3
 
-def _get_config():
-    config = ConfigParser()
-    config.read(os.path.expanduser(CONFIG_FILE_PATH))
-    return config
+ENV_CONFIG_FILE = "TWITCH_CONFIG_FILE"
+ENV_CLIENT_ID = "TWITCH_CLIENT_ID"
+ENV_OAUTH_TOKEN = "TWITCH_OAUTH_TOKEN"
+ENV_INITIAL_BACKOFF = "TWITCH_INITIAL_BACKOFF"
+ENV_MAX_RETRIES = "TWITCH_MAX_RETRIES"
+
+_configs = {}
+_lock = threading.Lock()
+
+
+class TwitchConfig(object):
+    """
+    Credentials and retry settings read from the config file.
+
+    Clients read the config file once per process, see `get_config`. A `TwitchConfig`
+    built directly can be passed to `TwitchClient`, `TwitchHelix` and `TwitchAPI`
+    with `config=` so that they don't access the filesystem at all.
+    """
+
+    def __init__(
+        self,
+        client_id=None,
+        oauth_token=None,
+        initial_backoff=DEFAULT_INITIAL_BACKOFF,
+        max_retries=DEFAULT_MAX_RETRIES,
+    ):
+        self.client_id = client_id
+        self.oauth_token = oauth_token
+        self.initial_backoff = float(initial_backoff)
+        self.max_retries = int(max_retries)
+
+    def __repr__(self):
+        return "<{} client_id={!r} initial_backoff={} max_retries={}>".format(
+            self.__class__.__name__,
+            self.client_id,
+            self.initial_backoff,
+            self.max_retries,
+        )
 
+    @classmethod
+    def from_parser(cls, parser):
+        """Build the config from a `ConfigParser`."""
+        kwargs = {}
+        if parser.has_section("Credentials"):
+            kwargs["client_id"] = parser["Credentials"].get("client_id")
+            kwargs["oauth_token"] = parser["Credentials"].get("oauth_token")
+        if parser.has_section("General"):
+            general = parser["General"]
+            kwargs["initial_backoff"] = general.get(
+                "initial_backoff", DEFAULT_INITIAL_BACKOFF
+            )
+            kwargs["max_retries"] = general.get("max_retries", DEFAULT_MAX_RETRIES)
+        return cls(**kwargs)
 
-def credentials_from_config_file():
-    client_id = None
-    oauth_token = None
+    @classmethod
+    def from_file(cls, path):
+        """Read the config from the .ini file at `path`, a missing file is empty."""
+        parser = ConfigParser()
+        parser.read(path)
+        return cls.from_parser(parser)
+
+    def with_environment(self, environ=None):
+        """
+        Return a copy of the config with the settings overridden by the
+        `TWITCH_CLIENT_ID`, `TWITCH_OAUTH_TOKEN`, `TWITCH_INITIAL_BACKOFF` and
+        `TWITCH_MAX_RETRIES` environment variables.
+        """
+        environ = os.environ if environ is None else environ
+        return self.__class__(
+            client_id=environ.get(ENV_CLIENT_ID, self.client_id),
+            oauth_token=environ.get(ENV_OAUTH_TOKEN, self.oauth_token),
+            initial_backoff=environ.get(ENV_INITIAL_BACKOFF, self.initial_backoff),
+            max_retries=environ.get(ENV_MAX_RETRIES, self.max_retries),
+        )
+
+
+def _config_file_path():
+    return os.path.expanduser(os.environ.get(ENV_CONFIG_FILE, CONFIG_FILE_PATH))
+
+
+def get_config():
+    """
+    Return the process-wide config, reading the config file the first time it's
+    needed. The file is `~/.twitch.cfg` unless `TWITCH_CONFIG_FILE` is set, and
+    environment variables override the settings in it.
+    """
+    path = _config_file_path()
+    config = _configs.get(path)
+    if config is None:
+        with _lock:
+            config = _configs.get(path)
+            if config is None:
+                config = TwitchConfig.from_file(path).with_environment()
+                _configs[path] = config
+    return config
 
-    config = _get_config()
-    if "Credentials" in config.sections():
-        client_id = config["Credentials"].get("client_id")
-        oauth_token = config["Credentials"].get("oauth_token")
 
-    return client_id, oauth_token
+def reload_config():
+    """Forget the memoized config, e.g. after the config file or environment changed."""
+    with _lock:
+        _configs.clear()
+    return get_config()
 
 
-def backoff_config():
-    initial_backoff = 0.5
-    max_retries = 3
+def credentials_from_config_file(config=None):
+    config = config or get_config()
+    return config.client_id, config.oauth_token
 
-    config = _get_config()
-    if "General" in config.sections():
-        initial_backoff = float(config["General"]["initial_backoff"])
-        max_retries = int(config["General"]["max_retries"])
 
-    return initial_backoff, max_retries
+def backoff_config(config=None):
+    config = config or get_config()
+    return config.initial_backoff, config.max_retries
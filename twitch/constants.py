@@ -5,6 +5,8 @@ VOD_FETCH_URL = "https://usher.ttvnw.net/"
 
 CONFIG_FILE_PATH = "~/.twitch.cfg"
 
+DEFAULT_TIMEOUT = 10
+
 PERIOD_DAY = "day"
 PERIOD_WEEK = "week"
 PERIOD_MONTH = "month"
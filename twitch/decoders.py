@@ -0,0 +1,62 @@
+import json
+
+from twitch.exceptions import TwitchException
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+def _get_decoders():
+    decoders = {}
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+    if ujson is not None:
+        decoders["ujson"] = ujson.loads
+    decoders["json"] = json.loads
+    return decoders
+
+
+DECODERS = _get_decoders()
+
+# The fastest installed decoder comes first
+_decode = next(iter(DECODERS.values()))
+
+
+def get_decoder(name):
+    """Return the `loads` function of the JSON library called `name`."""
+    try:
+        return DECODERS[name]
+    except KeyError:
+        raise TwitchException(
+            "JSON decoder {} is not installed. Available decoders are {}".format(
+                name, list(DECODERS)
+            )
+        )
+
+
+def set_decoder(decoder):
+    """
+    Set the function used to decode JSON responses.
+
+    `decoder` is either the name of an installed library, "orjson", "ujson" or
+    "json", or a function taking the response body as bytes.
+    """
+    global _decode
+    _decode = get_decoder(decoder) if isinstance(decoder, str) else decoder
+
+
+def decode_json(content):
+    """Decode the JSON `content` of a response with the configured decoder."""
+    return _decode(content)
+
+
+def decode_response(response):
+    """Decode the JSON body of a `requests` or `httpx` response."""
+    return _decode(response.content)
@@ -1,8 +1,12 @@
-from requests import post
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.compat import urljoin
 
 from twitch.conf import credentials_from_config_file
 from twitch.constants import (
+    BASE_HELIX_URL,
     BASE_OAUTH_URL,
+    DEFAULT_TIMEOUT,
     PERIOD_ALL,
     PERIODS,
     VIDEO_SORT_TIME,
@@ -10,8 +14,13 @@ from twitch.constants import (
     VIDEO_TYPE_ALL,
     VIDEO_TYPES,
 )
+from twitch.decoders import decode_response
+from twitch.decorators import oauth_required
 from twitch.exceptions import TwitchAttributeException, TwitchOAuthException
 from twitch.helix.base import APICursor, APIGet
+from twitch.helix.bulk import DEFAULT_BULK_WORKERS, merge_results, split_params
+from twitch.helix.compact import COMPACT_RESOURCES
+from twitch.helix.ratelimit import default_rate_limiter
 from twitch.resources import (
     Clip,
     Follow,
@@ -19,9 +28,11 @@ from twitch.resources import (
     Stream,
     StreamMetadata,
     Tag,
+    TwitchObject,
     User,
     Video,
 )
+from twitch.session import create_session
 
 
 class TwitchHelix(object):
@@ -30,38 +41,115 @@ class TwitchHelix(object):
     """
 
     def __init__(
-        self, client_id=None, oauth_token=None, client_secret=None, scopes=None
+        self,
+        client_id=None,
+        oauth_token=None,
+        client_secret=None,
+        scopes=None,
+        session=None,
+        bulk_workers=DEFAULT_BULK_WORKERS,
+        prefetch=0,
+        rate_limiter=None,
+        retry_policy=None,
+        cache=None,
+        single_flight=None,
+        compact=False,
+        lazy=False,
+        raw=False,
+        parse_datetimes=True,
+        config=None,
+        credential_pool=None,
     ):
         self._client_id = client_id
         self._oauth_token = oauth_token
         self._client_secret = client_secret
         self._scopes = scopes
+        self._session = session or create_session()
+        self._bulk_workers = bulk_workers
+        self._prefetch = prefetch
+        self._rate_limiter = rate_limiter or default_rate_limiter
+        self._retry_policy = retry_policy
+        self._cache = cache
+        self._single_flight = single_flight
+        self._compact = compact
+        self._lazy = lazy
+        self._raw = raw
+        self._parse_datetimes = parse_datetimes
+
+        self._credential_pool = credential_pool
+
+        if not client_id and credential_pool is None:
+            self._client_id, self._oauth_token = credentials_from_config_file(config)
+
+    def _get_resource(self, resource):
+        if self._compact:
+            return COMPACT_RESOURCES.get(resource, resource)
+        return resource
+
+    def _get_cursor(self, path, resource, params):
+        return APICursor(
+            client_id=self._client_id,
+            oauth_token=self._oauth_token,
+            session=self._session,
+            rate_limiter=self._rate_limiter,
+            retry_policy=self._retry_policy,
+            cache=self._cache,
+            single_flight=self._single_flight,
+            lazy=self._lazy,
+            raw=self._raw,
+            parse_datetimes=self._parse_datetimes,
+            credential_pool=self._credential_pool,
+            path=path,
+            resource=self._get_resource(resource),
+            params=params,
+            prefetch=self._prefetch,
+        )
 
-        if not client_id:
-            self._client_id, self._oauth_token = credentials_from_config_file()
+    def _fetch(self, path, resource, params):
+        return APIGet(
+            client_id=self._client_id,
+            oauth_token=self._oauth_token,
+            session=self._session,
+            rate_limiter=self._rate_limiter,
+            retry_policy=self._retry_policy,
+            cache=self._cache,
+            single_flight=self._single_flight,
+            lazy=self._lazy,
+            raw=self._raw,
+            parse_datetimes=self._parse_datetimes,
+            credential_pool=self._credential_pool,
+            path=path,
+            resource=self._get_resource(resource),
+            params=params,
+        ).fetch()
 
-    def get_oauth(self):
+    def _fetch_bulk(self, path, resource, params, keys):
+        chunks = split_params(params, keys)
+        with ThreadPoolExecutor(max_workers=self._bulk_workers) as executor:
+            pages = list(
+                executor.map(
+                    lambda chunk: self._fetch(path, resource, params=chunk), chunks
+                )
+            )
+        return merge_results(params, keys, pages)
+
+    def _get_oauth_url(self):
         if not self._client_secret or not self._client_id:
             raise TwitchOAuthException(
                 "Client Id and Client Secret are not both present."
             )
 
-        if not self._scopes:
-            response = post(
-                BASE_OAUTH_URL + f"token?client_id={self._client_id}"
-                f"&client_secret={self._client_secret}"
-                f"&grant_type=client_credentials"
-            )
-            response = response.json()
-        else:
+        url = (
+            BASE_OAUTH_URL + f"token?client_id={self._client_id}"
+            f"&client_secret={self._client_secret}"
+            f"&grant_type=client_credentials"
+        )
+        if self._scopes:
             scopes_str = "+".join(self._scopes)
-            response = post(
-                BASE_OAUTH_URL + f"token?client_id={self._client_id}"
-                f"&client_secret={self._client_secret}"
-                f"&grant_type=client_credentials&scope={scopes_str}"
-            )
-            response = response.json()
+            url += f"&scope={scopes_str}"
+        return url
 
+    def _set_oauth_token(self, response):
         if "access_token" in response:
             self._oauth_token = response["access_token"]
         elif "message" in response:
@@ -69,6 +157,52 @@ class TwitchHelix(object):
         else:
             raise TwitchOAuthException()
 
+    def get_oauth(self):
+        response = self._session.post(self._get_oauth_url(), timeout=DEFAULT_TIMEOUT)
+        self._set_oauth_token(decode_response(response))
+
+    def _get_eventsub_request(
+        self, subscription_type, condition, callback, secret, version
+    ):
+        url = urljoin(BASE_HELIX_URL, "eventsub/subscriptions")
+        headers = {
+            "Client-ID": self._client_id,
+            "Authorization": "Bearer {}".format(self._oauth_token),
+        }
+        data = {
+            "type": subscription_type,
+            "version": version,
+            "condition": condition,
+            "transport": {"method": "webhook", "callback": callback, "secret": secret},
+        }
+        return url, headers, data
+
+    def _construct_subscription(self, response):
+        response.raise_for_status()
+        subscription = decode_response(response)["data"][0]
+        if self._raw:
+            return subscription
+        return TwitchObject.construct_from(
+            subscription, parse_datetimes=self._parse_datetimes
+        )
+
+    @oauth_required
+    def create_eventsub_subscription(
+        self, subscription_type, condition, callback, secret, version="1"
+    ):
+        """
+        Subscribe `callback`, e.g. the public URL of a
+        `twitch.helix.eventsub.EventSubReceiver`, to EventSub notifications.
+        Requires an app access token, see `get_oauth`.
+        """
+        url, headers, data = self._get_eventsub_request(
+            subscription_type, condition, callback, secret, version
+        )
+        response = self._session.post(
+            url, json=data, headers=headers, timeout=DEFAULT_TIMEOUT
+        )
+        return self._construct_subscription(response)
+
     def get_streams(
         self,
         after=None,
@@ -79,6 +213,7 @@ class TwitchHelix(object):
         languages=None,
         user_ids=None,
         user_logins=None,
+        bulk=False,
     ):
 
         if community_ids and len(community_ids) > 100:
@@ -89,9 +224,9 @@ class TwitchHelix(object):
             raise TwitchAttributeException("Maximum of 100 Game IDs can be supplied")
         if languages and len(languages) > 100:
             raise TwitchAttributeException("Maximum of 100 languages can be supplied")
-        if user_ids and len(user_ids) > 100:
+        if not bulk and user_ids and len(user_ids) > 100:
             raise TwitchAttributeException("Maximum of 100 User IDs can be supplied")
-        if user_logins and len(user_logins) > 100:
+        if not bulk and user_logins and len(user_logins) > 100:
             raise TwitchAttributeException(
                 "Maximum of 100 User login names can be supplied"
             )
@@ -109,31 +244,41 @@ class TwitchHelix(object):
             "user_login": user_logins,
         }
 
-        return APICursor(
-            client_id=self._client_id,
-            oauth_token=self._oauth_token,
-            path="streams",
-            resource=Stream,
-            params=params,
-        )
+        if bulk:
+            if not user_ids and not user_logins:
+                raise TwitchAttributeException(
+                    "user_ids or user_logins must be provided in bulk mode."
+                )
+            # Every chunk of 100 users has at most 100 live streams
+            params["first"] = 100
+            return self._fetch_bulk(
+                path="streams",
+                resource=Stream,
+                params=params,
+                keys=[("user_id", "user_id"), ("user_login", "user_login")],
+            )
 
-    def get_games(self, game_ids=None, names=None):
-        if game_ids and len(game_ids) > 100:
+        return self._get_cursor(path="streams", resource=Stream, params=params)
+
+    def get_games(self, game_ids=None, names=None, bulk=False):
+        if not bulk and game_ids and len(game_ids) > 100:
             raise TwitchAttributeException("Maximum of 100 Game IDs can be supplied")
-        if names and len(names) > 100:
+        if not bulk and names and len(names) > 100:
             raise TwitchAttributeException("Maximum of 100 Game names can be supplied")
 
         params = {
             "id": game_ids,
             "name": names,
         }
-        return APIGet(
-            client_id=self._client_id,
-            oauth_token=self._oauth_token,
-            path="games",
-            resource=Game,
-            params=params,
-        ).fetch()
+        if bulk:
+            return self._fetch_bulk(
+                path="games",
+                resource=Game,
+                params=params,
+                keys=[("id", "id"), ("name", "name")],
+            )
+
+        return self._fetch(path="games", resource=Game, params=params)
 
     def get_clips(
         self,
@@ -145,13 +290,16 @@ class TwitchHelix(object):
         started_at=None,
         ended_at=None,
         page_size=20,
+        bulk=False,
     ):
         if not broadcaster_id and not clip_ids and not game_id:
             raise TwitchAttributeException(
                 "At least one of the following parameters must be provided "
                 "[broadcaster_id, clip_ids, game_id]"
             )
-        if clip_ids and len(clip_ids) > 100:
+        if bulk and (broadcaster_id or game_id):
+            raise TwitchAttributeException("Bulk mode can only be used with clip_ids")
+        if not bulk and clip_ids and len(clip_ids) > 100:
             raise TwitchAttributeException("Maximum of 100 Clip IDs can be supplied")
         if page_size > 100:
             raise TwitchAttributeException("Maximum number of objects to return is 100")
@@ -169,22 +317,14 @@ class TwitchHelix(object):
         if broadcaster_id or game_id:
             params["first"] = page_size
 
-            return APICursor(
-                client_id=self._client_id,
-                oauth_token=self._oauth_token,
-                path="clips",
-                resource=Clip,
-                params=params,
-            )
+            return self._get_cursor(path="clips", resource=Clip, params=params)
 
+        elif bulk:
+            return self._fetch_bulk(
+                path="clips", resource=Clip, params=params, keys=[("id", "id")]
+            )
         else:
-            return APIGet(
-                client_id=self._client_id,
-                oauth_token=self._oauth_token,
-                path="clips",
-                resource=Clip,
-                params=params,
-            ).fetch()
+            return self._fetch(path="clips", resource=Clip, params=params)
 
     def get_top_games(self, after=None, before=None, page_size=20):
         if page_size > 100:
@@ -196,13 +336,7 @@ class TwitchHelix(object):
             "first": page_size,
         }
 
-        return APICursor(
-            client_id=self._client_id,
-            oauth_token=self._oauth_token,
-            path="games/top",
-            resource=Game,
-            params=params,
-        )
+        return self._get_cursor(path="games/top", resource=Game, params=params)
 
     def get_videos(
         self,
@@ -216,8 +350,11 @@ class TwitchHelix(object):
         period=PERIOD_ALL,
         sort=VIDEO_SORT_TIME,
         video_type=VIDEO_TYPE_ALL,
+        bulk=False,
     ):
-        if video_ids and len(video_ids) > 100:
+        if bulk and (user_id or game_id):
+            raise TwitchAttributeException("Bulk mode can only be used with video_ids")
+        if not bulk and video_ids and len(video_ids) > 100:
             raise TwitchAttributeException("Maximum of 100 Video IDs can be supplied")
 
         params = {
@@ -254,21 +391,13 @@ class TwitchHelix(object):
             params["sort"] = sort
             params["type"] = video_type
 
-            return APICursor(
-                client_id=self._client_id,
-                oauth_token=self._oauth_token,
-                path="videos",
-                resource=Video,
-                params=params,
+            return self._get_cursor(path="videos", resource=Video, params=params)
+        elif bulk:
+            return self._fetch_bulk(
+                path="videos", resource=Video, params=params, keys=[("id", "id")]
             )
         else:
-            return APIGet(
-                client_id=self._client_id,
-                oauth_token=self._oauth_token,
-                path="videos",
-                resource=Video,
-                params=params,
-            ).fetch()
+            return self._fetch(path="videos", resource=Video, params=params)
 
     def get_streams_metadata(
         self,
@@ -310,12 +439,8 @@ class TwitchHelix(object):
             "user_login": user_logins,
         }
 
-        return APICursor(
-            client_id=self._client_id,
-            oauth_token=self._oauth_token,
-            path="streams/metadata",
-            resource=StreamMetadata,
-            params=params,
+        return self._get_cursor(
+            path="streams/metadata", resource=StreamMetadata, params=params
         )
 
     def get_user_follows(self, after=None, page_size=20, from_id=None, to_id=None):
@@ -331,31 +456,26 @@ class TwitchHelix(object):
             "to_id": to_id,
         }
 
-        return APICursor(
-            client_id=self._client_id,
-            oauth_token=self._oauth_token,
-            path="users/follows",
-            resource=Follow,
-            params=params,
-        )
+        return self._get_cursor(path="users/follows", resource=Follow, params=params)
 
-    def get_users(self, login_names=None, ids=None):
+    def get_users(self, login_names=None, ids=None, bulk=False):
         """https://dev.twitch.tv/docs/api/reference#get-users"""
         if not login_names:
             login_names = []
         if not ids:
             ids = []
-        if len(login_names) + len(ids) > 100:
+        if not bulk and len(login_names) + len(ids) > 100:
             raise TwitchAttributeException("Sum of names and ids must not exceed 100!")
         params = {"login": login_names, "id": ids}
 
-        return APIGet(
-            client_id=self._client_id,
-            oauth_token=self._oauth_token,
-            path="users",
-            resource=User,
-            params=params,
-        ).fetch()
+        if bulk:
+            return self._fetch_bulk(
+                path="users",
+                resource=User,
+                params=params,
+                keys=[("id", "id"), ("login", "login")],
+            )
+        return self._fetch(path="users", resource=User, params=params)
 
     def get_tags(self, after=None, page_size=20, tag_ids=None):
         """https://dev.twitch.tv/docs/api/reference#get-all-stream-tags"""
@@ -367,10 +487,4 @@ class TwitchHelix(object):
 
         params = {"after": after, "first": page_size, "tag_id": tag_ids}
 
-        return APICursor(
-            client_id=self._client_id,
-            oauth_token=self._oauth_token,
-            path="tags/streams",
-            resource=Tag,
-            params=params,
-        )
+        return self._get_cursor(path="tags/streams", resource=Tag, params=params)
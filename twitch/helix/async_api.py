@@ -0,0 +1,128 @@
+import asyncio
+
+from twitch.constants import DEFAULT_TIMEOUT
+from twitch.decoders import decode_response
+from twitch.decorators import oauth_required
+from twitch.helix.api import TwitchHelix
+from twitch.helix.async_base import AsyncAPICursor, AsyncAPIGet, create_async_session
+from twitch.helix.bulk import DEFAULT_BULK_WORKERS, merge_results, split_params
+
+
+class AsyncTwitchHelix(TwitchHelix):
+    """
+    Twitch Helix API for asyncio
+
+    Takes the same parameters and validates them the same way as `TwitchHelix`.
+    Methods that return a list of resources in `TwitchHelix` are coroutines here,
+    methods that return a cursor return an `AsyncAPICursor` which has to be
+    iterated with `async for`.
+    """
+
+    def __init__(
+        self,
+        client_id=None,
+        oauth_token=None,
+        client_secret=None,
+        scopes=None,
+        session=None,
+        bulk_workers=DEFAULT_BULK_WORKERS,
+        rate_limiter=None,
+        retry_policy=None,
+        cache=None,
+        single_flight=None,
+        compact=False,
+        lazy=False,
+        raw=False,
+        parse_datetimes=True,
+        config=None,
+    ):
+        super(AsyncTwitchHelix, self).__init__(
+            client_id=client_id,
+            oauth_token=oauth_token,
+            client_secret=client_secret,
+            scopes=scopes,
+            session=session or create_async_session(),
+            bulk_workers=bulk_workers,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            cache=cache,
+            single_flight=single_flight,
+            compact=compact,
+            lazy=lazy,
+            raw=raw,
+            parse_datetimes=parse_datetimes,
+            config=config,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._session.aclose()
+
+    def _get_cursor(self, path, resource, params):
+        return AsyncAPICursor(
+            client_id=self._client_id,
+            oauth_token=self._oauth_token,
+            session=self._session,
+            rate_limiter=self._rate_limiter,
+            retry_policy=self._retry_policy,
+            cache=self._cache,
+            single_flight=self._single_flight,
+            lazy=self._lazy,
+            raw=self._raw,
+            parse_datetimes=self._parse_datetimes,
+            path=path,
+            resource=self._get_resource(resource),
+            params=params,
+        )
+
+    def _fetch(self, path, resource, params):
+        return AsyncAPIGet(
+            client_id=self._client_id,
+            oauth_token=self._oauth_token,
+            session=self._session,
+            rate_limiter=self._rate_limiter,
+            retry_policy=self._retry_policy,
+            cache=self._cache,
+            single_flight=self._single_flight,
+            lazy=self._lazy,
+            raw=self._raw,
+            parse_datetimes=self._parse_datetimes,
+            path=path,
+            resource=self._get_resource(resource),
+            params=params,
+        ).fetch()
+
+    async def _fetch_bulk(self, path, resource, params, keys):
+        semaphore = asyncio.Semaphore(self._bulk_workers)
+
+        async def fetch_chunk(chunk):
+            async with semaphore:
+                return await self._fetch(path, resource, params=chunk)
+
+        pages = await asyncio.gather(
+            *[fetch_chunk(chunk) for chunk in split_params(params, keys)]
+        )
+        return merge_results(params, keys, pages)
+
+    async def get_oauth(self):
+        response = await self._session.post(
+            self._get_oauth_url(), timeout=DEFAULT_TIMEOUT
+        )
+        self._set_oauth_token(decode_response(response))
+
+    @oauth_required
+    async def create_eventsub_subscription(
+        self, subscription_type, condition, callback, secret, version="1"
+    ):
+        url, headers, data = self._get_eventsub_request(
+            subscription_type, condition, callback, secret, version
+        )
+        response = await self._session.post(
+            url, json=data, headers=headers, timeout=DEFAULT_TIMEOUT
+        )
+        return self._construct_subscription(response)
@@ -0,0 +1,221 @@
+import asyncio
+import copy
+import logging
+from collections import deque
+
+import httpx
+from requests import codes
+from requests.compat import urljoin
+
+from twitch.columnar import AsyncColumnarMixin
+from twitch.constants import BASE_HELIX_URL, DEFAULT_TIMEOUT
+from twitch.decoders import decode_response
+from twitch.helix.base import APICursor, TwitchAPIMixin
+from twitch.helix.ratelimit import default_rate_limiter
+from twitch.retry import DEFAULT_RETRY_EXCEPTIONS, RetryPolicy
+from twitch.session import DEFAULT_POOL_MAXSIZE
+
+logger = logging.getLogger(__name__)
+
+default_async_retry_policy = RetryPolicy(
+    max_attempts=5,
+    retry_exceptions=DEFAULT_RETRY_EXCEPTIONS + (httpx.TransportError,),
+)
+
+
+def create_async_session(
+    max_connections=DEFAULT_POOL_MAXSIZE,
+    max_keepalive_connections=DEFAULT_POOL_MAXSIZE,
+    keepalive_expiry=5.0,
+    timeout=DEFAULT_TIMEOUT,
+):
+    """
+    Create a `httpx.AsyncClient` with a keep-alive connection pool.
+
+    `max_connections` limits the number of requests in flight at the same time,
+    `max_keepalive_connections` the number of idle connections kept open.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+
+class AsyncTwitchAPIMixin(TwitchAPIMixin):
+    _retry_policy = default_async_retry_policy
+
+    async def _wait_for_rate_limit_reset(self):
+        wait_time = self._rate_limiter.acquire()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    async def _request_get(self, path, params=None):
+        if self._single_flight is not None:
+            # Concurrent identical requests share a single HTTP request, and every
+            # caller gets its own copy of the response
+            return await self._single_flight.do(
+                self._get_single_flight_key(path, params),
+                lambda: self._request_get_json(path, params),
+                copy_result=copy.deepcopy,
+            )
+        return await self._request_get_json(path, params)
+
+    async def _request_get_json(self, path, params=None):
+        url = urljoin(BASE_HELIX_URL, path)
+        headers = self._get_request_headers()
+
+        key = entry = None
+        if self._cache is not None:
+            key, entry = self._lookup_cache(url, params, headers)
+            if entry and self._cache.is_fresh(entry):
+                return entry.payload
+
+        retry = self._retry_policy.start("GET")
+        while True:
+            await self._wait_for_rate_limit_reset()
+
+            try:
+                response = await self._session.get(
+                    url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT
+                )
+            except Exception as e:
+                delay = retry.next_delay(exception=e)
+                if delay is None:
+                    raise
+            else:
+                logger.debug(
+                    "Request to %s with params %s took %s",
+                    url,
+                    params,
+                    response.elapsed,
+                )
+                self._rate_limiter.update(response.headers)
+                if response.status_code == codes.TOO_MANY_REQUESTS:
+                    logger.debug(
+                        "Twitch responded with 429. Rate limit reached. "
+                        "Waiting for the cooldown."
+                    )
+
+                delay = retry.next_delay(response=response)
+                if delay is None:
+                    break
+            await asyncio.sleep(delay)
+
+        if entry and response.status_code == codes.NOT_MODIFIED:
+            return self._cache.revalidate(key, path, entry)
+
+        response.raise_for_status()
+        data = decode_response(response)
+        if self._cache is not None:
+            self._cache.store(key, path, data, response.headers)
+        return data
+
+
+class AsyncAPICursor(AsyncTwitchAPIMixin, AsyncColumnarMixin, APICursor):
+    """
+    Asynchronous counterpart of `APICursor`.
+
+    Unlike `APICursor`, the first page is not fetched on instantiation, but on the
+    first call to `next_page` or when the cursor is first iterated with `async for`.
+    The columnar export methods are coroutines, and `iter_batches` is an async
+    generator.
+    """
+
+    def __init__(
+        self,
+        client_id,
+        path,
+        resource,
+        session,
+        oauth_token=None,
+        cursor=None,
+        params=None,
+        rate_limiter=None,
+        retry_policy=None,
+        cache=None,
+        single_flight=None,
+        lazy=False,
+        raw=False,
+        parse_datetimes=True,
+    ):
+        self._session = session
+        self._rate_limiter = rate_limiter or default_rate_limiter
+        self._retry_policy = retry_policy or default_async_retry_policy
+        self._cache = cache
+        self._single_flight = single_flight
+        self._lazy = lazy
+        self._raw = raw
+        self._parse_datetimes = parse_datetimes
+        self._path = path
+        self._queue = deque()
+        self._cursor = cursor
+        self._resource = resource
+        self._client_id = client_id
+        self._oauth_token = oauth_token
+        self._params = params
+        self._total = None
+        self._requests_count = 0
+        self._prefetcher = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._queue and not await self.next_page():
+            raise StopAsyncIteration()
+
+        return self._queue.popleft()
+
+    def __next__(self):
+        raise TypeError("AsyncAPICursor must be iterated with 'async for'")
+
+    next = __next__
+
+    async def next_page(self):
+        # On the last page, return whatever's left in the queue.
+        if self._is_last_page():
+            return list(self._queue)
+
+        if self._cursor:
+            self._params["after"] = self._cursor
+
+        response = await self._request_get(self._path, params=self._params)
+        return self._load_page(response)
+
+
+class AsyncAPIGet(AsyncTwitchAPIMixin):
+    def __init__(
+        self,
+        client_id,
+        path,
+        resource,
+        session,
+        oauth_token=None,
+        params=None,
+        rate_limiter=None,
+        retry_policy=None,
+        cache=None,
+        single_flight=None,
+        lazy=False,
+        raw=False,
+        parse_datetimes=True,
+    ):
+        self._session = session
+        self._rate_limiter = rate_limiter or default_rate_limiter
+        self._retry_policy = retry_policy or default_async_retry_policy
+        self._cache = cache
+        self._single_flight = single_flight
+        self._lazy = lazy
+        self._raw = raw
+        self._parse_datetimes = parse_datetimes
+        self._path = path
+        self._resource = resource
+        self._client_id = client_id
+        self._oauth_token = oauth_token
+        self._params = params
+
+    async def fetch(self):
+        response = await self._request_get(self._path, params=self._params)
+        return [self._construct(data) for data in response["data"]]
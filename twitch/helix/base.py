@@ -1,41 +1,52 @@
+import copy
 import logging
+import threading
 import time
+import weakref
+from collections import deque
+from queue import Queue
 
-import requests
 from requests import codes
 from requests.compat import urljoin
 
-from twitch.constants import BASE_HELIX_URL
+from twitch.cache import make_cache_key
+from twitch.columnar import ColumnarMixin
+from twitch.constants import BASE_HELIX_URL, DEFAULT_TIMEOUT
+from twitch.decoders import decode_response
 from twitch.exceptions import TwitchNotProvidedException
+from twitch.helix.ratelimit import default_rate_limiter
+from twitch.retry import RetryPolicy
+from twitch.session import create_session
 
 logger = logging.getLogger(__name__)
 
+# 429 responses are retried after the rate limit resets
+default_retry_policy = RetryPolicy(max_attempts=5)
 
-class TwitchAPIMixin(object):
-    _rate_limit_resets = set()
-    _rate_limit_remaining = 0
 
-    def _wait_for_rate_limit_reset(self):
-        if self._rate_limit_remaining == 0:
-            current_time = int(time.time())
-            self._rate_limit_resets = set(
-                x for x in self._rate_limit_resets if x > current_time
+class TwitchAPIMixin(object):
+    _rate_limiter = default_rate_limiter
+    _retry_policy = default_retry_policy
+    _cache = None
+    _single_flight = None
+    _lazy = False
+    _raw = False
+    _parse_datetimes = True
+    _credential_pool = None
+
+    def _construct(self, data):
+        if self._raw:
+            return data
+        if self._lazy or not self._parse_datetimes:
+            return self._resource.construct_from(
+                data, lazy=self._lazy, parse_datetimes=self._parse_datetimes
             )
-            if len(self._rate_limit_resets) > 0:
-                logger.debug(
-                    "Waiting for rate limit reset",
-                    extra={
-                        "rate_limit_remaining": self._rate_limit_remaining,
-                        "rate_limit_resets": self._rate_limit_resets,
-                    },
-                )
+        return self._resource.construct_from(data)
 
-                reset_time = list(self._rate_limit_resets)[0]
-
-                # Calculate wait time and add 0.1s to the wait time to allow Twitch to reset
-                # their counter
-                wait_time = reset_time - current_time + 0.1
-                time.sleep(wait_time)
+    def _wait_for_rate_limit_reset(self):
+        wait_time = self._rate_limiter.acquire()
+        if wait_time > 0:
+            time.sleep(wait_time)
 
     def _get_request_headers(self):
         headers = {"Client-ID": self._client_id}
@@ -45,44 +56,195 @@ class TwitchAPIMixin(object):
 
         return headers
 
+    def _lookup_cache(self, url, params, headers):
+        """
+        Return the cache key and the cached entry for a request. If the entry is
+        stale, conditional headers for revalidating it are added to `headers`.
+        """
+        key = make_cache_key(url, params, headers)
+        entry = self._cache.lookup(key)
+        if entry and not self._cache.is_fresh(entry):
+            headers.update(self._cache.get_conditional_headers(entry))
+        return key, entry
+
+    def _get_single_flight_key(self, path, params):
+        url = urljoin(BASE_HELIX_URL, path)
+        return make_cache_key(url, params, self._get_request_headers())
+
     def _request_get(self, path, params=None):
+        if self._single_flight is not None:
+            # Concurrent identical requests share a single HTTP request, and every
+            # caller gets its own copy of the response
+            return self._single_flight.do(
+                self._get_single_flight_key(path, params),
+                lambda: self._request_get_json(path, params),
+                copy_result=copy.deepcopy,
+            )
+        return self._request_get_json(path, params)
+
+    def _request_get_json(self, path, params=None):
         url = urljoin(BASE_HELIX_URL, path)
         headers = self._get_request_headers()
 
-        self._wait_for_rate_limit_reset()
-
-        response = requests.get(url, params=params, headers=headers)
-        logger.debug(
-            "Request to %s with params %s took %s", url, params, response.elapsed
-        )
+        key = entry = None
+        if self._cache is not None:
+            key, entry = self._lookup_cache(url, params, headers)
+            if entry and self._cache.is_fresh(entry):
+                return entry.payload
 
-        remaining = response.headers.get("Ratelimit-Remaining")
-        if remaining:
-            self._rate_limit_remaining = int(remaining)
+        def send():
+            if self._credential_pool is not None:
+                return self._send_pooled(url, params, headers)
 
-        reset = response.headers.get("Ratelimit-Reset")
-        if reset:
-            self._rate_limit_resets.add(int(reset))
+            self._wait_for_rate_limit_reset()
 
-        # If status code is 429, re-run _request_get which will wait for the appropriate time
-        # to obey the rate limit
-        if response.status_code == codes.TOO_MANY_REQUESTS:
+            response = self._session.get(
+                url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT
+            )
             logger.debug(
-                "Twitch responded with 429. Rate limit reached. Waiting for the cooldown."
+                "Request to %s with params %s took %s", url, params, response.elapsed
             )
-            return self._request_get(path, params=params)
 
-        response.raise_for_status()
-        return response.json()
+            self._rate_limiter.update(response.headers)
+            if response.status_code == codes.TOO_MANY_REQUESTS:
+                logger.debug(
+                    "Twitch responded with 429. Rate limit reached. Waiting for the cooldown."
+                )
+            return response
+
+        response = self._retry_policy.call("GET", send)
+        if entry and response.status_code == codes.NOT_MODIFIED:
+            return self._cache.revalidate(key, path, entry)
 
+        response.raise_for_status()
+        data = decode_response(response)
+        if self._cache is not None:
+            self._cache.store(key, path, data, response.headers)
+        return data
+
+    def _send_pooled(self, url, params, headers):
+        """
+        Send a request with the credentials of the pool that have the most requests
+        left, failing over to other credentials on 401 and 429 responses.
+        """
+        tried = []
+        while True:
+            credentials, wait_time = self._credential_pool.acquire(exclude=tried)
+            if wait_time > 0:
+                time.sleep(wait_time)
 
-class APICursor(TwitchAPIMixin):
+            response = self._session.get(
+                url,
+                params=params,
+                headers=dict(headers, **credentials.get_request_headers()),
+                timeout=DEFAULT_TIMEOUT,
+            )
+            credentials.rate_limiter.update(response.headers)
+            tried.append(credentials)
+
+            if response.status_code == codes.UNAUTHORIZED:
+                self._credential_pool.revoke(credentials)
+                if self._credential_pool.active:
+                    continue
+            elif response.status_code == codes.TOO_MANY_REQUESTS:
+                if self._credential_pool.has_available(exclude=tried):
+                    logger.debug(
+                        "Rate limit reached, failing over to other credentials"
+                    )
+                    continue
+            return response
+
+
+class _PagePrefetcher(object):
+    """
+    Fetches the pages following `cursor` on a background thread, staying at most
+    `depth` pages ahead of the consumer.
+
+    The thread only holds a weak reference to `fetch_page`, so that a cursor that
+    is dropped before it's exhausted is garbage collected and stops the thread.
+    """
+
+    def __init__(self, fetch_page, cursor, depth):
+        self._fetch_page = weakref.WeakMethod(fetch_page)
+        self._pages = Queue()
+        self._slots = threading.Semaphore(depth)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(cursor,), daemon=True)
+        weakref.finalize(fetch_page.__self__, self._stopped.set)
+        self._thread.start()
+
+    def _wait_for_slot(self):
+        # Wake up periodically so that a stopped prefetcher doesn't wait forever for
+        # the consumer to free up a slot
+        while not self._stopped.is_set():
+            if self._slots.acquire(timeout=0.1):
+                return True
+        return False
+
+    def _fetch(self, cursor):
+        fetch_page = self._fetch_page()
+        if fetch_page is None:
+            # The consumer was garbage collected
+            self._stopped.set()
+            return None
+        return fetch_page(cursor)
+
+    def _run(self, cursor):
+        while cursor and self._wait_for_slot():
+            try:
+                response = self._fetch(cursor)
+            except Exception as e:
+                self._pages.put(e)
+                return
+            if response is None:
+                return
+            self._pages.put(response)
+            cursor = response["pagination"].get("cursor")
+
+    def get(self):
+        item = self._pages.get()
+        self._slots.release()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+
+class APICursor(TwitchAPIMixin, ColumnarMixin):
     def __init__(
-        self, client_id, path, resource, oauth_token=None, cursor=None, params=None
+        self,
+        client_id,
+        path,
+        resource,
+        oauth_token=None,
+        cursor=None,
+        params=None,
+        session=None,
+        prefetch=0,
+        rate_limiter=None,
+        retry_policy=None,
+        cache=None,
+        single_flight=None,
+        lazy=False,
+        raw=False,
+        parse_datetimes=True,
+        credential_pool=None,
     ):
         super(APICursor, self).__init__()
+        self._session = session or create_session()
+        self._rate_limiter = rate_limiter or default_rate_limiter
+        self._retry_policy = retry_policy or default_retry_policy
+        self._cache = cache
+        self._single_flight = single_flight
+        self._lazy = lazy
+        self._raw = raw
+        self._parse_datetimes = parse_datetimes
+        self._credential_pool = credential_pool
         self._path = path
-        self._queue = []
+        self._queue = deque()
         self._cursor = cursor
         self._resource = resource
         self._client_id = client_id
@@ -90,12 +252,18 @@ class APICursor(TwitchAPIMixin):
         self._params = params
         self._total = None
         self._requests_count = 0
+        self._prefetcher = None
 
         # Pre-fetch the first page as soon as cursor is instantiated
         self.next_page()
 
+        # Fetch up to `prefetch` of the following pages in the background while the
+        # caller is consuming the current one
+        if prefetch > 0 and not self._is_last_page():
+            self._prefetcher = _PagePrefetcher(self._fetch_page, self._cursor, prefetch)
+
     def __repr__(self):
-        return str(self._queue)
+        return str(list(self._queue))
 
     def __len__(self):
         return len(self._queue)
@@ -107,30 +275,66 @@ class APICursor(TwitchAPIMixin):
         if not self._queue and not self.next_page():
             raise StopIteration()
 
-        return self._queue.pop(0)
+        return self._queue.popleft()
 
     # Python 2 compatibility.
     next = __next__
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._queue)[index]
         return self._queue[index]
 
-    def next_page(self):
+    def _is_last_page(self):
         # Twitch stops returning a cursor when you're on the last page. So if we've made
         # more than 1 request to their API and we don't get a cursor back, it means
-        # we're on the last page, so return whatever's left in the queue.
-        if self._requests_count > 0 and not self._cursor:
-            return self._queue
+        # we're on the last page.
+        return self._requests_count > 0 and not self._cursor
 
-        if self._cursor:
-            self._params["after"] = self._cursor
-
-        response = self._request_get(self._path, params=self._params)
+    def _load_page(self, response):
         self._requests_count += 1
-        self._queue = [self._resource.construct_from(data) for data in response["data"]]
+        self._queue = deque(self._construct(data) for data in response["data"])
         self._cursor = response["pagination"].get("cursor")
         self._total = response.get("total")
-        return self._queue
+        # The queue is a deque so that items are consumed in O(1), but pages are
+        # returned as lists like they always were
+        return list(self._queue)
+
+    def _fetch_page(self, cursor):
+        params = dict(self._params or {}, after=cursor)
+        return self._request_get(self._path, params=params)
+
+    def next_page(self):
+        # On the last page, return whatever's left in the queue.
+        if self._is_last_page():
+            return list(self._queue)
+
+        if self._cursor:
+            self._params["after"] = self._cursor
+
+        if self._prefetcher:
+            try:
+                response = self._prefetcher.get()
+            except Exception:
+                # The worker stops after a failed fetch, so fetch the following pages
+                # in the foreground, which retries the failed one on the next call
+                self.close()
+                raise
+        else:
+            response = self._request_get(self._path, params=self._params)
+        return self._load_page(response)
+
+    def close(self):
+        """Stop fetching pages in the background."""
+        if self._prefetcher:
+            self._prefetcher.stop()
+            self._prefetcher = None
 
     @property
     def cursor(self):
@@ -144,8 +348,33 @@ class APICursor(TwitchAPIMixin):
 
 
 class APIGet(TwitchAPIMixin):
-    def __init__(self, client_id, path, resource, oauth_token=None, params=None):
+    def __init__(
+        self,
+        client_id,
+        path,
+        resource,
+        oauth_token=None,
+        params=None,
+        session=None,
+        rate_limiter=None,
+        retry_policy=None,
+        cache=None,
+        single_flight=None,
+        lazy=False,
+        raw=False,
+        parse_datetimes=True,
+        credential_pool=None,
+    ):
         super(APIGet, self).__init__()
+        self._session = session or create_session()
+        self._rate_limiter = rate_limiter or default_rate_limiter
+        self._retry_policy = retry_policy or default_retry_policy
+        self._cache = cache
+        self._single_flight = single_flight
+        self._lazy = lazy
+        self._raw = raw
+        self._parse_datetimes = parse_datetimes
+        self._credential_pool = credential_pool
         self._path = path
         self._resource = resource
         self._client_id = client_id
@@ -154,4 +383,4 @@ class APIGet(TwitchAPIMixin):
 
     def fetch(self):
         response = self._request_get(self._path, params=self._params)
-        return [self._resource.construct_from(data) for data in response["data"]]
+        return [self._construct(data) for data in response["data"]]
@@ -0,0 +1,65 @@
+MAX_IDS_PER_REQUEST = 100
+DEFAULT_BULK_WORKERS = 4
+
+
+class BulkResult(list):
+    """
+    List of resources ordered the same way as the requested keys.
+
+    Keys for which Twitch didn't return anything are listed in `missing`.
+    """
+
+    def __init__(self, items=(), missing=()):
+        super(BulkResult, self).__init__(items)
+        self.missing = list(missing)
+
+
+def _normalize(param, value):
+    # Login and game names are case insensitive on Twitch's side
+    if param in ("login", "user_login", "name"):
+        return str(value).lower()
+    return str(value)
+
+
+def split_params(params, keys, chunk_size=MAX_IDS_PER_REQUEST):
+    """
+    Split `params` into a list of params, each containing at most `chunk_size`
+    values of one of the `keys`.
+
+    `keys` is a list of `(param, resource_attribute)` tuples naming the list
+    parameters that should be chunked.
+    """
+    key_params = [param for param, _ in keys]
+    chunks = []
+    for param in key_params:
+        values = list(dict.fromkeys(params.get(param) or []))
+        for start in range(0, len(values), chunk_size):
+            end = start + chunk_size
+            chunk = {k: v for k, v in params.items() if k not in key_params}
+            chunk[param] = values[start:end]
+            chunks.append(chunk)
+    return chunks
+
+
+def merge_results(params, keys, pages):
+    """
+    Merge `pages` of resources into a `BulkResult` ordered the same way as the
+    values of `keys` in `params`.
+    """
+    items = []
+    missing = []
+    for param, attribute in keys:
+        found = {}
+        for page in pages:
+            for item in page:
+                value = item.get(attribute)
+                if value is not None:
+                    found.setdefault(_normalize(param, value), item)
+
+        for value in dict.fromkeys(params.get(param) or []):
+            item = found.get(_normalize(param, value))
+            if item is None:
+                missing.append(value)
+            else:
+                items.append(item)
+    return BulkResult(items, missing)
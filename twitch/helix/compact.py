@@ -0,0 +1,209 @@
+from collections.abc import Mapping
+
+from twitch import resources
+from twitch.resources import convert_to_twitch_object
+
+
+class CompactObject(Mapping):
+    """
+    Memory efficient, read-only alternative to `TwitchObject` for Helix resources.
+
+    The fields Twitch documents for a resource are stored in `__slots__`, any other
+    field goes into a dictionary that is only created when needed. Fields are
+    accessible as attributes and, like with `TwitchObject`, as items.
+    """
+
+    __slots__ = ("_extra",)
+    _fields = ()
+
+    @classmethod
+    def construct_from(cls, values, lazy=False, parse_datetimes=True):
+        # Helix resources have few fields to convert, so `lazy` is ignored
+        instance = cls.__new__(cls)
+        extra = None
+        for key, value in values.items():
+            key = key.lstrip("_")
+            value = convert_to_twitch_object(
+                key, value, parse_datetimes=parse_datetimes
+            )
+            if key in cls._fields:
+                object.__setattr__(instance, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        object.__setattr__(instance, "_extra", extra)
+        return instance
+
+    def __getattr__(self, name):
+        # Only called for unset slots and fields that aren't slots
+        extra = object.__getattribute__(self, "_extra")
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is read-only".format(type(self).__name__))
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for field in self._fields:
+            if hasattr(self, field):
+                yield field
+        if self._extra is not None:
+            for key in self._extra:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, dict(self))
+
+    def __getstate__(self):
+        return dict(self)
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "_extra", None)
+        for key, value in state.items():
+            if key in self._fields:
+                object.__setattr__(self, key, value)
+            else:
+                if self._extra is None:
+                    object.__setattr__(self, "_extra", {})
+                self._extra[key] = value
+
+    def to_dict(self):
+        return dict(self)
+
+
+class Clip(CompactObject):
+    __slots__ = _fields = (
+        "id",
+        "url",
+        "embed_url",
+        "broadcaster_id",
+        "broadcaster_name",
+        "creator_id",
+        "creator_name",
+        "video_id",
+        "game_id",
+        "language",
+        "title",
+        "view_count",
+        "created_at",
+        "thumbnail_url",
+    )
+
+
+class Follow(CompactObject):
+    __slots__ = _fields = (
+        "from_id",
+        "from_login",
+        "from_name",
+        "to_id",
+        "to_login",
+        "to_name",
+        "followed_at",
+    )
+
+
+class Game(CompactObject):
+    __slots__ = _fields = (
+        "id",
+        "name",
+        "box_art_url",
+    )
+
+
+class Stream(CompactObject):
+    __slots__ = _fields = (
+        "id",
+        "user_id",
+        "user_login",
+        "user_name",
+        "game_id",
+        "game_name",
+        "type",
+        "title",
+        "viewer_count",
+        "started_at",
+        "language",
+        "thumbnail_url",
+        "tag_ids",
+        "is_mature",
+    )
+
+
+class StreamMetadata(CompactObject):
+    __slots__ = _fields = (
+        "user_id",
+        "user_name",
+        "game_id",
+        "overwatch",
+        "hearthstone",
+    )
+
+
+class Tag(CompactObject):
+    __slots__ = _fields = (
+        "tag_id",
+        "is_auto",
+        "localization_names",
+        "localization_descriptions",
+    )
+
+
+class User(CompactObject):
+    __slots__ = _fields = (
+        "id",
+        "login",
+        "display_name",
+        "type",
+        "broadcaster_type",
+        "description",
+        "profile_image_url",
+        "offline_image_url",
+        "view_count",
+        "email",
+        "created_at",
+    )
+
+
+class Video(CompactObject):
+    __slots__ = _fields = (
+        "id",
+        "stream_id",
+        "user_id",
+        "user_login",
+        "user_name",
+        "title",
+        "description",
+        "created_at",
+        "published_at",
+        "url",
+        "thumbnail_url",
+        "viewable",
+        "view_count",
+        "language",
+        "type",
+        "duration",
+        "muted_segments",
+    )
+
+
+COMPACT_RESOURCES = {
+    resources.Clip: Clip,
+    resources.Follow: Follow,
+    resources.Game: Game,
+    resources.Stream: Stream,
+    resources.StreamMetadata: StreamMetadata,
+    resources.Tag: Tag,
+    resources.User: User,
+    resources.Video: Video,
+}
@@ -0,0 +1,387 @@
+import hashlib
+import hmac
+import json
+import logging
+import socketserver
+import threading
+import uuid
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from twitch.decoders import decode_json
+from twitch.exceptions import TwitchAttributeException
+from twitch.resources import Follow, Stream, TwitchObject, parse_datetime
+from twitch.session import create_session
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_TYPE_VERIFICATION = "webhook_callback_verification"
+MESSAGE_TYPE_NOTIFICATION = "notification"
+MESSAGE_TYPE_REVOCATION = "revocation"
+MESSAGE_TYPES = (
+    MESSAGE_TYPE_VERIFICATION,
+    MESSAGE_TYPE_NOTIFICATION,
+    MESSAGE_TYPE_REVOCATION,
+)
+
+HEADER_MESSAGE_ID = "Twitch-Eventsub-Message-Id"
+HEADER_MESSAGE_TIMESTAMP = "Twitch-Eventsub-Message-Timestamp"
+HEADER_MESSAGE_SIGNATURE = "Twitch-Eventsub-Message-Signature"
+HEADER_MESSAGE_TYPE = "Twitch-Eventsub-Message-Type"
+HEADER_SUBSCRIPTION_TYPE = "Twitch-Eventsub-Subscription-Type"
+
+SUBSCRIPTION_STREAM_ONLINE = "stream.online"
+SUBSCRIPTION_STREAM_OFFLINE = "stream.offline"
+SUBSCRIPTION_CHANNEL_FOLLOW = "channel.follow"
+
+# Twitch doesn't sign messages older than 10 minutes, older ones are replays
+DEFAULT_MAX_MESSAGE_AGE = 600
+DEFAULT_DEDUPE_SIZE = 10000
+
+ALL_SUBSCRIPTIONS = "*"
+
+EventSubMessage = namedtuple(
+    "EventSubMessage",
+    ["id", "type", "subscription_type", "timestamp", "subscription", "event"],
+)
+
+
+def compute_signature(secret, message_id, timestamp, body):
+    """Return the `Twitch-Eventsub-Message-Signature` of a message."""
+    if isinstance(secret, str):
+        secret = secret.encode("utf-8")
+    message = message_id.encode("utf-8") + timestamp.encode("utf-8") + body
+    return "sha256=" + hmac.new(secret, message, hashlib.sha256).hexdigest()
+
+
+def _stream_from_event(event):
+    return {
+        "id": event.get("id"),
+        "user_id": event.get("broadcaster_user_id"),
+        "user_login": event.get("broadcaster_user_login"),
+        "user_name": event.get("broadcaster_user_name"),
+        "type": event.get("type"),
+        "started_at": event.get("started_at"),
+    }
+
+
+def _follow_from_event(event):
+    return {
+        "from_id": event.get("user_id"),
+        "from_login": event.get("user_login"),
+        "from_name": event.get("user_name"),
+        "to_id": event.get("broadcaster_user_id"),
+        "to_login": event.get("broadcaster_user_login"),
+        "to_name": event.get("broadcaster_user_name"),
+        "followed_at": event.get("followed_at"),
+    }
+
+
+# Events converted to the resources returned by the API
+EVENT_RESOURCES = {
+    SUBSCRIPTION_STREAM_ONLINE: (Stream, _stream_from_event),
+    SUBSCRIPTION_STREAM_OFFLINE: (Stream, _stream_from_event),
+    SUBSCRIPTION_CHANNEL_FOLLOW: (Follow, _follow_from_event),
+}
+
+
+class EventSubWebhook(object):
+    """
+    Handles EventSub webhook requests independently of the HTTP server.
+
+    Requests with an invalid signature, or a timestamp older than
+    `max_message_age` seconds, are rejected. Verification challenges are
+    answered, and notifications and revocations are dispatched to the handlers
+    registered with `on` and `on_revocation`. The IDs of the last `dedupe_size`
+    messages are remembered so that messages Twitch delivers again are only
+    dispatched once.
+    """
+
+    def __init__(
+        self,
+        secret,
+        max_message_age=DEFAULT_MAX_MESSAGE_AGE,
+        dedupe_size=DEFAULT_DEDUPE_SIZE,
+        raw=False,
+    ):
+        if not secret:
+            raise TwitchAttributeException("EventSub secret is required")
+        self._secret = secret
+        self._max_message_age = max_message_age
+        self._dedupe_size = dedupe_size
+        self._raw = raw
+        self._handlers = {}
+        self._revocation_handlers = []
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on(self, subscription_type, handler=None):
+        """
+        Call `handler` with an `EventSubMessage` for every notification of
+        `subscription_type`, or of every type if it's "*". Can be used as a
+        decorator.
+        """
+        if handler is None:
+            return lambda handler: self.on(subscription_type, handler)
+        self._handlers.setdefault(subscription_type, []).append(handler)
+        return handler
+
+    def on_revocation(self, handler):
+        """Call `handler` with an `EventSubMessage` when a subscription is revoked."""
+        self._revocation_handlers.append(handler)
+        return handler
+
+    def verify(self, headers, body):
+        """Return whether the signature and timestamp of a request are valid."""
+        headers = {key.lower(): value for key, value in headers.items()}
+        message_id = headers.get(HEADER_MESSAGE_ID.lower())
+        timestamp = headers.get(HEADER_MESSAGE_TIMESTAMP.lower())
+        signature = headers.get(HEADER_MESSAGE_SIGNATURE.lower())
+        if not message_id or not timestamp or not signature:
+            return False
+        expected = compute_signature(self._secret, message_id, timestamp, body)
+        if not hmac.compare_digest(expected, signature):
+            return False
+        try:
+            age = datetime.now(timezone.utc) - parse_datetime(timestamp)
+        except ValueError:
+            return False
+        return age <= timedelta(seconds=self._max_message_age)
+
+    def _mark_seen(self, message_id):
+        """
+        Remember `message_id` and return whether it's new. Checking and marking
+        happen under one lock so that concurrent deliveries of the same message
+        aren't both dispatched.
+        """
+        with self._lock:
+            if message_id in self._seen:
+                self._seen.move_to_end(message_id)
+                return False
+            self._seen[message_id] = True
+            while len(self._seen) > self._dedupe_size:
+                self._seen.popitem(last=False)
+            return True
+
+    def _forget(self, message_id):
+        with self._lock:
+            self._seen.pop(message_id, None)
+
+    def _construct_event(self, subscription_type, event):
+        if self._raw or event is None:
+            return event
+        resource, convert = EVENT_RESOURCES.get(subscription_type, (None, None))
+        if resource is None:
+            return TwitchObject.construct_from(event)
+        return resource.construct_from(convert(event))
+
+    def handle(self, headers, body):
+        """
+        Handle a request with `headers` and the raw `body` bytes and return the
+        status code, content type and body of the response.
+        """
+        headers = {key.lower(): value for key, value in headers.items()}
+        if not self.verify(headers, body):
+            return 403, "text/plain", b"Invalid signature"
+
+        message_id = headers[HEADER_MESSAGE_ID.lower()]
+        message_type = headers.get(HEADER_MESSAGE_TYPE.lower())
+        try:
+            payload = decode_json(body)
+        except ValueError:
+            return 400, "text/plain", b"Invalid JSON"
+
+        if message_type == MESSAGE_TYPE_VERIFICATION:
+            return 200, "text/plain", payload.get("challenge", "").encode("utf-8")
+        if message_type not in MESSAGE_TYPES:
+            return 400, "text/plain", b"Unknown message type"
+
+        subscription = payload.get("subscription") or {}
+        subscription_type = headers.get(
+            HEADER_SUBSCRIPTION_TYPE.lower(), subscription.get("type")
+        )
+        message = EventSubMessage(
+            id=message_id,
+            type=message_type,
+            subscription_type=subscription_type,
+            timestamp=headers[HEADER_MESSAGE_TIMESTAMP.lower()],
+            subscription=subscription,
+            event=self._construct_event(subscription_type, payload.get("event")),
+        )
+        if message_type == MESSAGE_TYPE_REVOCATION:
+            handlers = self._revocation_handlers
+        else:
+            handlers = self._handlers.get(subscription_type, []) + self._handlers.get(
+                ALL_SUBSCRIPTIONS, []
+            )
+
+        if not self._mark_seen(message_id):
+            return 204, "text/plain", b""
+        try:
+            for handler in handlers:
+                handler(message)
+        except Exception:
+            # Twitch retries messages that fail, so they're forgotten again
+            self._forget(message_id)
+            logger.exception("Handling EventSub message %s failed", message_id)
+            return 500, "text/plain", b"Handler failed"
+
+        return 204, "text/plain", b""
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    # http.server.ThreadingHTTPServer is only available from Python 3.7
+    daemon_threads = True
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        if self.path.split("?")[0] != self.server.webhook_path:
+            self._respond(404, "text/plain", b"Not found")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        self._respond(*self.server.webhook.handle(dict(self.headers.items()), body))
+
+    def _respond(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+class EventSubReceiver(EventSubWebhook):
+    """
+    HTTP server receiving EventSub webhooks on `path`.
+
+    Twitch only delivers to HTTPS callbacks on port 443, so the receiver is
+    usually run behind a reverse proxy terminating TLS. Port 0 picks a free port.
+    """
+
+    def __init__(self, secret, host="127.0.0.1", port=8080, path="/", **kwargs):
+        super(EventSubReceiver, self).__init__(secret, **kwargs)
+        self._server = _ThreadingHTTPServer((host, port), _RequestHandler)
+        self._server.webhook = self
+        self._server.webhook_path = path
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return "http://{}:{}{}".format(host, port, self._server.webhook_path)
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def start(self):
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.1},
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def build_message(
+    secret,
+    message_type,
+    subscription_type,
+    payload,
+    message_id=None,
+    timestamp=None,
+):
+    """
+    Return the signed headers and body of an EventSub message, as Twitch would
+    send them. Used by `EventSubTestClient`.
+    """
+    message_id = message_id or str(uuid.uuid4())
+    timestamp = timestamp or datetime.now(timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%S.%fZ"
+    )
+    body = json.dumps(payload).encode("utf-8")
+    headers = {
+        HEADER_MESSAGE_ID: message_id,
+        HEADER_MESSAGE_TIMESTAMP: timestamp,
+        HEADER_MESSAGE_SIGNATURE: compute_signature(
+            secret, message_id, timestamp, body
+        ),
+        HEADER_MESSAGE_TYPE: message_type,
+        HEADER_SUBSCRIPTION_TYPE: subscription_type,
+        "Content-Type": "application/json",
+    }
+    return headers, body
+
+
+class EventSubTestClient(object):
+    """
+    Posts signed fixture messages to a receiver, e.g. an `EventSubReceiver`
+    started in the same process, for testing handlers without Twitch.
+    """
+
+    def __init__(self, url, secret, session=None):
+        self._url = url
+        self._secret = secret
+        self._session = session or create_session()
+
+    def _subscription(self, subscription_type, condition=None, status="enabled"):
+        return {
+            "id": str(uuid.uuid4()),
+            "status": status,
+            "type": subscription_type,
+            "version": "1",
+            "condition": condition or {},
+            "transport": {"method": "webhook", "callback": self._url},
+            "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+
+    def send(self, message_type, subscription_type, payload, **kwargs):
+        headers, body = build_message(
+            self._secret, message_type, subscription_type, payload, **kwargs
+        )
+        return self._session.post(self._url, data=body, headers=headers)
+
+    def send_verification(self, subscription_type, challenge="challenge", **kwargs):
+        payload = {
+            "subscription": self._subscription(
+                subscription_type, status="webhook_callback_verification_pending"
+            ),
+            "challenge": challenge,
+        }
+        return self.send(
+            MESSAGE_TYPE_VERIFICATION, subscription_type, payload, **kwargs
+        )
+
+    def send_notification(self, subscription_type, event, **kwargs):
+        payload = {
+            "subscription": self._subscription(subscription_type),
+            "event": event,
+        }
+        return self.send(
+            MESSAGE_TYPE_NOTIFICATION, subscription_type, payload, **kwargs
+        )
+
+    def send_revocation(
+        self, subscription_type, status="authorization_revoked", **kwargs
+    ):
+        payload = {"subscription": self._subscription(subscription_type, status=status)}
+        return self.send(MESSAGE_TYPE_REVOCATION, subscription_type, payload, **kwargs)
@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from twitch.exceptions import TwitchAttributeException
+from twitch.helix.bulk import MAX_IDS_PER_REQUEST
+
+DEFAULT_BATCH_WINDOW = 0.01
+DEFAULT_MEMO_SIZE = 10000
+DEFAULT_MEMO_TTL = 300
+
+
+class BatchLoader(object):
+    """
+    Batches single key lookups made from anywhere in the program.
+
+    Keys passed to `load` within `window` seconds of each other, up to
+    `max_batch_size` of them, are loaded with a single call to `batch_fn`, which
+    receives a list of keys and returns the found items. `key_fn` returns the key
+    of an item. Every `load` returns a `concurrent.futures.Future` resolved with
+    the item for its key, or None if `batch_fn` didn't return it.
+
+    Futures are memoized per key, so a key is only loaded again after its result
+    is older than `memo_ttl` seconds, after it was one of the least recently used
+    when more than `memo_size` keys are memoized, or after `clear` is called. Either
+    limit can be None to disable it, and `memoize=False` only shares pending loads.
+    """
+
+    def __init__(
+        self,
+        batch_fn,
+        key_fn,
+        window=DEFAULT_BATCH_WINDOW,
+        max_batch_size=MAX_IDS_PER_REQUEST,
+        memoize=True,
+        max_workers=4,
+        memo_size=DEFAULT_MEMO_SIZE,
+        memo_ttl=DEFAULT_MEMO_TTL,
+    ):
+        self._batch_fn = batch_fn
+        self._key_fn = key_fn
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._memoize = memoize
+        self._memo_size = memo_size
+        self._memo_ttl = memo_ttl
+        self._lock = threading.Lock()
+        self._pending = {}
+        # Maps keys to their future and the time it expires, least recently used first
+        self._memo = OrderedDict()
+        self._timer = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def _normalize_key(self, key):
+        return key
+
+    def _get_memoized(self, key):
+        # Must be called with the lock held
+        memoized = self._memo.get(key)
+        if memoized is None:
+            return None
+        future, expires = memoized
+        if expires is not None and expires <= time.monotonic():
+            del self._memo[key]
+            return None
+        self._memo.move_to_end(key)
+        return future
+
+    def _set_memoized(self, key, future):
+        # Must be called with the lock held
+        expires = None
+        if self._memo_ttl is not None:
+            expires = time.monotonic() + self._memo_ttl
+        self._memo[key] = (future, expires)
+        if self._memo_size is not None:
+            while len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+
+    def load(self, key):
+        """Return a future resolved with the item for `key`."""
+        key = self._normalize_key(key)
+        with self._lock:
+            future = self._get_memoized(key) or self._pending.get(key)
+            if future is not None:
+                return future
+
+            future = Future()
+            self._pending[key] = future
+            if self._memoize:
+                self._set_memoized(key, future)
+
+            if len(self._pending) >= self._max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return future
+
+    def load_many(self, keys):
+        """Return a list of futures, one for each of the `keys`."""
+        return [self.load(key) for key in keys]
+
+    def flush(self):
+        """Load the pending keys right away instead of waiting for the window to end."""
+        with self._lock:
+            self._dispatch()
+
+    def _dispatch(self):
+        # Must be called with the lock held
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            batch, self._pending = self._pending, {}
+            self._executor.submit(self._load_batch, batch)
+
+    def _load_batch(self, batch):
+        try:
+            items = self._batch_fn(list(batch))
+            found = {self._normalize_key(self._key_fn(item)): item for item in items}
+            for key, future in batch.items():
+                future.set_result(found.get(key))
+        except BaseException as e:
+            # Resolve every future, otherwise their callers would wait forever
+            failed = {k: f for k, f in batch.items() if not f.done()}
+            with self._lock:
+                for key, future in failed.items():
+                    # The key may have been evicted and loaded again in the meantime
+                    if self._memo.get(key, (None,))[0] is future:
+                        del self._memo[key]
+            for future in failed.values():
+                future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+
+    def clear(self, key=None):
+        """Forget the memoized result for `key`, or for every key."""
+        with self._lock:
+            if key is None:
+                self._memo.clear()
+            else:
+                self._memo.pop(self._normalize_key(key), None)
+
+    def close(self):
+        """Load the pending keys and wait for all batches to finish."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+
+class UserLoader(BatchLoader):
+    """Batches `TwitchHelix.get_users` lookups by user ID or by login name."""
+
+    def __init__(self, client, by="id", **kwargs):
+        if by == "id":
+            batch_fn = lambda keys: client.get_users(ids=keys)  # noqa: E731
+        elif by == "login":
+            batch_fn = lambda keys: client.get_users(login_names=keys)  # noqa: E731
+        else:
+            raise TwitchAttributeException("Users can be loaded by 'id' or 'login'")
+        self._by = by
+        super(UserLoader, self).__init__(
+            batch_fn, key_fn=lambda user: user[by], **kwargs
+        )
+
+    def _normalize_key(self, key):
+        return str(key).lower() if self._by == "login" else str(key)
+
+
+class GameLoader(BatchLoader):
+    """Batches `TwitchHelix.get_games` lookups by game ID or by name."""
+
+    def __init__(self, client, by="id", **kwargs):
+        if by == "id":
+            batch_fn = lambda keys: client.get_games(game_ids=keys)  # noqa: E731
+        elif by == "name":
+            batch_fn = lambda keys: client.get_games(names=keys)  # noqa: E731
+        else:
+            raise TwitchAttributeException("Games can be loaded by 'id' or 'name'")
+        self._by = by
+        super(GameLoader, self).__init__(
+            batch_fn, key_fn=lambda game: game[by], **kwargs
+        )
+
+    def _normalize_key(self, key):
+        return str(key).lower() if self._by == "name" else str(key)
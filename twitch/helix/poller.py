@@ -0,0 +1,190 @@
+import logging
+import threading
+import time
+from collections import namedtuple
+
+from twitch.exceptions import TwitchAttributeException
+
+logger = logging.getLogger(__name__)
+
+EVENT_LIVE = "live"
+EVENT_OFFLINE = "offline"
+EVENT_TITLE = "title"
+EVENT_GAME = "game"
+EVENT_VIEWERS = "viewers"
+EVENTS = (EVENT_LIVE, EVENT_OFFLINE, EVENT_TITLE, EVENT_GAME, EVENT_VIEWERS)
+
+DEFAULT_POLL_INTERVAL = 60
+
+
+class StreamState(
+    namedtuple(
+        "StreamState", ["user_id", "user_login", "game_id", "title", "viewer_count"]
+    )
+):
+    """The fields of a live stream that the poller keeps between polls."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_stream(cls, stream):
+        return cls(
+            stream.get("user_id"),
+            stream.get("user_login"),
+            stream.get("game_id"),
+            stream.get("title"),
+            stream.get("viewer_count"),
+        )
+
+
+class StreamEvent(
+    namedtuple("StreamEvent", ["type", "stream_id", "user_id", "old", "new"])
+):
+    """
+    A change between two polls.
+
+    For `live` events `new` is the stream returned by `get_streams`, for `offline`
+    events `old` is the last `StreamState` of the stream. `title`, `game` and
+    `viewers` events hold the old and new title, game ID or viewer count.
+    """
+
+    __slots__ = ()
+
+    @property
+    def delta(self):
+        """Change of the viewer count of `viewers` events."""
+        if self.type != EVENT_VIEWERS:
+            return None
+        return (self.new or 0) - (self.old or 0)
+
+
+class StreamPoller(object):
+    """
+    Polls `TwitchHelix.get_streams` and emits `StreamEvent`s for the differences
+    to the previous poll.
+
+    Only a `StreamState` per live stream is kept, indexed by stream ID, so memory
+    is proportional to the number of live streams. Streams can be missed while
+    paginating through a directory that changes under the cursor, so a stream is
+    only reported offline after it was missing from `offline_after` polls in a row.
+    Viewer count changes are reported once they're at least `min_viewer_delta`, or
+    never if it's None. The remaining keyword arguments are passed to `get_streams`.
+    """
+
+    def __init__(
+        self,
+        client,
+        min_viewer_delta=1,
+        offline_after=1,
+        initial_events=True,
+        page_size=100,
+        **params
+    ):
+        if offline_after < 1:
+            raise TwitchAttributeException("offline_after must be at least 1")
+        self._client = client
+        self._min_viewer_delta = min_viewer_delta
+        self._offline_after = offline_after
+        self._initial_events = initial_events
+        self._params = dict(params, page_size=page_size)
+        self._snapshot = {}
+        self._missing = {}
+        self._polls = 0
+
+    @property
+    def snapshot(self):
+        """Stream IDs mapped to the `StreamState` of every stream that's live."""
+        return dict(self._snapshot)
+
+    def __len__(self):
+        return len(self._snapshot)
+
+    def __contains__(self, stream_id):
+        return stream_id in self._snapshot
+
+    def _diff(self, stream_id, old, stream, events):
+        title = stream.get("title")
+        if title != old.title:
+            events.append(
+                StreamEvent(EVENT_TITLE, stream_id, old.user_id, old.title, title)
+            )
+        game_id = stream.get("game_id")
+        if game_id != old.game_id:
+            events.append(
+                StreamEvent(EVENT_GAME, stream_id, old.user_id, old.game_id, game_id)
+            )
+        viewer_count = stream.get("viewer_count")
+        if (
+            self._min_viewer_delta is not None
+            and viewer_count != old.viewer_count
+            and abs((viewer_count or 0) - (old.viewer_count or 0))
+            >= self._min_viewer_delta
+        ):
+            events.append(
+                StreamEvent(
+                    EVENT_VIEWERS,
+                    stream_id,
+                    old.user_id,
+                    old.viewer_count,
+                    viewer_count,
+                )
+            )
+
+    def poll(self):
+        """Walk every page of `get_streams` once and return the list of events."""
+        emit = self._polls > 0 or self._initial_events
+        events = []
+        snapshot = {}
+        for stream in self._client.get_streams(**self._params):
+            stream_id = stream["id"]
+            if stream_id in snapshot:
+                # Streams can move to the next page while paginating
+                continue
+            old = self._snapshot.get(stream_id)
+            if old is None:
+                if emit:
+                    events.append(
+                        StreamEvent(
+                            EVENT_LIVE, stream_id, stream.get("user_id"), None, stream
+                        )
+                    )
+            else:
+                self._diff(stream_id, old, stream, events)
+            snapshot[stream_id] = StreamState.from_stream(stream)
+
+        missing = {}
+        for stream_id, old in self._snapshot.items():
+            if stream_id in snapshot:
+                continue
+            count = self._missing.get(stream_id, 0) + 1
+            if count < self._offline_after:
+                # Keep the stream until it was missing often enough
+                snapshot[stream_id] = old
+                missing[stream_id] = count
+            else:
+                events.append(
+                    StreamEvent(EVENT_OFFLINE, stream_id, old.user_id, old, None)
+                )
+
+        self._snapshot = snapshot
+        self._missing = missing
+        self._polls += 1
+        return events
+
+    def run(self, handler, interval=DEFAULT_POLL_INTERVAL, stop_event=None):
+        """
+        Poll every `interval` seconds and call `handler` with every event until
+        `stop_event`, a `threading.Event`, is set. Failed polls are logged and
+        retried in the next interval.
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            started = time.monotonic()
+            try:
+                events = self.poll()
+            except Exception:
+                logger.exception("Polling streams failed")
+            else:
+                for event in events:
+                    handler(event)
+            stop_event.wait(max(interval - (time.monotonic() - started), 0))
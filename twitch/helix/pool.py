@@ -0,0 +1,119 @@
+import logging
+import threading
+
+from twitch.exceptions import TwitchAttributeException, TwitchAuthException
+from twitch.helix.ratelimit import LocalRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class Credentials(object):
+    """A client ID and OAuth token with the rate limit bucket that belongs to them."""
+
+    def __init__(self, client_id, oauth_token=None, rate_limiter=None):
+        if not client_id:
+            raise TwitchAttributeException("Client ID is required")
+        self.client_id = client_id
+        self.oauth_token = oauth_token
+        self.rate_limiter = rate_limiter or LocalRateLimiter()
+        self.revoked = False
+
+    def __repr__(self):
+        return "<{} client_id={!r}{}>".format(
+            self.__class__.__name__,
+            self.client_id,
+            " revoked" if self.revoked else "",
+        )
+
+    def get_request_headers(self):
+        headers = {"Client-ID": self.client_id}
+        if self.oauth_token:
+            headers["Authorization"] = "Bearer {}".format(self.oauth_token)
+        return headers
+
+
+class CredentialPool(object):
+    """
+    Shards requests over several sets of credentials, each with its own rate limit.
+
+    `credentials` are `Credentials` or `(client_id, oauth_token)` tuples. Every
+    request is sent with the credentials that have the most requests left in
+    their rate limit window, and credentials Twitch rejects with 401 are revoked
+    and not used anymore.
+    """
+
+    def __init__(self, credentials):
+        self._credentials = [
+            item if isinstance(item, Credentials) else Credentials(*item)
+            for item in credentials
+        ]
+        if not self._credentials:
+            raise TwitchAttributeException(
+                "At least one set of credentials is required"
+            )
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def __len__(self):
+        return len(self._credentials)
+
+    def __iter__(self):
+        return iter(list(self._credentials))
+
+    @property
+    def active(self):
+        """Credentials that haven't been revoked."""
+        return [item for item in self._credentials if not item.revoked]
+
+    def _choose(self, exclude=(), rotate=True):
+        best = None
+        best_available = -1
+        # Start at a rotating offset so that ties are spread over the credentials
+        count = len(self._credentials)
+        for offset in range(count):
+            item = self._credentials[(self._next + offset) % count]
+            if item.revoked or item in exclude:
+                continue
+            available = item.rate_limiter.available()
+            if available is None:
+                # Nothing is known yet, so the bucket is presumably full
+                available = float("inf")
+            if available > best_available:
+                best, best_available = item, available
+        if rotate:
+            self._next = (self._next + 1) % count
+        return best, best_available
+
+    def acquire(self, exclude=()):
+        """
+        Choose the credentials for a request, other than `exclude`, and return them
+        with the number of seconds to wait before sending it. Raises
+        `TwitchAuthException` if every set of credentials was revoked.
+        """
+        with self._lock:
+            credentials, _ = self._choose(exclude)
+            if credentials is None and exclude:
+                credentials, _ = self._choose()
+        if credentials is None:
+            raise TwitchAuthException(
+                "Every set of credentials in the pool was revoked"
+            )
+        return credentials, credentials.rate_limiter.acquire()
+
+    def has_available(self, exclude=()):
+        """Return whether credentials other than `exclude` can send a request now."""
+        with self._lock:
+            _, available = self._choose(exclude, rotate=False)
+        return available > 0
+
+    def revoke(self, credentials):
+        """Stop using `credentials`, e.g. because their token was revoked."""
+        if not credentials.revoked:
+            logger.warning(
+                "Credentials for client ID %s were revoked", credentials.client_id
+            )
+        credentials.revoked = True
+
+    def restore(self, credentials):
+        """Use revoked `credentials` again, e.g. after refreshing their token."""
+        credentials.revoked = False
@@ -0,0 +1,164 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from twitch.exceptions import TwitchException
+
+logger = logging.getLogger(__name__)
+
+# Add 0.1s to the wait time to allow Twitch to reset their counter
+RESET_MARGIN = 0.1
+
+
+def _empty_state():
+    return {"limit": None, "remaining": None, "reset": None, "not_before": 0}
+
+
+def _get_int_header(headers, name):
+    """Return header `name` as an integer, or None if it's missing or malformed."""
+    value = headers.get(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        logger.debug("Ignoring malformed %s header: %r", name, value)
+        return None
+
+
+class RateLimiter(object):
+    """
+    Token bucket following Twitch's `Ratelimit-*` response headers.
+
+    `acquire` hands out a permit before every request and returns how long the
+    caller has to wait before sending it, so that requests are spread out
+    proactively instead of running into 429 responses. Subclasses decide where
+    the bucket state is stored by implementing `_locked_state`.
+    """
+
+    @contextmanager
+    def _locked_state(self):
+        raise NotImplementedError()
+
+    def acquire(self):
+        """Reserve a permit and return the number of seconds to wait before using it."""
+        now = time.time()
+        with self._locked_state() as state:
+            wait_time = max(state["not_before"] - now, 0)
+
+            if state["remaining"] is None:
+                return wait_time
+
+            if state["remaining"] > 0:
+                state["remaining"] -= 1
+                return wait_time
+
+            # The bucket is empty, so this permit comes from the next window
+            reset = state["reset"]
+            if reset is not None and reset > now:
+                state["not_before"] = reset + RESET_MARGIN
+                wait_time = state["not_before"] - now
+                logger.debug(
+                    "Waiting for rate limit reset",
+                    extra={"rate_limit_reset": reset, "wait_time": wait_time},
+                )
+            if state["limit"]:
+                state["remaining"] = state["limit"] - 1
+            else:
+                state["remaining"] = None
+            state["reset"] = None
+            return wait_time
+
+    def available(self):
+        """
+        Return the number of requests that can be sent right away according to the
+        last response, or None if nothing is known about the bucket yet.
+        """
+        now = time.time()
+        with self._locked_state() as state:
+            if state["not_before"] > now:
+                return 0
+            if state["remaining"] is None:
+                return None
+            if state["remaining"] > 0:
+                return state["remaining"]
+            reset = state["reset"]
+            if reset is not None and reset > now:
+                return 0
+            return state["limit"]
+
+    def update(self, headers):
+        """Update the bucket from the `Ratelimit-*` headers of a response."""
+        limit = _get_int_header(headers, "Ratelimit-Limit")
+        remaining = _get_int_header(headers, "Ratelimit-Remaining")
+        reset = _get_int_header(headers, "Ratelimit-Reset")
+        if remaining is None and reset is None:
+            return
+
+        with self._locked_state() as state:
+            if limit is not None:
+                state["limit"] = limit
+            if remaining is not None:
+                state["remaining"] = remaining
+            if reset is not None:
+                state["reset"] = reset
+
+    def reset(self):
+        """Forget everything known about the bucket."""
+        with self._locked_state() as state:
+            state.update(_empty_state())
+
+
+class LocalRateLimiter(RateLimiter):
+    """Rate limiter shared by the threads of a single process."""
+
+    def __init__(self):
+        self._state = _empty_state()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _locked_state(self):
+        with self._lock:
+            yield self._state
+
+
+class FileRateLimiter(RateLimiter):
+    """
+    Rate limiter shared by every process using the same `path`.
+
+    The bucket is stored as JSON in `path` and guarded with an exclusive `flock`,
+    so it only works on POSIX systems and local file systems.
+    """
+
+    def __init__(self, path):
+        if fcntl is None:
+            raise TwitchException("FileRateLimiter requires fcntl")
+        self._path = path
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _locked_state(self):
+        with self._lock:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                with os.fdopen(os.dup(fd), "r+") as f:
+                    content = f.read()
+                    state = json.loads(content) if content else _empty_state()
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(state, f)
+            finally:
+                os.close(fd)
+
+
+default_rate_limiter = LocalRateLimiter()
@@ -0,0 +1,350 @@
+import hashlib
+import json
+import os
+import re
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+from twitch.constants import DEFAULT_TIMEOUT
+from twitch.exceptions import TwitchAttributeException, TwitchException
+from twitch.retry import RetryPolicy
+from twitch.session import create_session, iter_response, read_response_into
+
+DEFAULT_DOWNLOAD_WORKERS = 4
+
+QUALITY_BEST = "best"
+QUALITY_WORST = "worst"
+
+PROGRESS_SUFFIX = ".progress"
+
+_ATTRIBUTE_RE = re.compile(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)')
+
+Variant = namedtuple("Variant", ["name", "group_id", "bandwidth", "resolution", "url"])
+Segment = namedtuple("Segment", ["index", "url", "duration"])
+
+
+def _decode(playlist):
+    if isinstance(playlist, bytes):
+        return playlist.decode("utf-8")
+    return playlist
+
+
+def _parse_attributes(value):
+    return {key: value.strip('"') for key, value in _ATTRIBUTE_RE.findall(value)}
+
+
+def _lines(playlist):
+    lines = [line.strip() for line in _decode(playlist).splitlines()]
+    if not lines or lines[0] != "#EXTM3U":
+        raise TwitchException("Not an M3U8 playlist")
+    return [line for line in lines if line]
+
+
+def is_master_playlist(playlist):
+    return "#EXT-X-STREAM-INF:" in _decode(playlist)
+
+
+def parse_master_playlist(playlist, base_url=None):
+    """
+    Return the `Variant`s of an M3U8 master playlist, such as the one returned by
+    `Videos.download_vod`. Relative URLs are resolved against `base_url`.
+    """
+    names = {}
+    variants = []
+    stream_info = None
+    for line in _lines(playlist):
+        if line.startswith("#EXT-X-MEDIA:"):
+            attributes = _parse_attributes(line.split(":", 1)[1])
+            if "GROUP-ID" in attributes and "NAME" in attributes:
+                names[attributes["GROUP-ID"]] = attributes["NAME"]
+        elif line.startswith("#EXT-X-STREAM-INF:"):
+            stream_info = _parse_attributes(line.split(":", 1)[1])
+        elif not line.startswith("#") and stream_info is not None:
+            group_id = stream_info.get("VIDEO")
+            resolution = stream_info.get("RESOLUTION")
+            variants.append(
+                Variant(
+                    name=names.get(group_id) or group_id or resolution,
+                    group_id=group_id,
+                    bandwidth=int(stream_info.get("BANDWIDTH", 0)),
+                    resolution=resolution,
+                    url=urljoin(base_url or "", line),
+                )
+            )
+            stream_info = None
+    return variants
+
+
+def parse_media_playlist(playlist, base_url=None):
+    """
+    Return the `Segment`s of an M3U8 media playlist in playback order. Relative URLs
+    are resolved against `base_url`, usually the URL of the playlist.
+    """
+    segments = []
+    duration = None
+    for line in _lines(playlist):
+        if line.startswith("#EXTINF:"):
+            duration = float(line.split(":", 1)[1].split(",")[0])
+        elif not line.startswith("#"):
+            segments.append(
+                Segment(
+                    index=len(segments),
+                    url=urljoin(base_url or "", line),
+                    duration=duration,
+                )
+            )
+            duration = None
+    return segments
+
+
+def select_variant(variants, quality=None):
+    """
+    Select a variant by `quality`, which is "best" (the default), "worst", or
+    the name, group ID or resolution of a variant, e.g. "720p60", "chunked" or
+    "1280x720". "source" selects Twitch's source quality.
+    """
+    if not variants:
+        raise TwitchException("Playlist has no variants")
+
+    quality = (quality or QUALITY_BEST).lower()
+    if quality == QUALITY_BEST:
+        return max(variants, key=lambda variant: variant.bandwidth)
+    if quality == QUALITY_WORST:
+        return min(variants, key=lambda variant: variant.bandwidth)
+
+    for variant in variants:
+        names = [
+            (variant.name or "").lower(),
+            (variant.group_id or "").lower(),
+            (variant.resolution or "").lower(),
+        ]
+        if quality in names or names[0].split(" ")[0] == quality:
+            return variant
+        if quality == "source" and (names[1] == "chunked" or "source" in names[0]):
+            return variant
+
+    raise TwitchAttributeException(
+        "Quality {} is not valid. Valid values are {}".format(
+            quality,
+            [QUALITY_BEST, QUALITY_WORST] + [variant.name for variant in variants],
+        )
+    )
+
+
+class DownloadStats(object):
+    """Progress and throughput of a download."""
+
+    def __init__(self, total_segments, resumed_segments=0, resumed_bytes=0):
+        self.total_segments = total_segments
+        self.resumed_segments = resumed_segments
+        self.segments = resumed_segments
+        self.bytes = resumed_bytes
+        self.downloaded_bytes = 0
+        self.started_at = time.monotonic()
+        self.finished_at = None
+
+    def __repr__(self):
+        return "<{} {}/{} segments, {} bytes, {:.0f} B/s>".format(
+            self.__class__.__name__,
+            self.segments,
+            self.total_segments,
+            self.bytes,
+            self.throughput,
+        )
+
+    @property
+    def elapsed(self):
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def throughput(self):
+        """Bytes downloaded per second, not counting resumed segments."""
+        elapsed = self.elapsed
+        return self.downloaded_bytes / elapsed if elapsed > 0 else 0.0
+
+    def _add(self, size):
+        self.segments += 1
+        self.bytes += size
+        self.downloaded_bytes += size
+
+
+def _fingerprint(segments):
+    # Query strings may hold short-lived tokens, so only paths identify a playlist
+    digest = hashlib.sha1()
+    for segment in segments:
+        digest.update(urlsplit(segment.url).path.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class _Progress(object):
+    """Journal of the segments written to a file, used to resume the download."""
+
+    def __init__(self, path, fingerprint):
+        self.path = path + PROGRESS_SUFFIX
+        self.fingerprint = fingerprint
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return 0, 0
+        if state.get("fingerprint") != self.fingerprint:
+            return 0, 0
+        return state["segments"], state["bytes"]
+
+    def save(self, segments, size):
+        state = {"fingerprint": self.fingerprint, "segments": segments, "bytes": size}
+        with open(self.path + ".tmp", "w") as f:
+            json.dump(state, f)
+        os.replace(self.path + ".tmp", self.path)
+
+    def remove(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class HLSDownloader(object):
+    """
+    Downloads HLS videos, such as VODs, by fetching their `.ts` segments
+    concurrently over a pooled session and writing them in order.
+
+    At most `max_pending` segments, by default twice the number of `workers`, are
+    downloaded or waiting to be written at any time, which bounds the memory used.
+    """
+
+    def __init__(
+        self,
+        session=None,
+        workers=DEFAULT_DOWNLOAD_WORKERS,
+        max_pending=None,
+        retry_policy=None,
+        timeout=DEFAULT_TIMEOUT,
+    ):
+        if workers < 1:
+            raise TwitchAttributeException("Number of workers must be at least 1")
+        self._session = session or create_session(pool_maxsize=workers)
+        self._workers = workers
+        self._max_pending = max(max_pending or 2 * workers, 1)
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._timeout = timeout
+
+    def _get(self, url):
+        response = self._retry_policy.call(
+            "GET", lambda: self._session.get(url, timeout=self._timeout)
+        )
+        response.raise_for_status()
+        return response.content
+
+    def _get_segment(self, url):
+        response = self._retry_policy.call(
+            "GET", lambda: self._session.get(url, timeout=self._timeout, stream=True)
+        )
+        if not response.ok:
+            response.close()
+        response.raise_for_status()
+        length = response.headers.get("Content-Length")
+        if length is None or response.headers.get("Content-Encoding"):
+            return b"".join(iter_response(response))
+        # Read the segment straight into a buffer of its size, instead of joining chunks
+        buffer = bytearray(int(length))
+        size = read_response_into(response, buffer)
+        return memoryview(buffer)[:size]
+
+    def get_variants(self, playlist, base_url=None):
+        """Return the variants of a master playlist, or the URL of a media playlist."""
+        if not is_master_playlist(playlist):
+            return [Variant(None, None, 0, None, base_url)]
+        return parse_master_playlist(playlist, base_url=base_url)
+
+    def get_segments(self, variant):
+        """Fetch the media playlist of a `Variant` or URL and return its segments."""
+        url = variant.url if isinstance(variant, Variant) else variant
+        return parse_media_playlist(self._get(url), base_url=url)
+
+    def download(
+        self,
+        playlist,
+        output,
+        quality=None,
+        base_url=None,
+        resume=True,
+        progress=None,
+    ):
+        """
+        Download the video of a master or media `playlist` into `output` and return
+        the `DownloadStats`.
+
+        `output` is a path or a writable binary file. Downloads into a path are
+        resumed from the last fully written segment if they were interrupted,
+        unless `resume` is False. `progress` is called with the `DownloadStats`
+        after every segment.
+        """
+        if is_master_playlist(playlist):
+            variant = select_variant(
+                parse_master_playlist(playlist, base_url=base_url), quality
+            )
+            segments = self.get_segments(variant)
+        else:
+            segments = parse_media_playlist(playlist, base_url=base_url)
+        return self.download_segments(
+            segments, output, resume=resume, progress=progress
+        )
+
+    def download_segments(self, segments, output, resume=True, progress=None):
+        """Download `segments` in order into `output`, see `download`."""
+        if not isinstance(output, (str, os.PathLike)):
+            stats = DownloadStats(len(segments))
+            self._write_segments(segments, output, stats, progress)
+            return stats
+
+        path = os.fspath(output)
+        journal = _Progress(path, _fingerprint(segments))
+        done, size = journal.load() if resume else (0, 0)
+        if done and os.path.exists(path) and os.path.getsize(path) >= size:
+            f = open(path, "r+b")
+            f.truncate(size)
+            f.seek(size)
+        else:
+            done, size = 0, 0
+            f = open(path, "wb")
+
+        stats = DownloadStats(len(segments), resumed_segments=done, resumed_bytes=size)
+
+        def on_segment(stats):
+            f.flush()
+            journal.save(stats.segments, stats.bytes)
+            if progress is not None:
+                progress(stats)
+
+        with f:
+            self._write_segments(segments[done:], f, stats, on_segment)
+        journal.remove()
+        return stats
+
+    def _write_segments(self, segments, sink, stats, progress):
+        pending = deque()
+        remaining = iter(segments)
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            try:
+                for segment in remaining:
+                    pending.append(executor.submit(self._get_segment, segment.url))
+                    if len(pending) >= self._max_pending:
+                        break
+                while pending:
+                    content = pending.popleft().result()
+                    segment = next(remaining, None)
+                    if segment is not None:
+                        pending.append(executor.submit(self._get_segment, segment.url))
+                    sink.write(content)
+                    stats._add(len(content))
+                    if progress is not None:
+                        progress(stats)
+            finally:
+                for future in pending:
+                    future.cancel()
+                stats.finished_at = time.monotonic()
@@ -1,40 +1,39 @@
-from datetime import datetime
-
-
-def convert_to_twitch_object(name, data):
-    types = {
-        "channel": Channel,
-        "videos": Video,
-        "user": User,
-        "game": Game,
-        "stream": Stream,
-        "comments": Comment,
-        "owner": User,
-    }
-
-    special_types = {
-        "created_at": _DateTime,
-        "updated_at": _DateTime,
-        "published_at": _DateTime,
-        "started_at": _DateTime,
-        "followed_at": _DateTime,
-    }
+from datetime import datetime, timezone
 
+DATETIME_FIELDS = frozenset(
+    ["created_at", "updated_at", "published_at", "started_at", "followed_at"]
+)
+
+
+def convert_to_twitch_object(name, data, lazy=False, parse_datetimes=True):
     if isinstance(data, list):
-        return [convert_to_twitch_object(name, x) for x in data]
+        return [
+            convert_to_twitch_object(
+                name, x, lazy=lazy, parse_datetimes=parse_datetimes
+            )
+            for x in data
+        ]
 
-    if name in special_types:
-        obj = special_types.get(name)
-        return obj.construct_from(data)
+    if name in DATETIME_FIELDS:
+        return _DateTime.construct_from(data) if parse_datetimes else data
 
-    if isinstance(data, dict) and name in types:
-        obj = types.get(name)
-        return obj.construct_from(data)
+    if isinstance(data, dict) and name in _TYPES:
+        obj = _TYPES[name]
+        return obj.construct_from(data, lazy=lazy, parse_datetimes=parse_datetimes)
 
     return data
 
 
+def _needs_conversion(name, data):
+    return isinstance(data, (dict, list)) or name in DATETIME_FIELDS
+
+
 class TwitchObject(dict):
+    # Keys whose values are converted on first access, only set on lazy objects
+    _unconverted = frozenset()
+    # Only set on objects whose timestamps are kept as strings
+    _parse_datetimes = True
+
     def __setattr__(self, name, value):
         if name[0] == "_" or name in self.__dict__:
             return super(TwitchObject, self).__setattr__(name, value)
@@ -42,6 +41,9 @@ class TwitchObject(dict):
         self[name] = value
 
     def __getattr__(self, name):
+        if name.startswith("__"):
+            # Special methods that copy and pickle look up, like __setstate__
+            raise AttributeError(name)
         return self[name]
 
     def __delattr__(self, name):
@@ -50,32 +52,158 @@ class TwitchObject(dict):
 
         del self[name]
 
+    def __getitem__(self, key):
+        value = super(TwitchObject, self).__getitem__(key)
+        if key in self._unconverted:
+            value = convert_to_twitch_object(
+                key, value, lazy=True, parse_datetimes=self._parse_datetimes
+            )
+            super(TwitchObject, self).__setitem__(key, value)
+            self._unconverted.discard(key)
+        return value
+
     def __setitem__(self, key, value):
         key = key.lstrip("_")
+        if self._unconverted:
+            self._unconverted.discard(key)
         super(TwitchObject, self).__setitem__(key, value)
 
+    def __delitem__(self, key):
+        super(TwitchObject, self).__delitem__(key)
+        if self._unconverted:
+            self._unconverted.discard(key)
+
+    def _convert_all(self):
+        for key in list(self._unconverted):
+            self[key]
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def values(self):
+        self._convert_all()
+        return super(TwitchObject, self).values()
+
+    def items(self):
+        self._convert_all()
+        return super(TwitchObject, self).items()
+
+    def copy(self):
+        self._convert_all()
+        return super(TwitchObject, self).copy()
+
+    def pop(self, key, *args):
+        if key in self._unconverted:
+            self[key]
+        return super(TwitchObject, self).pop(key, *args)
+
+    def __eq__(self, other):
+        self._convert_all()
+        if isinstance(other, TwitchObject):
+            other._convert_all()
+        return super(TwitchObject, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        self._convert_all()
+        return super(TwitchObject, self).__repr__()
+
+    def __reduce__(self):
+        # Copies and unpickled objects are fully converted, so they don't need to
+        # know which keys were left unconverted
+        self._convert_all()
+        state = {k: v for k, v in self.__dict__.items() if k != "_unconverted"}
+        return (type(self), (), state or None, None, iter(dict.items(self)))
+
     @classmethod
-    def construct_from(cls, values):
+    def construct_from(cls, values, lazy=False, parse_datetimes=True):
+        """
+        Construct the object from the decoded JSON `values`.
+
+        With `lazy`, nested objects and datetimes are only converted when they're
+        first accessed. Without `parse_datetimes`, timestamps are kept as strings.
+        """
         instance = cls()
-        instance.refresh_from(values)
+        instance.refresh_from(values, lazy=lazy, parse_datetimes=parse_datetimes)
         return instance
 
-    def refresh_from(self, values):
-        for key, value in values.copy().items():
-            self.__setitem__(key, convert_to_twitch_object(key, value))
+    def refresh_from(self, values, lazy=False, parse_datetimes=True):
+        if not parse_datetimes:
+            self._parse_datetimes = False
+        for key, value in values.items():
+            if lazy and _needs_conversion(key, value):
+                self.__setitem__(key, value)
+                if not self._unconverted:
+                    self._unconverted = set()
+                self._unconverted.add(key.lstrip("_"))
+            else:
+                self.__setitem__(
+                    key,
+                    convert_to_twitch_object(
+                        key, value, parse_datetimes=parse_datetimes
+                    ),
+                )
+
+
+try:
+    _fromisoformat = datetime.fromisoformat
+except AttributeError:  # pragma: no cover
+    # Python 3.6
+    _fromisoformat = None
+
+
+def parse_datetime(value):
+    """
+    Parse a timestamp like `2017-08-14T16:08:32Z` or `2017-03-06T18:40:51.855Z`
+    into a timezone-aware UTC datetime.
+    """
+    # fromisoformat is implemented in C, but only accepts 0, 3 or 6 fractional digits
+    # and no `Z` before Python 3.11
+    if _fromisoformat is not None and value[-1:] == "Z" and len(value) in (20, 24, 27):
+        try:
+            return _fromisoformat(value[:-1] + "+00:00")
+        except ValueError:
+            pass
+
+    # Slicing the fixed-width format is still several times faster than strptime
+    if (
+        len(value) >= 20
+        and value[-1] in "Zz"
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] in "Tt "
+        and value[13] == ":"
+        and value[16] == ":"
+        and (len(value) == 20 or value[19] == ".")
+    ):
+        fraction = value[20:-1]
+        return datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            int(fraction[:6].ljust(6, "0")) if fraction else 0,
+            tzinfo=timezone.utc,
+        )
+
+    # Timestamps with a numeric UTC offset
+    try:
+        dt = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        dt = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+    return dt.astimezone(timezone.utc)
 
 
 class _DateTime(object):
     @classmethod
     def construct_from(cls, value):
         if value is None:
-            return None
-        try:
-            dt = datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
-        except ValueError:
-            dt = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ")
-
-        return dt
+            return value
+        return parse_datetime(value)
 
 
 class Channel(TwitchObject):
@@ -156,3 +284,15 @@ class UserBlock(TwitchObject):
 
 class Video(TwitchObject):
     pass
+
+
+# Resources nested objects are converted to, by the key they're stored under
+_TYPES = {
+    "channel": Channel,
+    "videos": Video,
+    "user": User,
+    "game": Game,
+    "stream": Stream,
+    "comments": Comment,
+    "owner": User,
+}
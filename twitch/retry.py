@@ -0,0 +1,143 @@
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+from requests.exceptions import ConnectionError, Timeout
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+DEFAULT_RETRY_EXCEPTIONS = (ConnectionError, Timeout)
+
+
+def _get_hinted_delay(response):
+    """Return the delay requested by the `Retry-After` or `Ratelimit-Reset` headers."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            try:
+                return max(
+                    parsedate_to_datetime(retry_after).timestamp() - time.time(), 0
+                )
+            except (TypeError, ValueError):
+                pass
+
+    if response.status_code == 429:
+        reset = response.headers.get("Ratelimit-Reset")
+        if reset:
+            try:
+                return max(int(reset) - time.time(), 0)
+            except ValueError:
+                pass
+
+    return None
+
+
+class RetryPolicy(object):
+    """
+    Decides whether and when a failed request is retried.
+
+    Retries use exponential backoff with full jitter, so that many clients failing
+    at the same time don't retry at the same time. Delays requested by Twitch via
+    `Retry-After` or, for 429 responses, `Ratelimit-Reset` are respected. A request
+    is attempted at most `max_attempts` times and is not retried anymore once
+    `deadline` seconds have passed since the first attempt.
+    """
+
+    def __init__(
+        self,
+        max_attempts=4,
+        initial_backoff=0.5,
+        max_backoff=30.0,
+        deadline=60.0,
+        retry_statuses=DEFAULT_RETRY_STATUSES,
+        retry_exceptions=DEFAULT_RETRY_EXCEPTIONS,
+        retry_methods=("GET",),
+    ):
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retry_statuses = retry_statuses
+        self.retry_exceptions = retry_exceptions
+        self.retry_methods = retry_methods
+
+    def start(self, method="GET"):
+        """Return a `RetryState` tracking the attempts of a single request."""
+        return RetryState(self, method)
+
+    def call(self, method, send):
+        """
+        Call `send` until it returns a response that shouldn't be retried.
+
+        Exceptions raised by `send` that shouldn't be retried are re-raised.
+        Responses that are retried are closed, so that streamed responses give
+        their connection back to the pool before the next attempt.
+        """
+        state = self.start(method)
+        while True:
+            try:
+                response = send()
+            except Exception as e:
+                delay = state.next_delay(exception=e)
+                if delay is None:
+                    raise
+            else:
+                delay = state.next_delay(response=response)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+
+
+class RetryState(object):
+    def __init__(self, policy, method):
+        self._policy = policy
+        self._method = method.upper()
+        self._attempts = 0
+        self._started = time.monotonic()
+
+    @property
+    def attempts(self):
+        return self._attempts
+
+    def _get_backoff(self):
+        policy = self._policy
+        backoff = policy.initial_backoff * 2 ** (self._attempts - 1)
+        return random.uniform(0, min(backoff, policy.max_backoff))
+
+    def next_delay(self, response=None, exception=None):
+        """
+        Record a finished attempt and return the number of seconds to wait before
+        the next one, or None if the request shouldn't be retried.
+        """
+        policy = self._policy
+        self._attempts += 1
+
+        if self._method not in policy.retry_methods:
+            return None
+        if exception is not None and not isinstance(exception, policy.retry_exceptions):
+            return None
+        if response is not None and response.status_code not in policy.retry_statuses:
+            return None
+        if self._attempts >= policy.max_attempts:
+            return None
+
+        delay = self._get_backoff()
+        if response is not None:
+            hinted_delay = _get_hinted_delay(response)
+            if hinted_delay is not None:
+                # Spread out the retries of everyone who got the same hint
+                delay = hinted_delay + random.uniform(0, policy.initial_backoff)
+
+        elapsed = time.monotonic() - self._started
+        if policy.deadline is not None and elapsed + delay > policy.deadline:
+            return None
+
+        logger.debug(
+            "Retrying request in %.2fs after attempt %s failed", delay, self._attempts
+        )
+        return delay
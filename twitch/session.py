@@ -0,0 +1,87 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from twitch.exceptions import TwitchException
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def create_session(
+    pool_connections=DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize=DEFAULT_POOL_MAXSIZE,
+    pool_block=False,
+    keep_alive=True,
+):
+    """
+    Create a `requests.Session` with a keep-alive connection pool.
+
+    `pool_connections` is the number of per-host pools that are kept around and
+    `pool_maxsize` is the maximum number of connections kept open to a single
+    host. If `pool_block` is set, requests wait for a free connection instead of
+    opening an extra one when the per-host limit is reached.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+def iter_response(response, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield the body of a response requested with `stream=True` in chunks of up to
+    `chunk_size` bytes and close the response once it's consumed.
+    """
+    try:
+        for chunk in response.iter_content(chunk_size):
+            yield chunk
+    finally:
+        response.close()
+
+
+def read_response_into(response, output, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Copy the body of a response requested with `stream=True` into `output` and
+    return the number of bytes copied, without holding the whole body in memory.
+
+    `output` is either a writable file, or a writable buffer such as a `bytearray`
+    which the body is read straight into with `readinto`. A `TwitchException` is
+    raised if the body doesn't fit into the buffer.
+    """
+    if hasattr(output, "write"):
+        size = 0
+        for chunk in iter_response(response, chunk_size):
+            output.write(chunk)
+            size += len(chunk)
+        return size
+
+    buffer = memoryview(output).cast("B")
+    raw = response.raw
+    # Like `iter_content`, undo gzip and deflate transfer encodings
+    raw.decode_content = True
+    size = 0
+    try:
+        while size < len(buffer):
+            read = raw.readinto(buffer[size:])
+            if not read:
+                return size
+            size += read
+        if raw.read(1):
+            raise TwitchException(
+                "Response body is larger than the buffer of {} bytes".format(
+                    len(buffer)
+                )
+            )
+        return size
+    finally:
+        response.close()
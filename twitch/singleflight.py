@@ -0,0 +1,77 @@
+import asyncio
+import threading
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Lets concurrent calls with the same key share a single call.
+
+    While a call for a key is in flight, other threads calling `do` with the same
+    key wait for it to finish and receive its result, or its exception, instead
+    of making the call themselves. With `copy_result`, e.g. `copy.deepcopy`, every
+    waiting caller receives its own copy of the result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.shared = 0
+
+    def do(self, key, fn, copy_result=None):
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            if copy_result is not None:
+                return copy_result(call.result)
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight(object):
+    """asyncio counterpart of `SingleFlight`, sharing coroutine calls within a loop."""
+
+    def __init__(self):
+        self._calls = {}
+        self.shared = 0
+
+    async def do(self, key, fn, copy_result=None):
+        future = self._calls.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.shared += 1
+        # Shield the shared call, so that a cancelled caller doesn't cancel it for
+        # everyone else
+        result = await asyncio.shield(future)
+        if not is_leader and copy_result is not None:
+            return copy_result(result)
+        return result